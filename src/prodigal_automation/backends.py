@@ -0,0 +1,160 @@
+# src/prodigal_automation/backends.py
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Iterator, Optional
+
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+
+# ContentGenerator only relies on the subset of google.generativeai's
+# GenerativeModel interface implemented below, so any object providing
+# `generate_content(prompt, stream=False, generation_config=None)` and the
+# matching `generate_content_async` can be passed as its backend.
+
+_MAX_CHARS_RE = re.compile(r"max (\d+) characters")
+_TOPIC_RE = re.compile(r"about (.+?)(?: with max|\. )")
+_THREAD_RE = re.compile(r"thread of exactly (\d+) tweets")
+_REMAINING_RE = re.compile(r"remaining (\d+) tweets")
+_WORDS = (
+    "insights",
+    "teams",
+    "growth",
+    "ideas",
+    "future",
+    "learning",
+    "community",
+    "results",
+    "tools",
+    "stories",
+)
+
+
+class LocalResponse:
+    """Minimal stand-in for a Gemini GenerateContentResponse"""
+
+    def __init__(self, text: str, prompt: str):
+        self.text = text
+        self.usage_metadata = SimpleNamespace(
+            prompt_token_count=len(prompt) // 4,
+            candidates_token_count=len(text) // 4,
+        )
+
+
+class LocalBackend:
+    """
+    Deterministic offline generation backend for load and performance tests.
+    The same prompt always yields the same text; latency and failures are
+    drawn from seeded distributions.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_sigma: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        chunk_size: int = 40,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            latency: Median simulated latency per call in seconds
+            latency_sigma: Log-normal shape of the latency distribution
+                (0 gives a fixed latency; ~1 gives a heavy tail)
+            failure_rate: Probability a call fails with ServiceUnavailable
+            rate_limit_rate: Probability a call fails with ResourceExhausted (429)
+            chunk_size: Characters per chunk when streaming
+            seed: Seed for the latency and failure distributions
+        """
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.chunk_size = chunk_size
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def _draw(self) -> float:
+        """Count the call, draw its latency and raise any simulated failure"""
+        with self._lock:
+            self.calls += 1
+            delay = 0.0
+            if self.latency > 0:
+                delay = self.latency
+                if self.latency_sigma > 0:
+                    delay = self._rng.lognormvariate(
+                        math.log(self.latency), self.latency_sigma
+                    )
+            roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            raise ResourceExhausted("Simulated rate limit (local backend)")
+        if roll < self.rate_limit_rate + self.failure_rate:
+            raise ServiceUnavailable("Simulated failure (local backend)")
+        return delay
+
+    @staticmethod
+    def render(prompt: str, generation_config: Optional[dict] = None) -> str:
+        """Deterministic text for a prompt, sized to the requested maximum"""
+        digest = hashlib.sha256(prompt.encode()).digest()
+        topic_match = _TOPIC_RE.search(prompt)
+        topic = topic_match.group(1) if topic_match else "this topic"
+        hashtag = "#" + "".join(w.capitalize() for w in topic.split()[:3])
+
+        if (generation_config or {}).get("response_mime_type") == "application/json":
+            return json.dumps(
+                {
+                    "tweet": f"Quick take on {topic}. {hashtag}",
+                    "facebook": f"Here is a longer look at {topic}. {hashtag}",
+                    "linkedin": f"Professional notes on {topic}. {hashtag}",
+                }
+            )
+
+        thread_match = _THREAD_RE.search(prompt)
+        if thread_match:
+            remaining_match = _REMAINING_RE.search(prompt)
+            parts = int((remaining_match or thread_match).group(1))
+            tweets = [
+                f"Part {i + 1} on {topic}: "
+                f"{_WORDS[digest[i % len(digest)] % len(_WORDS)]}. {hashtag}"
+                for i in range(parts)
+            ]
+            return "\n---\n".join(tweets)
+
+        limits = [int(n) for n in _MAX_CHARS_RE.findall(prompt)]
+        budget = max(min(limits) if limits else 280, 40)
+        words = [f"Thoughts on {topic}:"]
+        for byte in digest:
+            words.append(_WORDS[byte % len(_WORDS)])
+        text = " ".join(words)
+        suffix = f". {hashtag}"
+        return text[: max(budget - len(suffix), 0) // 2].rstrip() + suffix
+
+    def _chunks(self, text: str, prompt: str) -> Iterator[LocalResponse]:
+        for start in range(0, len(text), self.chunk_size):
+            end = start + self.chunk_size
+            yield LocalResponse(text[start:end], prompt)
+
+    def generate_content(self, prompt: str, stream: bool = False, **kwargs):
+        delay = self._draw()
+        if delay:
+            time.sleep(delay)
+        text = self.render(prompt, kwargs.get("generation_config"))
+        if stream:
+            return self._chunks(text, prompt)
+        return LocalResponse(text, prompt)
+
+    async def generate_content_async(self, prompt: str, **kwargs):
+        delay = self._draw()
+        if delay:
+            await asyncio.sleep(delay)
+        return LocalResponse(
+            self.render(prompt, kwargs.get("generation_config")), prompt
+        )
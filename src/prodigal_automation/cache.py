@@ -0,0 +1,241 @@
+# src/prodigal_automation/cache.py
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# (value, expires_at, ttl) of a cached entry
+_Entry = Tuple[Any, Optional[float], Optional[float]]
+
+
+class LRUTTLCache:
+    """Thread-safe in-memory LRU cache with per-entry TTL expiry"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 600.0,
+        sliding: bool = False,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of entries kept before LRU eviction
+            ttl: Seconds an entry stays valid (None disables expiry)
+            sliding: Restart an entry's TTL on every hit, so it expires
+                `ttl` seconds after it was last used rather than stored
+            on_evict: Optional callback invoked with (key, value) for entries
+                dropped by LRU eviction, expiry or replacement (values
+                returned by pop are the caller's), e.g. to release resources
+                held by cached values
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.sliding = sliding
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evicted(self, entries: List[Tuple[Hashable, Any]]) -> None:
+        # Called outside the lock so callbacks may use the cache
+        if self.on_evict is not None:
+            for key, value in entries:
+                self.on_evict(key, value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if missing/expired."""
+        expired = []
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, ttl = entry
+                now = time.monotonic()
+                if expires_at is None or expires_at > now:
+                    if self.sliding and ttl is not None:
+                        self._data[key] = (value, now + ttl, ttl)
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                expired.append((key, value))
+            self.misses += 1
+        self._evicted(expired)
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key`, evicting the least recently used entry."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        evicted = []
+        with self._lock:
+            previous = self._data.get(key)
+            if previous is not None and previous[0] is not value:
+                evicted.append((key, previous[0]))
+            self._data[key] = (value, expires_at, ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                old_key, (old_value, _, _) = self._data.popitem(last=False)
+                evicted.append((old_key, old_value))
+        self._evicted(evicted)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value (expired entries count as missing)."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None:
+            return default
+        value, expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._evicted([(key, value)])
+            return default
+        return value
+
+    def keys(self) -> List[Hashable]:
+        """Snapshot of the cached keys (expired entries included)"""
+        with self._lock:
+            return list(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (
+                entry[1] is None or entry[1] > time.monotonic()
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class GenerationCache:
+    """
+    Two-tier cache for generated content: an in-memory LRU tier and an
+    optional on-disk SQLite tier, both with TTL expiry.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 600.0,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of entries in the in-memory tier
+            ttl: Seconds a generated text stays valid (None disables expiry)
+            path: Optional SQLite database file for the persistent tier
+        """
+        self.ttl = ttl
+        self.memory = LRUTTLCache(maxsize=maxsize, ttl=ttl)
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._db:
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS generation_cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+
+    @staticmethod
+    def make_key(
+        platform: str,
+        topic: str,
+        style: Optional[str],
+        length: int,
+        model: str,
+    ) -> Tuple[str, str, str, int, str]:
+        """Build a normalized cache key for a generation request."""
+        return (
+            platform.strip().lower(),
+            " ".join(topic.split()).lower(),
+            (style or "").strip().lower(),
+            int(length),
+            model,
+        )
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """Look `key` up in memory first, then on disk (promoting disk hits)."""
+        value = self.memory.get(key)
+        if value is not None or self._db is None:
+            return value
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM generation_cache WHERE key = ?",
+                (json.dumps(key),),
+            ).fetchone()
+            if row is not None and row[1] is not None and row[1] <= time.time():
+                with self._db:
+                    self._db.execute(
+                        "DELETE FROM generation_cache WHERE key = ?",
+                        (json.dumps(key),),
+                    )
+                row = None
+            if row is None:
+                self.disk_misses += 1
+                return None
+            self.disk_hits += 1
+
+        remaining = None if row[1] is None else max(row[1] - time.time(), 0.0)
+        self.memory.set(key, row[0], ttl=remaining)
+        return row[0]
+
+    def set(self, key: Tuple, value: str) -> None:
+        """Store `value` in both tiers."""
+        self.memory.set(key, value)
+        if self._db is None:
+            return
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO generation_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (json.dumps(key), value, expires_at),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from the SQLite tier. Returns rows removed."""
+        if self._db is None:
+            return 0
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                "DELETE FROM generation_cache "
+                "WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self._db is not None:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM generation_cache")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for both tiers."""
+        return {
+            "memory_hits": self.memory.hits,
+            "memory_misses": self.memory.misses,
+            "disk_hits": self.disk_hits,
+            "disk_misses": self.disk_misses,
+            "memory_size": len(self.memory),
+        }
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -1,17 +1,150 @@
 # src/prodigal_automation/client.py
-from typing import Dict, Optional
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import facebook
-from tweepy import Client
+from tweepy import API, Client, OAuth1UserHandler
+from tweepy.errors import HTTPException, TooManyRequests
 
 from .auth import FacebookAuth, TwitterAuth
+from .insights import (
+    MAX_INSIGHTS_WINDOW_DAYS,
+    InsightsSeries,
+    insights_windows,
+    next_page,
+)
+from .rate_limit import TwitterRateLimited, TwitterRateLimitTracker, twitter_endpoint
+
+
+class _RateLimitedRequests:
+    """Rate limit bookkeeping shared by the sync and async tweepy clients"""
+
+    def _init_rate_limits(
+        self, tenant_id: str, rate_limits: Optional[TwitterRateLimitTracker]
+    ) -> None:
+        self.wait_on_rate_limit = False
+        self.tenant_id = tenant_id
+        self.rate_limits = rate_limits or TwitterRateLimitTracker()
+
+    def _reserve(self, method: str, route: str) -> str:
+        """Reserve a request slot or raise TwitterRateLimited"""
+        endpoint = twitter_endpoint(method, route)
+        wait = self.rate_limits.reserve(self.tenant_id, endpoint)
+        if wait > 0:
+            raise TwitterRateLimited(self.tenant_id, endpoint, wait)
+        return endpoint
+
+    def _failed(self, endpoint: str, error: HTTPException) -> Exception:
+        """Record a failed request and return the exception to raise"""
+        headers = error.response.headers
+        if isinstance(error, TooManyRequests):
+            reset_time = getattr(error, "reset_time", None) or headers.get(
+                "x-rate-limit-reset"
+            )
+            wait = self.rate_limits.rate_limited(self.tenant_id, endpoint, reset_time)
+            return TwitterRateLimited(self.tenant_id, endpoint, wait)
+        self.rate_limits.update(self.tenant_id, endpoint, headers)
+        return error
+
+
+class RateLimitedClient(_RateLimitedRequests, Client):
+    """
+    tweepy Client that checks a TwitterRateLimitTracker before every request
+    and raises TwitterRateLimited instead of sleeping when it must wait
+    """
+
+    def __init__(
+        self,
+        *args,
+        tenant_id: str = "default",
+        rate_limits: Optional[TwitterRateLimitTracker] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._init_rate_limits(tenant_id, rate_limits)
+
+    def request(self, method, route, params=None, json=None, user_auth=False):
+        endpoint = self._reserve(method, route)
+        try:
+            response = super().request(method, route, params, json, user_auth)
+        except HTTPException as e:
+            error = self._failed(endpoint, e)
+            if error is e:
+                raise
+            raise error from e
+        self.rate_limits.update(self.tenant_id, endpoint, response.headers)
+        return response
+
+
+@functools.lru_cache(maxsize=None)
+def _async_client_class():
+    """
+    Build the async client class on first use, since tweepy.asynchronous
+    requires the optional aiohttp dependency
+    """
+    import aiohttp
+    from tweepy.asynchronous import AsyncClient
+
+    class AsyncRateLimitedClient(_RateLimitedRequests, AsyncClient):
+        """
+        tweepy AsyncClient with rate limit tracking that keeps one aiohttp
+        session (and its connection pool) open instead of one per request
+        """
+
+        def __init__(
+            self,
+            *args,
+            tenant_id: str = "default",
+            rate_limits: Optional[TwitterRateLimitTracker] = None,
+            **kwargs,
+        ):
+            super().__init__(*args, **kwargs)
+            self._init_rate_limits(tenant_id, rate_limits)
+
+        async def request(self, method, route, params=None, json=None, user_auth=False):
+            endpoint = self._reserve(method, route)
+            if self.session is None:
+                self.session = aiohttp.ClientSession()
+            try:
+                response = await super().request(method, route, params, json, user_auth)
+            except HTTPException as e:
+                error = self._failed(endpoint, e)
+                if error is e:
+                    raise
+                raise error from e
+            self.rate_limits.update(self.tenant_id, endpoint, response.headers)
+            return response
+
+        async def close(self) -> None:
+            if self.session is not None:
+                await self.session.close()
+                self.session = None
+
+    return AsyncRateLimitedClient
 
 
 class TwitterClient:
     """Twitter API client wrapper"""
 
-    def __init__(self, auth: TwitterAuth):
+    def __init__(
+        self,
+        auth: TwitterAuth,
+        tenant_id: str = "default",
+        rate_limits: Optional[TwitterRateLimitTracker] = None,
+    ):
+        """
+        Args:
+            auth: Twitter credentials
+            tenant_id: Tenant the client's rate limits are tracked under
+            rate_limits: Optional shared tracker; when given, the client
+                raises TwitterRateLimited instead of hitting exhausted limits
+        """
         self.auth = auth
+        self.tenant_id = tenant_id
+        self.rate_limits = rate_limits
         self.client = None
 
     def initialize(self):
@@ -19,20 +152,130 @@ class TwitterClient:
         Initialize the appropriate Twitter client based on available
         credentials.
         """
+        client_class, extra = Client, {}
+        if self.rate_limits is not None:
+            client_class = RateLimitedClient
+            extra = {"tenant_id": self.tenant_id, "rate_limits": self.rate_limits}
+
         if self.auth.has_oauth_credentials():
-            self.client = Client(
+            self.client = client_class(
                 consumer_key=self.auth.api_key,
                 consumer_secret=self.auth.api_key_secret,
                 access_token=self.auth.access_token,
                 access_token_secret=self.auth.access_token_secret,
+                **extra,
             )
         elif self.auth.has_bearer_token():
-            self.client = Client(bearer_token=self.auth.bearer_token)
+            self.client = client_class(bearer_token=self.auth.bearer_token, **extra)
         else:
             raise ValueError("No valid Twitter credentials provided")
 
         return self.client
 
+    def initialize_api(self) -> API:
+        """
+        Initialize a v1.1 tweepy API for the media upload endpoints, which
+        require OAuth 1.0a user credentials.
+        """
+        if not self.auth.has_oauth_credentials():
+            raise ValueError("Media uploads require OAuth 1.0a Twitter credentials")
+        return API(
+            OAuth1UserHandler(
+                self.auth.api_key,
+                self.auth.api_key_secret,
+                self.auth.access_token,
+                self.auth.access_token_secret,
+            )
+        )
+
+
+class AsyncTwitterClient(TwitterClient):
+    """
+    Async Twitter API client wrapper around tweepy's AsyncClient (requires
+    aiohttp). The client's HTTP session belongs to the event loop it is
+    first used on.
+    """
+
+    def initialize(self):
+        """
+        Initialize the async Twitter client based on available credentials.
+        """
+        client_class = _async_client_class()
+        extra = {"tenant_id": self.tenant_id, "rate_limits": self.rate_limits}
+        if self.auth.has_oauth_credentials():
+            self.client = client_class(
+                consumer_key=self.auth.api_key,
+                consumer_secret=self.auth.api_key_secret,
+                access_token=self.auth.access_token,
+                access_token_secret=self.auth.access_token_secret,
+                **extra,
+            )
+        elif self.auth.has_bearer_token():
+            self.client = client_class(bearer_token=self.auth.bearer_token, **extra)
+        else:
+            raise ValueError("No valid Twitter credentials provided")
+
+        return self.client
+
+
+# Maximum number of operations the Graph API accepts in one batch request
+MAX_BATCH_OPERATIONS = 50
+# Maximum number of ids the Graph API accepts in one ?ids= multi-object read
+MAX_MULTI_IDS = 50
+
+
+def batch_put(parent_object: str, connection_name: str, **data) -> Dict:
+    """Batch operation equivalent to FacebookClient.put_object"""
+    return {
+        "method": "POST",
+        "relative_url": f"{parent_object}/{connection_name}",
+        "body": urlencode(data),
+    }
+
+
+def batch_delete(object_id: str) -> Dict:
+    """Batch operation equivalent to FacebookClient.delete_object"""
+    return {"method": "DELETE", "relative_url": object_id}
+
+
+def batch_insights(
+    object_id: str,
+    metrics: list[str],
+    period: Optional[str] = None,
+    since: Optional[int] = None,
+    until: Optional[int] = None,
+) -> Dict:
+    """Batch operation reading insights of a page or post"""
+    params = {"metric": ",".join(metrics)}
+    if period:
+        params["period"] = period
+    if since:
+        params["since"] = since
+    if until:
+        params["until"] = until
+    return {
+        "method": "GET",
+        "relative_url": f"{object_id}/insights?{urlencode(params)}",
+    }
+
+
+def _batch_result(item: Optional[Dict]) -> Dict:
+    """Turn one entry of a batch response into a result or error dict"""
+    if item is None:
+        # The Graph API returns null for operations it did not get to
+        return {"error": "Batch operation was not processed"}
+    try:
+        body = json.loads(item.get("body") or "{}")
+    except ValueError:
+        body = {"body": item.get("body")}
+    if isinstance(body, dict) and "error" in body:
+        error = body["error"]
+        message = error.get("message") if isinstance(error, dict) else error
+        return {"error": str(message), "code": item.get("code")}
+    if item.get("code") != 200:
+        return {"error": f"HTTP {item.get('code')}", "code": item.get("code")}
+    return body if isinstance(body, dict) else {"data": body}
+
 
 class FacebookClient:
     """Facebook API client wrapper"""
@@ -129,6 +372,98 @@ class FacebookClient:
             print(f"An unexpected error occurred fetching insights: {e}")
             return {"error": str(e)}
 
+    def _insights_window(self, page_id: str, params: Dict) -> list[Dict]:
+        """Fetch one since/until window, following paging inside it"""
+        entries: list[Dict] = []
+        response = self.client.get_connections(page_id, "insights", **params)
+        while True:
+            entries.extend(response.get("data", []))
+            paging = response.get("paging") or {}
+            if not paging.get("next"):
+                return entries
+            path, args = next_page(paging)
+            # Insights paging walks on in time; stop at the window's end
+            if int(args.get("since", params["until"])) >= params["until"]:
+                return entries
+            response = self.client.request(path, args)
+
+    def get_page_insights_entries(
+        self,
+        page_id: str,
+        metrics: list[str],
+        since: int,
+        until: int,
+        period: str = "day",
+        window_days: int = MAX_INSIGHTS_WINDOW_DAYS,
+        max_workers: int = 4,
+    ) -> Tuple[list[Dict], list[str]]:
+        """
+        Fetches raw page insights over an arbitrarily long range by splitting
+        it into windows the API accepts and fetching them concurrently.
+        Args:
+            page_id: The ID of the Facebook Page.
+            metrics: A list of insight metrics to fetch.
+            since: Start UNIX timestamp of the range.
+            until: End UNIX timestamp of the range.
+            period: The aggregation period (e.g., 'day', 'week', 'days_28').
+            window_days: Days per request (at most 90).
+            max_workers: Windows fetched in parallel.
+        Returns:
+            The insights `data` entries of all windows, and an error message
+            per window that failed.
+        """
+        self._check_initialized()
+        window_days = min(window_days, MAX_INSIGHTS_WINDOW_DAYS)
+        windows = insights_windows(since, until, window_days)
+
+        def fetch(window):
+            params = {
+                "metric": ",".join(metrics),
+                "period": period,
+                "since": window[0],
+                "until": window[1],
+                "access_token": self.auth.access_token,
+            }
+            try:
+                return self._insights_window(page_id, params), None
+            except Exception as e:
+                print(f"Facebook Graph API Error fetching insights: {e}")
+                return [], f"{window[0]}-{window[1]}: {e}"
+
+        entries: list[Dict] = []
+        errors: list[str] = []
+        workers = max(1, min(max_workers, len(windows)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for window_entries, error in executor.map(fetch, windows):
+                entries.extend(window_entries)
+                if error is not None:
+                    errors.append(error)
+        return entries, errors
+
+    def get_page_insights_range(
+        self,
+        page_id: str,
+        metrics: list[str],
+        since: int,
+        until: int,
+        period: str = "day",
+        window_days: int = MAX_INSIGHTS_WINDOW_DAYS,
+        max_workers: int = 4,
+    ) -> InsightsSeries:
+        """
+        Like get_page_insights_entries, but merged into a columnar series.
+        Returns:
+            InsightsSeries with per-metric timestamp and value arrays; windows
+            that failed are listed in its `errors`.
+        """
+        entries, errors = self.get_page_insights_entries(
+            page_id, metrics, since, until, period, window_days, max_workers
+        )
+        series = InsightsSeries(period)
+        series.add(entries)
+        series.errors.extend(errors)
+        return series
+
     def get_post_insights(self, post_id: str, metrics: list[str]) -> Dict:
         """
         Fetches insights for a specific Facebook Post.
@@ -155,6 +490,46 @@ class FacebookClient:
             print(f"An unexpected error occurred fetching post insights: {e}")
             return {"error": str(e)}
 
+    def get_posts_insights(
+        self, post_ids: list[str], metrics: list[str]
+    ) -> Dict[str, Dict]:
+        """
+        Fetches insights for many Facebook Posts with multi-id reads
+        (50 posts per request).
+        Args:
+            post_ids: The IDs of the Facebook Posts.
+            metrics: A list of insight metrics to fetch (e.g., ['post_impressions_unique']). # noqa
+        Returns:
+            Mapping of post ID to its insight data, or to a dictionary with an
+            "error" key if it could not be fetched.
+        """
+        self._check_initialized()
+        fields = f"insights.metric({','.join(metrics)})"
+        unique = list(dict.fromkeys(post_ids))
+        results: Dict[str, Dict] = {}
+        for start in range(0, len(unique), MAX_MULTI_IDS):
+            end = start + MAX_MULTI_IDS
+            chunk = unique[start:end]
+            try:
+                response = self.client.get_objects(
+                    ids=chunk, fields=fields, access_token=self.auth.access_token
+                )
+            except facebook.GraphAPIError as e:
+                print(f"Facebook Graph API Error fetching post insights: {e}")
+                results.update({post_id: {"error": str(e)} for post_id in chunk})
+                continue
+            except Exception as e:
+                print(f"An unexpected error occurred fetching post insights: {e}")
+                results.update({post_id: {"error": str(e)} for post_id in chunk})
+                continue
+            for post_id in chunk:
+                post = response.get(post_id)
+                if post is None:
+                    results[post_id] = {"error": f"Post {post_id} was not returned"}
+                else:
+                    results[post_id] = post.get("insights", {"data": []})
+        return results
+
     def delete_object(self, object_id: str) -> Dict:
         """
         Deletes a Facebook object (e.g., post, photo).
@@ -187,3 +562,39 @@ class FacebookClient:
         except Exception as e:
             print(f"An unexpected error occurred deleting object: {e}")
             return {"success": False, "error": str(e)}
+
+    def batch(self, operations: List[Dict]) -> List[Dict]:
+        """
+        Run many operations in as few Graph API batch requests as possible
+        (50 operations per HTTP call).
+        Args:
+            operations: Operations built with batch_put, batch_delete and
+                batch_insights
+        Returns:
+            One result per operation, in order; failed operations give a
+            dictionary with an "error" key
+        """
+        self._check_initialized()
+        results: List[Dict] = []
+        for start in range(0, len(operations), MAX_BATCH_OPERATIONS):
+            end = start + MAX_BATCH_OPERATIONS
+            chunk = operations[start:end]
+            try:
+                response = self.client.request(
+                    f"{self.client.version}/",
+                    post_args={
+                        "batch": json.dumps(chunk),
+                        "include_headers": "false",
+                        "access_token": self.auth.access_token,
+                    },
+                )
+            except facebook.GraphAPIError as e:
+                print(f"Facebook Graph API Error running batch: {e}")
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+            except Exception as e:
+                print(f"An unexpected error occurred running batch: {e}")
+                results.extend({"error": str(e)} for _ in chunk)
+                continue
+            results.extend(_batch_result(item) for item in response)
+        return results
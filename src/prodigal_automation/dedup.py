@@ -0,0 +1,218 @@
+# src/prodigal_automation/dedup.py
+
+import hashlib
+import json
+import re
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"[#@]?\w+")
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+
+
+def _shingles(text: str, size: int) -> Set[bytes]:
+    """Word n-gram shingles of normalized text (URLs and case ignored)."""
+    words = _WORD_RE.findall(_URL_RE.sub(" ", text).lower())
+    if len(words) < size:
+        return {" ".join(words).encode()}
+    return {" ".join(gram).encode() for gram in zip(*(words[i:] for i in range(size)))}
+
+
+class _TenantEntries:
+    """Bounded LSH index for a single tenant"""
+
+    def __init__(self):
+        self.entries: "OrderedDict[str, Tuple[List[int], float]]" = OrderedDict()
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index answering "is this nearly identical to something we
+    posted recently for this tenant?". Each tenant keeps at most
+    `max_entries` signatures (oldest evicted first), optionally expiring
+    after `max_age` seconds.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 2,
+        max_entries: int = 1000,
+        max_age: Optional[float] = None,
+        seed: int = 1,
+    ):
+        """
+        Args:
+            threshold: Estimated Jaccard similarity at or above which two
+                texts are considered near-duplicates
+            num_perm: Number of MinHash permutations (signature length)
+            bands: Number of LSH bands; must divide num_perm
+            shingle_size: Words per shingle
+            max_entries: Maximum signatures kept per tenant
+            max_age: Optional seconds after which entries are ignored/evicted
+            seed: Seed for the hash functions (fixed so saved indexes
+                stay comparable across processes)
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.seed = seed
+        self._salt = seed.to_bytes(8, "little")
+        self._tenants: Dict[str, _TenantEntries] = {}
+        self._lock = threading.Lock()
+
+    def signature(self, text: str) -> List[int]:
+        """MinHash signature of `text`."""
+        # One keyed SHAKE digest per shingle yields `num_perm` independent
+        # 32-bit hashes; the column-wise minimum is the MinHash signature.
+        # Both steps run in C, which keeps lookups well under a millisecond.
+        size = 4 * self.num_perm
+        hashes = [
+            array("I", hashlib.shake_128(self._salt + s).digest(size))
+            for s in _shingles(text, self.shingle_size)
+        ]
+        return list(map(min, zip(*hashes)))
+
+    def similarity(self, signature: List[int], other: List[int]) -> float:
+        """Estimated Jaccard similarity of two MinHash signatures"""
+        matches = sum(1 for x, y in zip(signature, other) if x == y)
+        return matches / self.num_perm
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            start, end = band * self.rows, (band + 1) * self.rows
+            yield band, tuple(signature[start:end])
+
+    def _evict(self, tenant: _TenantEntries, entry_id: str) -> None:
+        signature, _ = tenant.entries.pop(entry_id)
+        for band_key in self._band_keys(signature):
+            bucket = tenant.buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del tenant.buckets[band_key]
+
+    def _expire(self, tenant: _TenantEntries) -> None:
+        if self.max_age is None:
+            return
+        cutoff = time.time() - self.max_age
+        while tenant.entries:
+            oldest_id, (_, added_at) = next(iter(tenant.entries.items()))
+            if added_at > cutoff:
+                break
+            self._evict(tenant, oldest_id)
+
+    def _insert(
+        self,
+        tenant_id: str,
+        entry_id: str,
+        signature: List[int],
+        added_at: float,
+    ) -> None:
+        tenant = self._tenants.setdefault(tenant_id, _TenantEntries())
+        if entry_id in tenant.entries:
+            self._evict(tenant, entry_id)
+        tenant.entries[entry_id] = (signature, added_at)
+        for band_key in self._band_keys(signature):
+            tenant.buckets.setdefault(band_key, set()).add(entry_id)
+        while len(tenant.entries) > self.max_entries:
+            self._evict(tenant, next(iter(tenant.entries)))
+
+    def add(self, tenant_id: str, text: str, entry_id: Optional[str] = None) -> str:
+        """
+        Record posted content for a tenant
+        Args:
+            tenant_id: Tenant the content was posted for
+            text: Posted content
+            entry_id: Optional identifier (e.g. the tweet or post ID)
+        Returns:
+            The identifier the entry was stored under
+        """
+        signature = self.signature(text)
+        if entry_id is None:
+            entry_id = hashlib.sha1(text.encode()).hexdigest()
+        with self._lock:
+            self._insert(tenant_id, entry_id, signature, time.time())
+        return entry_id
+
+    def find_similar(self, tenant_id: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar recent entry for a tenant
+        Args:
+            tenant_id: Tenant to search
+            text: Candidate content
+        Returns:
+            (entry_id, estimated similarity) of the closest entry at or above
+            the threshold, or None
+        """
+        signature = self.signature(text)
+        with self._lock:
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                return None
+            self._expire(tenant)
+            candidates: Set[str] = set()
+            for band_key in self._band_keys(signature):
+                candidates.update(tenant.buckets.get(band_key, ()))
+            best = None
+            for entry_id in candidates:
+                other, _ = tenant.entries[entry_id]
+                similarity = self.similarity(signature, other)
+                if similarity >= self.threshold and (
+                    best is None or similarity > best[1]
+                ):
+                    best = (entry_id, similarity)
+            return best
+
+    def is_duplicate(self, tenant_id: str, text: str) -> bool:
+        return self.find_similar(tenant_id, text) is not None
+
+    def forget_tenant(self, tenant_id: str) -> None:
+        with self._lock:
+            self._tenants.pop(tenant_id, None)
+
+    def save(self, path: str) -> None:
+        """Persist the index (parameters and signatures) as JSON."""
+        with self._lock:
+            data = {
+                "threshold": self.threshold,
+                "num_perm": self.num_perm,
+                "bands": self.bands,
+                "shingle_size": self.shingle_size,
+                "max_entries": self.max_entries,
+                "max_age": self.max_age,
+                "seed": self.seed,
+                "tenants": {
+                    tenant_id: [
+                        [entry_id, signature, added_at]
+                        for entry_id, (signature, added_at) in tenant.entries.items()
+                    ]
+                    for tenant_id, tenant in self._tenants.items()
+                },
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str) -> "NearDuplicateIndex":
+        """Load an index written by save()."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        tenants = data.pop("tenants")
+        index = cls(**data)
+        for tenant_id, entries in tenants.items():
+            for entry_id, signature, added_at in entries:
+                index._insert(tenant_id, entry_id, signature, added_at)
+        return index
@@ -3,7 +3,8 @@
 # !/usr/bin/env python3
 import os
 
-from prodigal_automation.tools.manager import call_tool
+import prodigal_automation.tool_modules.twitter  # noqa: F401 (registers tools)
+from prodigal_automation.tool_modules.manager import call_tool
 from prodigal_automation.twitter_manager import register_twitter_credentials
 
 
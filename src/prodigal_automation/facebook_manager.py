@@ -3,8 +3,12 @@
 import datetime
 from typing import Dict, Optional, Union
 
-from prodigal_automation.client import FacebookClient
-from prodigal_automation.tools import ContentGenerator
+from prodigal_automation.client import FacebookClient, batch_delete, batch_put
+from prodigal_automation.dedup import NearDuplicateIndex
+from prodigal_automation.facebook_media import ResumableVideoUploader
+from prodigal_automation.insights import InsightsSeries, InsightsStore
+from prodigal_automation.pregeneration import PreGenerationQueue
+from prodigal_automation.tools import ContentGenerator, ContentRequest, fit_for_platform
 
 
 class FacebookManager:
@@ -14,6 +18,11 @@ class FacebookManager:
         self,
         facebook_client_or_auth,
         content_generator_or_api_key=None,
+        duplicate_index: Optional[NearDuplicateIndex] = None,
+        tenant_id: str = "default",
+        pregeneration_queue: Optional[PreGenerationQueue] = None,
+        insights_store: Optional[InsightsStore] = None,
+        video_uploader: Optional[ResumableVideoUploader] = None,
     ):
         """
         Initialize FacebookManager with flexible constructor to support both
@@ -23,7 +32,24 @@ class FacebookManager:
                 or FacebookAuth instance
             content_generator_or_api_key: Either a ContentGenerator instance
                 (for tests) or API key string
+            duplicate_index: Optional NearDuplicateIndex used to reject
+                near-duplicates of recent posts before posting
+            tenant_id: Tenant the posts are recorded under in the index
+            pregeneration_queue: Optional PreGenerationQueue whose ready
+                content is used by create_post instead of generating live
+            insights_store: Optional InsightsStore; get_page_metrics then only
+                fetches ranges not already stored (and the recent, still
+                changing days)
+            video_uploader: Optional ResumableVideoUploader used by post_video
+                for local files (one without persisted state is created
+                on demand)
         """
+        self.duplicate_index = duplicate_index
+        self.tenant_id = tenant_id
+        self.pregeneration_queue = pregeneration_queue
+        self.insights_store = insights_store
+        self.video_uploader = video_uploader
+
         # Ensure 'facebook' is imported only when it's definitely needed
         # (i.e., when initializing the client in production).
         # However, the FacebookClient itself handles the 'facebook' import,
@@ -46,7 +72,10 @@ class FacebookManager:
             self.auth_data = (
                 facebook_client_or_auth  # Store auth for later use if needed
             )
-            self.client = FacebookClient(facebook_client_or_auth).initialize()
+            # Keep the FacebookClient wrapper (not the raw GraphAPI it
+            # initializes) so wrapper methods like batch and insights work
+            self.client = FacebookClient(facebook_client_or_auth)
+            self.client.initialize()
             self.content_generator = ContentGenerator(content_generator_or_api_key)
             self.page_id = (
                 facebook_client_or_auth.page_id
@@ -55,7 +84,10 @@ class FacebookManager:
             )
 
     def create_post(
-        self, topic: str, scheduled_publish_time: Optional[int] = None
+        self,
+        topic: str,
+        scheduled_publish_time: Optional[int] = None,
+        content: Optional[str] = None,
     ) -> Union[Dict, str]:
         """
         Create and post content to Facebook with validation.
@@ -63,12 +95,40 @@ class FacebookManager:
             topic: Topic for the Facebook post.
             scheduled_publish_time: Optional UNIX timestamp for scheduling.
             If provided, the post will be scheduled, not published immediately.
+            content: Optional pre-generated text (e.g. from
+            ContentGenerator.generate_variants); skips generation.
         Returns:
             Dictionary with success status and response data.
         """
 
         try:
-            content = self.content_generator.generate_simple_content(topic)
+            if content is not None:
+                content = fit_for_platform(content, "facebook")
+            else:
+                if (
+                    self.pregeneration_queue is not None
+                    and scheduled_publish_time is not None
+                ):
+                    content = self.pregeneration_queue.take(
+                        topic, scheduled_publish_time, "facebook"
+                    )
+                if content is None:
+                    content = self.content_generator.generate_simple_content(topic)
+                content = fit_for_platform(
+                    content,
+                    "facebook",
+                    regenerate=lambda: self.content_generator.generate_post(
+                        ContentRequest(topic=topic)
+                    ),
+                )
+
+            if self.duplicate_index is not None:
+                match = self.duplicate_index.find_similar(self.tenant_id, content)
+                if match is not None:
+                    raise ValueError(
+                        f"Content is a near-duplicate of recent post {match[0]} "
+                        f"(similarity {match[1]:.2f})"
+                    )
 
             if not self.page_id:
                 # If page_id was not set during init
@@ -93,6 +153,9 @@ class FacebookManager:
             response = self.client.put_object(
                 parent_object=self.page_id, connection_name="feed", **params
             )
+            if response and "id" in response and self.duplicate_index is not None:
+                self.duplicate_index.add(self.tenant_id, content, str(response["id"]))
+
             if hasattr(response, "get") and response.get("id"):
                 return response.get("id")
 
@@ -138,6 +201,18 @@ class FacebookManager:
                     ),
                 }
 
+    def schedule_post(self, topic: str, scheduled_publish_time: int) -> None:
+        """
+        Queue a scheduled post's content for background pre-generation.
+        Call create_post with the same topic later to publish it.
+        Args:
+            topic: Topic for the Facebook post.
+            scheduled_publish_time: UNIX timestamp the post is scheduled for.
+        """
+        if self.pregeneration_queue is None:
+            raise ValueError("No pregeneration_queue configured.")
+        self.pregeneration_queue.schedule(topic, scheduled_publish_time, "facebook")
+
     def post_image(
         self,
         message: str,
@@ -201,9 +276,10 @@ class FacebookManager:
     def post_video(
         self,
         message: str,
-        video_url: str,
+        video_url: Optional[str] = None,
         published: bool = True,
         scheduled_publish_time: Optional[int] = None,
+        video_path: Optional[str] = None,
     ) -> Dict:
         """
         Posts a video to the Facebook page.
@@ -211,18 +287,23 @@ class FacebookManager:
             message: The caption for the video.
             video_url: URL of the video file (e.g., mp4, mov).
             published: Whether to publish immediately (True) or as unpublished (False).
+            video_path: Local video file to upload instead of `video_url`; it
+            is sent in chunks with a resumable upload session.
         Returns:
             Dictionary with success status and response data.
         """
         if not self.page_id:
             return {"success": False, "error": "Facebook Page ID is not set."}
+        if (video_url is None) == (video_path is None):
+            return {
+                "success": False,
+                "error": "Provide exactly one of video_url or video_path.",
+            }
 
         try:
             params = {
-                "file_url": video_url,
                 "description": message,
                 "published": published,
-                "access_token": self.client.auth.access_token,
             }
             if scheduled_publish_time:
                 params["published"] = False
@@ -233,6 +314,21 @@ class FacebookManager:
                     )
                 )
 
+            if video_path is not None:
+                if self.video_uploader is None:
+                    self.video_uploader = ResumableVideoUploader(self.client)
+                video_id = self.video_uploader.upload(
+                    self.page_id, video_path, **params
+                )
+                return {
+                    "success": True,
+                    "post_id": video_id,
+                    "content": message,
+                    "video_path": video_path,
+                }
+
+            params["file_url"] = video_url
+            params["access_token"] = self.client.auth.access_token
             response = self.client.put_object(
                 parent_object=self.page_id, connection_name="videos", **params
             )
@@ -267,13 +363,58 @@ class FacebookManager:
     ) -> Dict:
         if not self.page_id:
             return {"success": False, "error": "Facebook Page ID is not set."}
-        return self.client.get_page_insights(
+        if self.insights_store is None or not since or not until:
+            return self.client.get_page_insights(
+                self.page_id, metrics, period, since, until
+            )
+
+        store = self.insights_store
+        for gap_since, gap_until in store.missing_ranges(
             self.page_id, metrics, period, since, until
+        ):
+            entries, errors = self.client.get_page_insights_entries(
+                self.page_id, metrics, gap_since, gap_until, period
+            )
+            if errors:
+                return {"error": "; ".join(errors)}
+            store.save(self.page_id, metrics, period, entries, gap_since, gap_until)
+        return {"data": store.load(self.page_id, metrics, period, since, until)}
+
+    def get_page_metrics_range(
+        self, metrics: list[str], since: int, until: int, period: str = "day"
+    ) -> Union[InsightsSeries, Dict]:
+        """
+        Fetches page insights over a long range as a columnar InsightsSeries.
+        Args:
+            metrics: A list of insight metrics to fetch.
+            since: Start UNIX timestamp of the range.
+            until: End UNIX timestamp of the range.
+            period: The aggregation period (e.g., 'day', 'week', 'days_28').
+        Returns:
+            InsightsSeries, or an error dictionary if the page ID is not set.
+        """
+        if not self.page_id:
+            return {"success": False, "error": "Facebook Page ID is not set."}
+        return self.client.get_page_insights_range(
+            self.page_id, metrics, since, until, period
         )
 
     def get_post_metrics(self, post_id: str, metrics: list[str]) -> Dict:
         return self.client.get_post_insights(post_id, metrics)
 
+    def get_posts_metrics(
+        self, post_ids: list[str], metrics: list[str]
+    ) -> Dict[str, Dict]:
+        """
+        Fetches insights for many posts in bulk.
+        Args:
+            post_ids: The IDs of the posts.
+            metrics: A list of insight metrics to fetch.
+        Returns:
+            Mapping of post ID to its insight data (or an "error" dictionary).
+        """
+        return self.client.get_posts_insights(post_ids, metrics)
+
     def delete_post(self, post_id: str) -> Dict:
         """
         Deletes a Facebook post.
@@ -283,3 +424,92 @@ class FacebookManager:
             Dictionary indicating success or error.
         """
         return self.client.delete_object(post_id)
+
+    def publish_posts(self, messages: list[str]) -> list[Dict]:
+        """
+        Publishes many ready-made posts to the page using Graph API batch
+        requests. Near-duplicates of recent posts, or of earlier messages in
+        the same call, are rejected per item before the batch is sent.
+        Args:
+            messages: Post texts to publish.
+        Returns:
+            One dictionary per message with success status and post ID or error.
+        """
+        if not self.page_id:
+            return [
+                {"success": False, "error": "Facebook Page ID is not set."}
+                for _ in messages
+            ]
+        published: list[Optional[Dict]] = [None] * len(messages)
+        pending = []
+        signatures: Dict[int, list] = {}
+        for index, message in enumerate(messages):
+            if self.duplicate_index is None:
+                pending.append(index)
+                continue
+            dedup = self.duplicate_index
+            match = dedup.find_similar(self.tenant_id, message)
+            if match is not None:
+                published[index] = {
+                    "success": False,
+                    "error": (
+                        f"Content is a near-duplicate of recent post {match[0]} "
+                        f"(similarity {match[1]:.2f})"
+                    ),
+                }
+                continue
+            signature = dedup.signature(message)
+            earlier = None
+            for other in pending:
+                similarity = dedup.similarity(signature, signatures[other])
+                if similarity >= dedup.threshold:
+                    earlier = (other, similarity)
+                    break
+            if earlier is not None:
+                published[index] = {
+                    "success": False,
+                    "error": (
+                        f"Content is a near-duplicate of message {earlier[0]} "
+                        f"in this batch (similarity {earlier[1]:.2f})"
+                    ),
+                }
+                continue
+            signatures[index] = signature
+            pending.append(index)
+
+        results = []
+        if pending:
+            results = self.client.batch(
+                [batch_put(self.page_id, "feed", message=messages[i]) for i in pending]
+            )
+        for index, result in zip(pending, results):
+            if "id" in result:
+                if self.duplicate_index is not None:
+                    self.duplicate_index.add(
+                        self.tenant_id, messages[index], str(result["id"])
+                    )
+                published[index] = {"success": True, "post_id": result["id"]}
+            else:
+                published[index] = {
+                    "success": False,
+                    "error": result.get("error", str(result)),
+                }
+        return published
+
+    def delete_posts(self, post_ids: list[str]) -> Dict[str, Dict]:
+        """
+        Deletes many Facebook posts using Graph API batch requests.
+        Args:
+            post_ids: The IDs of the posts to delete.
+        Returns:
+            Mapping of post ID to a dictionary indicating success or error.
+        """
+        results = self.client.batch([batch_delete(post_id) for post_id in post_ids])
+        return {
+            post_id: (
+                {"success": True}
+                if result.get("success")
+                else {"success": False, "error": result.get("error", str(result))}
+            )
+            for post_id, result in zip(post_ids, results)
+        }
@@ -0,0 +1,189 @@
+# src/prodigal_automation/facebook_media.py
+
+import json
+import mmap
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import facebook
+import requests
+from pydantic import BaseModel, Field
+
+# Host the Graph API expects video uploads on
+FACEBOOK_GRAPH_VIDEO_URL = "https://graph-video.facebook.com/"
+
+
+class VideoUploadState(BaseModel):
+    """Progress of a resumable video upload session"""
+
+    path: str = Field(..., description="Absolute path of the uploaded file")
+    size: int = Field(..., description="File size in bytes")
+    mtime: float = Field(..., description="File modification time")
+    page_id: str = Field(..., description="Page the video is uploaded to")
+    video_id: str = Field(..., description="Video id returned by the start phase")
+    upload_session_id: str = Field(..., description="Upload session id")
+    start_offset: int = Field(..., description="Start of the next chunk to send")
+    end_offset: int = Field(..., description="End of the next chunk to send")
+
+
+class ResumableVideoUploader:
+    """
+    Uploads local videos to a Page with the Graph API resumable upload
+    protocol (start/transfer/finish). The file is memory-mapped and sent one
+    chunk at a time, failed chunks are retried individually, and session
+    progress is saved after every chunk so an upload interrupted by a crash
+    resumes where it stopped instead of starting over.
+    """
+
+    def __init__(
+        self,
+        facebook_client,
+        state_path: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        """
+        Args:
+            facebook_client: Initialized FacebookClient
+            state_path: Optional JSON file session progress is persisted to
+            max_retries: Retries per failed chunk before giving up
+            retry_delay: Seconds before the first retry (doubled per retry)
+        """
+        self.facebook_client = facebook_client
+        self.state_path = state_path
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._states: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if state_path and os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as f:
+                self._states = json.load(f)
+
+    def _save(self, state: Optional[VideoUploadState], path: str) -> None:
+        with self._lock:
+            if state is None:
+                self._states.pop(path, None)
+            else:
+                self._states[path] = state.model_dump()
+            if self.state_path:
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._states, f)
+                os.replace(tmp_path, self.state_path)
+
+    def discard(self, path: str) -> None:
+        """Forget the saved session of a file so the next upload starts over"""
+        self._save(None, os.path.abspath(path))
+
+    def _resumable(
+        self, path: str, page_id: str, stat: os.stat_result
+    ) -> Optional[VideoUploadState]:
+        with self._lock:
+            saved = self._states.get(path)
+        if saved is None:
+            return None
+        state = VideoUploadState.model_validate(saved)
+        if (
+            state.page_id != page_id
+            or state.size != stat.st_size
+            or state.mtime != stat.st_mtime
+        ):
+            return None
+        return state
+
+    def _phase(self, page_id: str, data: Dict, files: Optional[Dict] = None) -> Dict:
+        """POST one upload phase to the page's videos edge"""
+        graph = self.facebook_client.client
+        data["access_token"] = self.facebook_client.auth.access_token
+        response = graph.session.post(
+            f"{FACEBOOK_GRAPH_VIDEO_URL}{graph.version}/{page_id}/videos",
+            data=data,
+            files=files,
+            timeout=graph.timeout,
+        )
+        result = response.json()
+        if isinstance(result, dict) and result.get("error"):
+            raise facebook.GraphAPIError(result)
+        return result
+
+    def _transfer(self, state: VideoUploadState, name: str, chunk: bytes) -> Dict:
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._phase(
+                    state.page_id,
+                    {
+                        "upload_phase": "transfer",
+                        "upload_session_id": state.upload_session_id,
+                        "start_offset": state.start_offset,
+                    },
+                    files={"video_file_chunk": (name, chunk)},
+                )
+            except (facebook.GraphAPIError, requests.RequestException):
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+    def upload(self, page_id: str, path: str, **finish_params) -> str:
+        """
+        Upload a local video, resuming its previous session if any
+        Args:
+            page_id: The ID of the Facebook Page.
+            path: Video file.
+            **finish_params: Parameters sent with the finish phase
+                (e.g. description, published, scheduled_publish_time).
+        Returns:
+            The video ID.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if stat.st_size == 0:
+            raise ValueError(f"{path} is empty")
+
+        state = self._resumable(path, page_id, stat)
+        if state is None:
+            session = self._phase(
+                page_id, {"upload_phase": "start", "file_size": stat.st_size}
+            )
+            state = VideoUploadState(
+                path=path,
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                page_id=page_id,
+                video_id=str(session["video_id"]),
+                upload_session_id=str(session["upload_session_id"]),
+                start_offset=int(session["start_offset"]),
+                end_offset=int(session["end_offset"]),
+            )
+            self._save(state, path)
+
+        name = os.path.basename(path)
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            # The API signals completion by returning start_offset == end_offset
+            while state.start_offset < state.end_offset:
+                start, end = state.start_offset, state.end_offset
+                chunk = mapped[start:end]
+                result = self._transfer(state, name, chunk)
+                state.start_offset = int(result["start_offset"])
+                state.end_offset = int(result["end_offset"])
+                self._save(state, path)
+
+        finish_data = {
+            "upload_phase": "finish",
+            "upload_session_id": state.upload_session_id,
+        }
+        for key, value in finish_params.items():
+            if isinstance(value, bool):
+                value = str(value).lower()
+            if value is not None:
+                finish_data[key] = value
+        result = self._phase(page_id, finish_data)
+        if not result.get("success"):
+            raise facebook.GraphAPIError(f"Video upload was not finished: {result}")
+        self._save(None, path)
+        return state.video_id
@@ -0,0 +1,233 @@
+# src/prodigal_automation/hedging.py
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Optional
+
+
+class LatencyTracker:
+    """Rolling window of call latencies with percentile lookup"""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile of the window, or None if it is empty"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(0, min(len(samples) - 1, round(percentile / 100 * len(samples)) - 1))
+        return samples[rank]
+
+
+class _Attempt:
+    """One submitted call and the moment a worker actually started it"""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.started_at: Optional[float] = None
+        self.future: Optional[Future] = None
+
+
+class RequestHedger:
+    """
+    Hedged requests: if a call has not returned within the observed
+    `percentile` latency, an identical second call is fired and whichever
+    finishes first wins. Cost (extra calls) and win (hedges that finished
+    first, and the time they saved) are tracked in `stats`. Latencies are
+    measured from when a worker starts a call, so time spent queued for the
+    pool neither triggers hedges nor skews the percentile, and no hedge is
+    fired while the pool is saturated (it would only queue as well).
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window: int = 200,
+        min_samples: int = 20,
+        initial_delay: float = 5.0,
+        max_workers: int = 16,
+    ):
+        """
+        Args:
+            percentile: Latency percentile used as the hedging deadline
+            window: Number of recent latencies the percentile is taken over
+            min_samples: Samples needed before the percentile is trusted;
+                until then `initial_delay` is used
+            initial_delay: Hedging deadline in seconds while warming up
+            max_workers: Thread pool size for synchronous calls; size it
+                above the expected number of concurrent calls (e.g. twice
+                generate_batch's max_concurrency) so hedges are not skipped
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.max_workers = max_workers
+        self.latencies = LatencyTracker(window)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = {
+            "calls": 0,
+            "hedged": 0,  # extra calls fired (the cost)
+            "hedge_wins": 0,  # hedges that returned first (the win)
+            "skipped": 0,  # hedges not fired (pool saturated or no capacity)
+            "seconds_saved": 0.0,
+        }
+
+    def hedge_delay(self) -> float:
+        """Current deadline after which a hedge is fired"""
+        if len(self.latencies) < self.min_samples:
+            return self.initial_delay
+        return self.latencies.percentile(self.percentile)
+
+    def _count(self, key: str, amount=1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def _done(self, attempt: _Attempt) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        # Unblock waiters if the call was cancelled before it started
+        attempt.started.set()
+
+    def _timed(self, fn: Callable[[], Any]) -> _Attempt:
+        attempt = _Attempt()
+
+        def run():
+            attempt.started_at = time.monotonic()
+            attempt.started.set()
+            return fn()
+
+        with self._lock:
+            self._in_flight += 1
+        attempt.future = self._executor.submit(run)
+        attempt.future.add_done_callback(lambda _: self._done(attempt))
+        return attempt
+
+    def _saturated(self) -> bool:
+        with self._lock:
+            return self._in_flight >= self.max_workers
+
+    def _finish(self, primary: _Attempt, hedge: Optional[_Attempt], winner: _Attempt):
+        elapsed = time.monotonic() - primary.started_at
+        self.latencies.record(elapsed)
+        if hedge is None or winner is primary:
+            if hedge is not None:
+                hedge.future.cancel()
+            return
+        self._count("hedge_wins")
+        # Measure the win once the abandoned primary call completes
+        primary.future.add_done_callback(
+            lambda f: self._count(
+                "seconds_saved",
+                max(time.monotonic() - primary.started_at - elapsed, 0.0),
+            )
+        )
+
+    def call(
+        self, fn: Callable[[], Any], can_hedge: Optional[Callable[[], bool]] = None
+    ) -> Any:
+        """
+        Run `fn` with hedging and return the first successful result
+        (the first error is raised if both attempts fail)
+        Args:
+            fn: The call to run
+            can_hedge: Optional check run right before a hedge is fired, e.g.
+                reserving a rate limiter slot; the hedge is skipped if it
+                returns False
+        """
+        self._count("calls")
+        primary = self._timed(fn)
+        # The deadline runs from when a worker picks the call up
+        primary.started.wait()
+        if primary.started_at is None:
+            return primary.future.result()
+        deadline = primary.started_at + self.hedge_delay()
+        done, _ = wait([primary.future], timeout=max(deadline - time.monotonic(), 0))
+        if done:
+            self._finish(primary, None, primary)
+            return primary.future.result()
+
+        if self._saturated() or (can_hedge is not None and not can_hedge()):
+            self._count("skipped")
+            result = primary.future.result()
+            self._finish(primary, None, primary)
+            return result
+
+        self._count("hedged")
+        hedge = self._timed(fn)
+        attempts = {primary.future: primary, hedge.future: hedge}
+        pending = set(attempts)
+        first_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if not future.cancelled() and future.exception() is None:
+                    self._finish(primary, hedge, attempts[future])
+                    return future.result()
+                if not future.cancelled():
+                    first_error = first_error or future.exception()
+        raise first_error
+
+    async def acall(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        can_hedge: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        Async version of call; `factory` creates a fresh awaitable per
+        attempt and the losing attempt is cancelled
+        """
+        self._count("calls")
+        started = time.monotonic()
+        primary = asyncio.ensure_future(factory())
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay())
+        if done:
+            self.latencies.record(time.monotonic() - started)
+            return primary.result()
+
+        if can_hedge is not None and not can_hedge():
+            self._count("skipped")
+            result = await primary
+            self.latencies.record(time.monotonic() - started)
+            return result
+
+        self._count("hedged")
+        hedge = asyncio.ensure_future(factory())
+        pending = {primary, hedge}
+        first_error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self.latencies.record(time.monotonic() - started)
+                        if task is hedge:
+                            self._count("hedge_wins")
+                        return task.result()
+                    first_error = first_error or task.exception()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
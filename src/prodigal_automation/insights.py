@@ -0,0 +1,263 @@
+# src/prodigal_automation/insights.py
+
+import datetime
+import json
+import math
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlparse
+
+# Longest since/until span the Graph API accepts for one insights request
+MAX_INSIGHTS_WINDOW_DAYS = 90
+
+
+def parse_end_time(end_time: str) -> float:
+    """UNIX timestamp of a Graph API insights `end_time`"""
+    return datetime.datetime.strptime(end_time, "%Y-%m-%dT%H:%M:%S%z").timestamp()
+
+
+def format_end_time(timestamp: float) -> str:
+    """Graph API `end_time` string of a UNIX timestamp"""
+    moment = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S+0000")
+
+
+def _merge_ranges(ranges: Iterable[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def insights_windows(
+    since: int, until: int, window_days: int = MAX_INSIGHTS_WINDOW_DAYS
+) -> List[Tuple[int, int]]:
+    """Split [since, until) into consecutive spans the API accepts"""
+    if until <= since:
+        raise ValueError("until must be after since")
+    step = window_days * 86400
+    return [(start, min(start + step, until)) for start in range(since, until, step)]
+
+
+def next_page(paging: Dict) -> Tuple[str, Dict]:
+    """Graph API path and query arguments of a `paging.next` URL"""
+    url = urlparse(paging["next"])
+    return url.path.lstrip("/"), dict(parse_qsl(url.query))
+
+
+class InsightsSeries:
+    """
+    Columnar insights time series: for every metric, parallel arrays of
+    end times (UNIX seconds) and values, sorted by time. Non-numeric values
+    (e.g. per-country breakdowns) are stored as NaN.
+    """
+
+    def __init__(self, period: str = "day"):
+        self.period = period
+        self._points: Dict[str, Dict[float, float]] = {}
+        self._columns: Dict[str, Tuple[array, array]] = {}
+        self.errors: List[str] = []
+
+    def add(self, entries: Iterable[Dict]) -> None:
+        """Merge Graph API insights `data` entries (overlaps are deduplicated)"""
+        for entry in entries:
+            points = self._points.setdefault(entry["name"], {})
+            for point in entry.get("values", []):
+                value = point.get("value")
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    value = math.nan
+                points[parse_end_time(point["end_time"])] = float(value)
+            self._columns.pop(entry["name"], None)
+
+    def _column(self, metric: str) -> Tuple[array, array]:
+        column = self._columns.get(metric)
+        if column is None:
+            points = sorted(self._points.get(metric, {}).items())
+            column = (
+                array("d", (t for t, _ in points)),
+                array("d", (v for _, v in points)),
+            )
+            self._columns[metric] = column
+        return column
+
+    @property
+    def metrics(self) -> List[str]:
+        return list(self._points)
+
+    def timestamps(self, metric: str) -> array:
+        return self._column(metric)[0]
+
+    def values(self, metric: str) -> array:
+        return self._column(metric)[1]
+
+    def items(self) -> Iterator[Tuple[str, array, array]]:
+        for metric in self._points:
+            yield (metric, *self._column(metric))
+
+    def to_numpy(self, metric: str):
+        """(timestamps, values) as NumPy arrays (requires numpy)"""
+        import numpy as np
+
+        timestamps, values = self._column(metric)
+        return np.frombuffer(timestamps, dtype=np.float64), np.frombuffer(
+            values, dtype=np.float64
+        )
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+
+class InsightsStore:
+    """
+    SQLite store of insights values keyed by (object_id, metric, period,
+    end_time), plus the time ranges already fetched for each key. Ranges are
+    only recorded as fetched once they are older than `mutable_days`, so
+    recent values that Facebook may still revise are always refetched while
+    history is served from disk.
+    """
+
+    def __init__(self, path: str = ":memory:", mutable_days: float = 3):
+        """
+        Args:
+            path: SQLite database file (in memory by default)
+            mutable_days: Days back from now during which values may change
+        """
+        self.mutable_seconds = mutable_days * 86400
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS insights ("
+                "object_id TEXT NOT NULL, metric TEXT NOT NULL, period TEXT NOT NULL, "
+                "end_time REAL NOT NULL, value TEXT, "
+                "PRIMARY KEY (object_id, metric, period, end_time))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS insights_coverage ("
+                "object_id TEXT NOT NULL, metric TEXT NOT NULL, period TEXT NOT NULL, "
+                "since REAL NOT NULL, until REAL NOT NULL)"
+            )
+
+    def _covered(self, object_id: str, metric: str, period: str):
+        return self._db.execute(
+            "SELECT since, until FROM insights_coverage "
+            "WHERE object_id = ? AND metric = ? AND period = ?",
+            (object_id, metric, period),
+        ).fetchall()
+
+    def missing_ranges(
+        self, object_id: str, metrics: List[str], period: str, since: int, until: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Parts of [since, until) that must be fetched for any of `metrics`
+        Returns:
+            Sorted, non-overlapping (since, until) ranges
+        """
+        gaps = []
+        with self._lock:
+            for metric in metrics:
+                cursor = since
+                for start, end in _merge_ranges(
+                    self._covered(object_id, metric, period)
+                ):
+                    if end <= cursor or start >= until:
+                        continue
+                    if start > cursor:
+                        gaps.append((cursor, start))
+                    cursor = max(cursor, end)
+                if cursor < until:
+                    gaps.append((cursor, until))
+        return [(int(start), int(end)) for start, end in _merge_ranges(gaps)]
+
+    def save(
+        self,
+        object_id: str,
+        metrics: List[str],
+        period: str,
+        entries: Iterable[Dict],
+        since: int,
+        until: int,
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        Store fetched insights `data` entries and record [since, until) as
+        fetched for `metrics`, up to where values may still change
+        """
+        now = time.time() if now is None else now
+        rows = [
+            (
+                object_id,
+                entry["name"],
+                period,
+                parse_end_time(point["end_time"]),
+                json.dumps(point.get("value")),
+            )
+            for entry in entries
+            for point in entry.get("values", [])
+        ]
+        covered_until = min(until, now - self.mutable_seconds)
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO insights "
+                "(object_id, metric, period, end_time, value) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            if covered_until <= since:
+                return
+            for metric in metrics:
+                ranges = self._covered(object_id, metric, period)
+                ranges.append((since, covered_until))
+                self._db.execute(
+                    "DELETE FROM insights_coverage "
+                    "WHERE object_id = ? AND metric = ? AND period = ?",
+                    (object_id, metric, period),
+                )
+                self._db.executemany(
+                    "INSERT INTO insights_coverage "
+                    "(object_id, metric, period, since, until) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (object_id, metric, period, start, end)
+                        for start, end in _merge_ranges(ranges)
+                    ],
+                )
+
+    def load(
+        self, object_id: str, metrics: List[str], period: str, since: int, until: int
+    ) -> List[Dict]:
+        """
+        Stored values with end times in (since, until]
+        Returns:
+            Insights `data` entries in the Graph API response format
+        """
+        entries = []
+        with self._lock:
+            for metric in metrics:
+                rows = self._db.execute(
+                    "SELECT end_time, value FROM insights "
+                    "WHERE object_id = ? AND metric = ? AND period = ? "
+                    "AND end_time > ? AND end_time <= ? ORDER BY end_time",
+                    (object_id, metric, period, since, until),
+                ).fetchall()
+                entries.append(
+                    {
+                        "name": metric,
+                        "period": period,
+                        "values": [
+                            {"value": json.loads(value), "end_time": format_end_time(t)}
+                            for t, value in rows
+                        ],
+                    }
+                )
+        return entries
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,83 @@
+# src/prodigal_automation/model_pool.py
+
+import threading
+from typing import Dict, Tuple
+
+import google.generativeai as genai
+from google.generativeai import client as genai_client
+
+# One client manager per API key and one model per (API key, model name).
+# The SDK keeps its configuration in a process-global client manager, so
+# calling `genai.configure` per tenant would overwrite other tenants' keys.
+# Each key gets its own (SDK-internal) _ClientManager instead.
+_CLIENT_MANAGERS: Dict[str, "genai_client._ClientManager"] = {}
+_MODELS: Dict[Tuple[str, str], "PooledGenerativeModel"] = {}
+_LOCK = threading.Lock()
+
+
+class PooledGenerativeModel(genai.GenerativeModel):
+    """GenerativeModel bound to the clients of a specific API key"""
+
+    def __init__(self, model_name: str, manager: "genai_client._ClientManager"):
+        super().__init__(model_name)
+        self._manager = manager
+        self._client = manager.get_default_client("generative")
+
+    def _bind_async_client(self) -> None:
+        # gRPC asyncio clients must be created inside a running event loop,
+        # so the async client is bound lazily on first use.
+        if self._async_client is None:
+            self._async_client = self._manager.get_default_client("generative_async")
+
+    async def generate_content_async(self, *args, **kwargs):
+        self._bind_async_client()
+        return await super().generate_content_async(*args, **kwargs)
+
+    async def count_tokens_async(self, *args, **kwargs):
+        self._bind_async_client()
+        return await super().count_tokens_async(*args, **kwargs)
+
+
+def get_model(
+    api_key: str, model_name: str = "gemini-1.5-flash"
+) -> PooledGenerativeModel:
+    """
+    Return the shared model for an API key and model name, creating it on
+    first use. Thread-safe; does not touch the SDK's global configuration.
+    Args:
+        api_key: Gemini API key
+        model_name: Gemini model name
+    Returns:
+        A GenerativeModel reused by every caller with the same key and model
+    """
+    key = (api_key, model_name)
+    model = _MODELS.get(key)
+    if model is not None:
+        return model
+
+    with _LOCK:
+        model = _MODELS.get(key)
+        if model is None:
+            manager = _CLIENT_MANAGERS.get(api_key)
+            if manager is None:
+                manager = genai_client._ClientManager()
+                manager.configure(api_key=api_key)
+                _CLIENT_MANAGERS[api_key] = manager
+            model = PooledGenerativeModel(model_name, manager)
+            _MODELS[key] = model
+        return model
+
+
+def evict_api_key(api_key: str) -> None:
+    """Drop the clients and models of a rotated or revoked API key."""
+    with _LOCK:
+        _CLIENT_MANAGERS.pop(api_key, None)
+        for key in [key for key in _MODELS if key[0] == api_key]:
+            del _MODELS[key]
+
+
+def clear_model_pool() -> None:
+    """Drop every pooled client and model."""
+    with _LOCK:
+        _CLIENT_MANAGERS.clear()
+        _MODELS.clear()
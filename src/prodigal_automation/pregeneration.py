@@ -0,0 +1,202 @@
+# src/prodigal_automation/pregeneration.py
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .tools import ContentRequest
+
+_GENERATORS = {
+    "general": "generate_content",
+    "twitter": "generate_tweet",
+    "facebook": "generate_post",
+}
+
+
+class PreGeneratedContent(BaseModel):
+    """Content generated ahead of its scheduled publish time"""
+
+    topic: str = Field(..., description="Topic the content was generated for")
+    platform: str = Field(..., description="Target platform")
+    publish_time: int = Field(..., description="Scheduled UNIX publish time")
+    content: Optional[str] = Field(None, description="Generated, validated content")
+    error: Optional[str] = Field(None, description="Last generation error")
+    attempts: int = Field(0, description="Generation attempts so far")
+
+
+def _ready_key(platform: str, topic: str, publish_time: int) -> Tuple[str, str, int]:
+    return platform, " ".join(topic.split()).lower(), publish_time
+
+
+class PreGenerationQueue:
+    """
+    Generates content for upcoming scheduled posts in the background so
+    publishing later is a pure network call. Items become due `lead_time`
+    seconds before their publish time and are processed earliest-first,
+    only while the generator's rate limiter (if any) has spare capacity.
+    Failed items are retried with exponential backoff, and content that is
+    never taken is dropped once its publish time has long passed.
+    """
+
+    def __init__(
+        self,
+        content_generator,
+        lead_time: float = 24 * 3600,
+        min_headroom: float = 1.0,
+        max_attempts: int = 3,
+        poll_interval: float = 5.0,
+        retry_delay: float = 60.0,
+        expire_after: float = 3600.0,
+    ):
+        """
+        Args:
+            content_generator: ContentGenerator used for generation
+            lead_time: Seconds before publish time an item may be generated
+            min_headroom: Requests the rate limiter must have available before
+                background work runs, leaving capacity for interactive calls
+            max_attempts: Generation attempts per item before giving up
+            poll_interval: Seconds the background worker sleeps when idle
+            retry_delay: Seconds before a failed item is retried (doubled
+                per further failure)
+            expire_after: Seconds past its publish time that untaken
+                content is kept before it is dropped
+        """
+        self.content_generator = content_generator
+        self.lead_time = lead_time
+        self.min_headroom = min_headroom
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.expire_after = expire_after
+        # (due time, tie-breaker, item), ordered by when the item may run
+        self._heap: List[Tuple[float, int, PreGeneratedContent]] = []
+        self._ready: Dict[Tuple[str, str, int], PreGeneratedContent] = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def schedule(self, topic: str, publish_time: int, platform: str = "facebook"):
+        """
+        Queue a topic for pre-generation
+        Args:
+            topic: Content topic (min 2 words)
+            publish_time: UNIX timestamp the post is scheduled for
+            platform: Target platform ("general", "twitter" or "facebook")
+        """
+        if platform not in _GENERATORS:
+            raise ValueError(f"Unsupported platform: {platform}")
+        ContentRequest(topic=topic)  # validate the topic up front
+        item = PreGeneratedContent(
+            topic=topic, platform=platform, publish_time=publish_time
+        )
+        with self._lock:
+            heapq.heappush(
+                self._heap,
+                (publish_time - self.lead_time, next(self._counter), item),
+            )
+        self._wakeup.set()
+
+    def _has_capacity(self) -> bool:
+        limiter = getattr(self.content_generator, "rate_limiter", None)
+        if limiter is None or limiter.requests is None:
+            return True
+        return limiter.requests.available >= self.min_headroom
+
+    def _generate(self, item: PreGeneratedContent, now: float) -> None:
+        generate = getattr(self.content_generator, _GENERATORS[item.platform])
+        item.attempts += 1
+        try:
+            item.content = generate(ContentRequest(topic=item.topic))
+            item.error = None
+        except Exception as e:
+            item.error = str(e)
+
+        with self._lock:
+            if item.content is None and item.attempts < self.max_attempts:
+                retry_at = now + self.retry_delay * 2 ** (item.attempts - 1)
+                heapq.heappush(self._heap, (retry_at, next(self._counter), item))
+            else:
+                key = _ready_key(item.platform, item.topic, item.publish_time)
+                self._ready[key] = item
+
+    def run_pending(self, now: Optional[float] = None) -> int:
+        """
+        Generate every due item while capacity allows
+        Args:
+            now: Current UNIX time (defaults to time.time())
+        Returns:
+            Number of generation attempts made
+        """
+        now = time.time() if now is None else now
+        self._expire(now)
+        processed = 0
+        while True:
+            with self._lock:
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                if not self._has_capacity():
+                    break
+                _, _, item = heapq.heappop(self._heap)
+            self._generate(item, now)
+            processed += 1
+        return processed
+
+    def _expire(self, now: float) -> None:
+        """Drop ready content whose publish time passed `expire_after` ago"""
+        cutoff = now - self.expire_after
+        with self._lock:
+            for key, item in list(self._ready.items()):
+                if item.publish_time < cutoff:
+                    del self._ready[key]
+
+    def take(
+        self, topic: str, publish_time: int, platform: str = "facebook"
+    ) -> Optional[str]:
+        """
+        Remove and return the content pre-generated for a topic's scheduled
+        slot, or None if it is not ready (the caller should then generate it
+        live). The same topic scheduled at different times yields separate
+        content.
+        """
+        with self._lock:
+            key = _ready_key(platform, topic, publish_time)
+            item = self._ready.pop(key, None)
+        return item.content if item is not None else None
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    def ready(self) -> List[PreGeneratedContent]:
+        with self._lock:
+            return list(self._ready.values())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.run_pending()
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def start(self) -> None:
+        """Start the background worker thread"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="pregeneration", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background worker thread"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
@@ -0,0 +1,372 @@
+# src/prodigal_automation/rate_limit.py
+
+import asyncio
+import re
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from tweepy.errors import TweepyException
+
+
+class RateLimitError(ValueError):
+    """Raised when Gemini keeps rejecting calls with 429 / ResourceExhausted"""
+
+
+class TwitterRateLimited(TweepyException):
+    """
+    Raised instead of sleeping when a Twitter endpoint has no requests left
+    for a tenant; `retry_after` says how long the caller should defer
+    """
+
+    def __init__(self, tenant_id: str, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Twitter rate limit for {endpoint} (tenant '{tenant_id}'); "
+            f"retry in {retry_after:.0f}s"
+        )
+        self.tenant_id = tenant_id
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate_per_minute`.
+    Callers reserve tokens up front and may take the bucket into debt; the
+    debt is the time they (and anyone queued behind them) must wait, so
+    callers are served in arrival order instead of racing.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Take `amount` tokens and return the seconds to wait before using them
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= min(amount, self.capacity)
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_reserve(self, amount: float) -> bool:
+        """Take `amount` tokens only if they are available right now"""
+        with self._lock:
+            self._refill()
+            amount = min(amount, self.capacity)
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+
+    def adjust(self, amount: float) -> None:
+        """Take (positive) or give back (negative) tokens after the fact"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+    def pause(self, seconds: float) -> None:
+        """Make the next reservation wait at least `seconds`"""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class GeminiRateLimiter:
+    """
+    Client-side requests-per-minute and tokens-per-minute limiter for one
+    Gemini API key, with per-call token accounting.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = 15,
+        tokens_per_minute: int = 1000000,
+    ):
+        """
+        Args:
+            requests_per_minute: Maximum model calls per minute (None: only
+                tokens are limited)
+            tokens_per_minute: Maximum prompt + output tokens per minute
+        """
+        self.requests: Optional[TokenBucket] = None
+        if requests_per_minute is not None:
+            self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "queued_calls": 0,
+            "wait_seconds": 0.0,
+            "prompt_tokens": 0,
+            "output_tokens": 0,
+            "rate_limited": 0,
+        }
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        wait = self.tokens.reserve(estimated_tokens)
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        with self._lock:
+            self.stats["calls"] += 1
+            if wait > 0:
+                self.stats["queued_calls"] += 1
+                self.stats["wait_seconds"] += wait
+        return wait
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until a call using about `estimated_tokens` may proceed
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self, estimated_tokens: int = 0) -> bool:
+        """
+        Reserve a call using about `estimated_tokens` only if it may proceed
+        without waiting (used for optional calls such as hedges)
+        Returns:
+            True if the call was reserved
+        """
+        with self._lock:
+            if self.requests is not None and not self.requests.try_reserve(1):
+                return False
+            if not self.tokens.try_reserve(estimated_tokens):
+                if self.requests is not None:
+                    self.requests.adjust(-1)
+                return False
+            self.stats["calls"] += 1
+        return True
+
+    async def acquire_async(self, estimated_tokens: int = 0) -> float:
+        """Async version of acquire that yields to the event loop while queued"""
+        wait = self._reserve(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record(self, response, estimated_tokens: int = 0) -> None:
+        """
+        Record actual token usage from a Gemini response and correct the
+        token bucket for the difference from the estimate
+        """
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        prompt_tokens = getattr(usage, "prompt_token_count", 0) or 0
+        output_tokens = getattr(usage, "candidates_token_count", 0) or 0
+        self.tokens.adjust(prompt_tokens + output_tokens - estimated_tokens)
+        with self._lock:
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["output_tokens"] += output_tokens
+
+    def rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """
+        Note a 429 from the API: queue subsequent callers for `retry_after`
+        seconds (default: one request interval, or one second when requests
+        are not limited)
+        """
+        # Every call reserves from the token bucket, so pausing it also
+        # queues callers when there is no request bucket
+        bucket = self.requests if self.requests is not None else self.tokens
+        if retry_after is None:
+            retry_after = 1.0 if self.requests is None else 1.0 / self.requests.rate
+        bucket.pause(retry_after)
+        with self._lock:
+            self.stats["rate_limited"] += 1
+
+
+# Limiters are shared by every ContentGenerator using the same key, since the
+# quota belongs to the key
+_LIMITERS: Dict[str, Tuple[GeminiRateLimiter, Tuple[Optional[int], int]]] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    api_key: str,
+    requests_per_minute: Optional[int] = 15,
+    tokens_per_minute: int = 1000000,
+    strict: bool = True,
+) -> GeminiRateLimiter:
+    """
+    Return the process-wide limiter for an API key, creating it on first use
+    Args:
+        api_key: Gemini API key the limits apply to
+        requests_per_minute: Maximum model calls per minute (None: unlimited)
+        tokens_per_minute: Maximum prompt + output tokens per minute
+        strict: If False, return the key's existing limiter even when it was
+            created with different limits
+    Returns:
+        GeminiRateLimiter shared by all callers with the same key
+    Raises:
+        ValueError: If strict and the key's limiter was created with
+            different limits
+    """
+    limits = (requests_per_minute, tokens_per_minute)
+    with _LIMITERS_LOCK:
+        entry = _LIMITERS.get(api_key)
+        if entry is None:
+            entry = (GeminiRateLimiter(*limits), limits)
+            _LIMITERS[api_key] = entry
+        elif strict and entry[1] != limits:
+            raise ValueError(
+                f"Rate limiter for this API key already uses "
+                f"{entry[1][0] or 'unlimited'} requests and {entry[1][1]} "
+                f"tokens per minute; got {limits[0] or 'unlimited'} and {limits[1]}"
+            )
+        return entry[0]
+
+
+_NUMERIC_SEGMENT_RE = re.compile(r"(?<!^)/\d+(?=/|$)")
+_USERNAME_SEGMENT_RE = re.compile(r"(/by/username)/[^/]+")
+
+
+def twitter_endpoint(method: str, route: str) -> str:
+    """
+    Rate limit bucket for a request, e.g. "GET /2/users/:id/tweets"
+    (Twitter limits apply per endpoint template, not per concrete URL)
+    """
+    route = _NUMERIC_SEGMENT_RE.sub("/:id", route)
+    route = _USERNAME_SEGMENT_RE.sub(r"\1/:username", route)
+    return f"{method.upper()} {route}"
+
+
+class _Window:
+    __slots__ = ("remaining", "reset", "next_at")
+
+    def __init__(self, remaining: int, reset: float):
+        self.remaining = remaining
+        self.reset = reset
+        self.next_at = 0.0
+
+
+class TwitterRateLimitTracker:
+    """
+    Tracks the `x-rate-limit-remaining` / `x-rate-limit-reset` headers per
+    tenant and endpoint. Callers reserve a request before sending it and are
+    told how long to defer when the window is used up, so a 429 on one
+    endpoint never blocks other endpoints or tenants.
+    """
+
+    def __init__(self, spread: bool = False):
+        """
+        Args:
+            spread: Space calls evenly over the rest of the window instead of
+                letting them burst until `remaining` hits zero
+        """
+        self.spread = spread
+        self._windows: Dict[Tuple[str, str], _Window] = {}
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "deferred": 0, "rate_limited": 0}
+
+    def _window(self, key: Tuple[str, str], now: float) -> Optional[_Window]:
+        window = self._windows.get(key)
+        if window is not None and window.reset <= now:
+            del self._windows[key]
+            return None
+        return window
+
+    def wait_time(
+        self, tenant_id: str, endpoint: str, now: Optional[float] = None
+    ) -> float:
+        """Seconds until a request to `endpoint` may be sent (0 if now)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            window = self._window((tenant_id, endpoint), now)
+            if window is None:
+                return 0.0
+            if window.remaining <= 0:
+                return window.reset - now
+            return max(window.next_at - now, 0.0)
+
+    def reserve(
+        self, tenant_id: str, endpoint: str, now: Optional[float] = None
+    ) -> float:
+        """
+        Claim one request if the window allows it
+        Returns:
+            0 if the request may be sent now (a slot was reserved), otherwise
+            the seconds the caller should defer it (nothing was reserved)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self.stats["calls"] += 1
+            window = self._window((tenant_id, endpoint), now)
+            if window is None:
+                return 0.0
+            if window.remaining <= 0:
+                wait = window.reset - now
+            else:
+                wait = max(window.next_at - now, 0.0)
+            if wait > 0:
+                self.stats["deferred"] += 1
+                return wait
+            window.remaining -= 1
+            if self.spread and window.remaining > 0:
+                window.next_at = now + (window.reset - now) / window.remaining
+            return 0.0
+
+    def update(
+        self,
+        tenant_id: str,
+        endpoint: str,
+        headers: Mapping[str, str],
+        now: Optional[float] = None,
+    ) -> None:
+        """Record the rate limit headers of a response"""
+        remaining = headers.get("x-rate-limit-remaining")
+        reset = headers.get("x-rate-limit-reset")
+        if remaining is None or reset is None:
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            window = self._window((tenant_id, endpoint), now)
+            if window is None or window.reset != float(reset):
+                window = _Window(int(remaining), float(reset))
+                self._windows[(tenant_id, endpoint)] = window
+            else:
+                # Out-of-order responses can only lower what is left
+                window.remaining = min(window.remaining, int(remaining))
+
+    def rate_limited(
+        self,
+        tenant_id: str,
+        endpoint: str,
+        reset_time: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        Note a 429 for the endpoint and close its window until `reset_time`
+        (default: 15 minutes, Twitter's standard window)
+        Returns:
+            Seconds until the window reopens
+        """
+        now = time.time() if now is None else now
+        reset = float(reset_time) if reset_time else now + 15 * 60
+        with self._lock:
+            self._windows[(tenant_id, endpoint)] = _Window(0, reset)
+            self.stats["rate_limited"] += 1
+        return max(reset - now, 0.0)
@@ -1,8 +1,34 @@
 # src/prodigal_automation/tool_modules/twitter.py
 
+import os
+from typing import Optional
+
 from prodigal_automation.auth import TokenData, check_token
 from prodigal_automation.tool_modules.manager import register_tool
-from prodigal_automation.twitter_manager import get_client_for
+from prodigal_automation.twitter_lookup import (
+    MAX_TWEET_LOOKUP_IDS,
+    TweetBatchLoader,
+    UserIdCache,
+)
+from prodigal_automation.twitter_manager import get_async_client_for, get_client_for
+from prodigal_automation.twitter_timeline import (
+    TimelineCheckpointStore,
+    iter_new_tweets,
+)
+
+# Coalesces concurrent tweet lookups per tenant into get_tweets calls
+_TWEET_LOADER = TweetBatchLoader()
+# Caches username -> user id (and "not found") across tenants
+_USER_IDS = UserIdCache()
+# since_id checkpoints for twitter.get_new_tweets polling, persisted to the
+# JSON file named by TWITTER_TIMELINE_CHECKPOINTS (in memory if unset)
+_CHECKPOINTS = TimelineCheckpointStore(os.getenv("TWITTER_TIMELINE_CHECKPOINTS"))
+
+
+def set_timeline_checkpoint_path(path: Optional[str]) -> None:
+    """Persist twitter.get_new_tweets checkpoints to `path` (None: in memory)"""
+    global _CHECKPOINTS
+    _CHECKPOINTS = TimelineCheckpointStore(path)
 
 
 def twitter_get_user_timeline(
@@ -19,11 +45,10 @@ def twitter_get_user_timeline(
     # 2) Fetch per-tenant client
     client = get_client_for(tenant_id)
 
-    # 3) Lookup user
-    user = client.get_user(username=username)
-    if not user.data:
+    # 3) Lookup user (cached)
+    user_id = _USER_IDS.resolve(tenant_id, username)
+    if user_id is None:
         raise RuntimeError(f"@{username} not found")
-    user_id = user.data.id
 
     # 4) Fetch tweets
     resp = client.get_users_tweets(
@@ -34,6 +59,29 @@ def twitter_get_user_timeline(
     return resp.data or []
 
 
+def twitter_get_new_tweets(
+    tenant_id: str,
+    username: str,
+    max_pages: int = 32,
+    token: str = None,
+) -> list:
+    """
+    Return tweets posted by `username` since this tenant's previous call,
+    walking all pages of new tweets (newest first).
+    """
+    claims: TokenData = check_token(token)
+    if "twitter.read" not in claims.capabilities:
+        raise PermissionError("Missing 'twitter.read' capability")
+
+    client = get_client_for(tenant_id)
+    user_id = _USER_IDS.resolve(tenant_id, username)
+    if user_id is None:
+        raise RuntimeError(f"@{username} not found")
+    return list(
+        iter_new_tweets(client, tenant_id, user_id, _CHECKPOINTS, max_pages=max_pages)
+    )
+
+
 def twitter_get_tweet(
     tenant_id: str,
     tweet_id: str,
@@ -42,16 +90,102 @@ def twitter_get_tweet(
     claims: TokenData = check_token(token)
     if "twitter.read" not in claims.capabilities:
         raise PermissionError("Missing 'twitter.read' capability")
-    client = get_client_for(tenant_id)
-    resp = client.get_tweet(
-        id=tweet_id,
+    tweet = _TWEET_LOADER.load(tenant_id, tweet_id)
+    if not tweet:
+        raise RuntimeError(f"Tweet {tweet_id} not found")
+    return tweet
+
+
+def twitter_get_tweets(
+    tenant_id: str,
+    tweet_ids: list,
+    token: str = None,
+) -> list:
+    claims: TokenData = check_token(token)
+    if "twitter.read" not in claims.capabilities:
+        raise PermissionError("Missing 'twitter.read' capability")
+    # Missing tweets come back as None, in the order requested
+    return _TWEET_LOADER.load_many(tenant_id, tweet_ids)
+
+
+def twitter_resolve_usernames(
+    tenant_id: str,
+    usernames: list,
+    token: str = None,
+) -> dict:
+    claims: TokenData = check_token(token)
+    if "twitter.read" not in claims.capabilities:
+        raise PermissionError("Missing 'twitter.read' capability")
+    # Warms the user id cache for later timeline lookups
+    return _USER_IDS.prefetch(tenant_id, usernames)
+
+
+async def twitter_aget_user_timeline(
+    tenant_id: str,
+    username: str,
+    max_results: int = 5,
+    token: str = None,
+) -> list:
+    """Async version of twitter.get_timeline using the tenant's AsyncClient"""
+    claims: TokenData = check_token(token)
+    if "twitter.read" not in claims.capabilities:
+        raise PermissionError("Missing 'twitter.read' capability")
+
+    client = get_async_client_for(tenant_id)
+    user_id = await _USER_IDS.aresolve(tenant_id, username)
+    if user_id is None:
+        raise RuntimeError(f"@{username} not found")
+
+    resp = await client.get_users_tweets(
+        id=user_id,
+        max_results=max_results,
         tweet_fields=["created_at", "text"],
     )
-    if not resp.data:
+    return resp.data or []
+
+
+async def twitter_aget_tweets(
+    tenant_id: str,
+    tweet_ids: list,
+    token: str = None,
+) -> list:
+    """Async version of twitter.get_tweets (100 ids per get_tweets call)"""
+    claims: TokenData = check_token(token)
+    if "twitter.read" not in claims.capabilities:
+        raise PermissionError("Missing 'twitter.read' capability")
+
+    client = get_async_client_for(tenant_id)
+    tweet_ids = [str(tweet_id) for tweet_id in tweet_ids]
+    unique = list(dict.fromkeys(tweet_ids))
+    found = {}
+    for start in range(0, len(unique), MAX_TWEET_LOOKUP_IDS):
+        end = start + MAX_TWEET_LOOKUP_IDS
+        resp = await client.get_tweets(
+            ids=unique[start:end], tweet_fields=["created_at", "text"]
+        )
+        found.update({str(tweet.id): tweet for tweet in (resp.data or [])})
+    # Missing tweets come back as None, in the order requested
+    return [found.get(tweet_id) for tweet_id in tweet_ids]
+
+
+async def twitter_aget_tweet(
+    tenant_id: str,
+    tweet_id: str,
+    token: str = None,
+) -> dict:
+    """Async version of twitter.get_tweet"""
+    tweets = await twitter_aget_tweets(tenant_id, [tweet_id], token=token)
+    if not tweets[0]:
         raise RuntimeError(f"Tweet {tweet_id} not found")
-    return resp.data
+    return tweets[0]
 
 
-# register both under unique names
+# register all under unique names
 register_tool("twitter.get_timeline", twitter_get_user_timeline)
+register_tool("twitter.get_new_tweets", twitter_get_new_tweets)
 register_tool("twitter.get_tweet", twitter_get_tweet)
+register_tool("twitter.get_tweets", twitter_get_tweets)
+register_tool("twitter.resolve_usernames", twitter_resolve_usernames)
+register_tool("twitter.aget_timeline", twitter_aget_user_timeline)
+register_tool("twitter.aget_tweet", twitter_aget_tweet)
+register_tool("twitter.aget_tweets", twitter_aget_tweets)
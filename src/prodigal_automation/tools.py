@@ -1,10 +1,20 @@
 # src/prodigal_automation/tools.py
 
-from typing import Optional
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
 
-import google.generativeai as genai
+from google.api_core.exceptions import ResourceExhausted
 from pydantic import BaseModel, Field, field_validator
 
+from .cache import GenerationCache
+from .hedging import RequestHedger
+from .model_pool import get_model
+from .rate_limit import RateLimitError, get_rate_limiter
+from .validation import fit_to_limit, weighted_length
+
 
 class ContentRequest(BaseModel):
     """Pydantic model for content generation request"""
@@ -31,33 +41,368 @@ class ContentRequest(BaseModel):
         return v
 
 
+# Character limits enforced per platform
+PLATFORM_LIMITS = {
+    "twitter": 280,
+    "facebook": 5000,
+    "linkedin": 3000,
+}
+
+# Line separating consecutive tweets in generated threads
+THREAD_SEPARATOR = "---"
+_THREAD_SEPARATOR_RE = re.compile(r"\n[ \t]*-{3,}[ \t]*\n")
+
+_FAILURE_MESSAGES = {
+    "general": "Content generation failed",
+    "twitter": "Tweet content generation failed",
+    "facebook": "Social media post content generation failed",
+}
+
+
+# ContentVariants field -> platform whose limit applies to it
+_VARIANT_PLATFORMS = {
+    "tweet": "twitter",
+    "facebook": "facebook",
+    "linkedin": "linkedin",
+}
+
+
+class ContentVariants(BaseModel):
+    """Per-platform variants of one topic, validated against platform limits"""
+
+    tweet: str = Field(..., min_length=1)
+    facebook: str = Field(..., min_length=1)
+    linkedin: str = Field(..., min_length=1)
+
+    @field_validator("tweet", "facebook", "linkedin")
+    @classmethod
+    def validate_length(cls, v, info):
+        platform = _VARIANT_PLATFORMS[info.field_name]
+        limit = PLATFORM_LIMITS[platform]
+        if weighted_length(v, platform) > limit:
+            raise ValueError(f"Content exceeds {limit} characters")
+        return v
+
+
+def collect_stream(
+    chunks: Iterable[str], on_chunk: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Assemble streamed text chunks into the final content
+    Args:
+        chunks: Iterator returned by ContentGenerator.stream_* methods
+        on_chunk: Optional callback invoked with each chunk as it arrives
+    Returns:
+        The concatenated content
+    """
+    parts = []
+    for chunk in chunks:
+        if on_chunk is not None:
+            on_chunk(chunk)
+        parts.append(chunk)
+    return "".join(parts)
+
+
+def fit_for_platform(
+    text: str, platform: str, regenerate: Optional[Callable[[], str]] = None
+) -> str:
+    """
+    Make content fit the platform limit right before it is posted
+    Args:
+        text: Content about to be posted
+        platform: Key of PLATFORM_LIMITS ("twitter", "facebook", ...)
+        regenerate: Optional callable producing validated replacement
+            content (e.g. ContentGenerator.generate_tweet) used when the
+            text cannot be trimmed locally
+    Returns:
+        The text, trimmed if needed, or the regenerated content
+    Raises:
+        ValueError: If the text does not fit and cannot be regenerated
+    """
+    limit = PLATFORM_LIMITS[platform]
+    fitted = fit_to_limit(text, limit, platform)
+    if fitted is not None:
+        return fitted
+    if regenerate is None:
+        raise ValueError(f"Content exceeds {limit} characters")
+    return regenerate()
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single request within a batch generation"""
+
+    index: int = Field(..., description="Position of the request in the batch")
+    content: Optional[str] = Field(None, description="Generated content")
+    error: Optional[str] = Field(None, description="Error message if it failed")
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
 class ContentGenerator:
     """Generates content using Gemini AI with Pydantic validation"""
 
-    def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
-
-    def generate_content(self, request: ContentRequest) -> str:
+    def __init__(
+        self,
+        api_key: Optional[str],
+        model_name: str = "gemini-1.5-flash",
+        cache: Optional[GenerationCache] = None,
+        max_regenerations: int = 2,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_rate_limit_retries: int = 2,
+        hedger: Optional[RequestHedger] = None,
+        backend=None,
+    ):
         """
-        Generate content with validation
         Args:
-            request: ContentRequest object with validated parameters
-        Returns:
-            Generated content
+            api_key: Gemini API key (may be None when a backend is given)
+            model_name: Gemini model to generate with
+            cache: Optional GenerationCache consulted before calling Gemini
+            max_regenerations: How many times over-long tweets/posts that
+                cannot be trimmed locally are regenerated before failing
+            requests_per_minute: Optional client-side request limit; together
+                with tokens_per_minute it enables a limiter shared by every
+                ContentGenerator using the same key. If only tokens_per_minute
+                is given, requests are not limited.
+            tokens_per_minute: Optional client-side token limit (default
+                1000000 when only requests_per_minute is given)
+            max_rate_limit_retries: How many times a call rejected with 429
+                is queued again before RateLimitError is raised
+            hedger: Optional RequestHedger; calls slower than its latency
+                percentile fire a second identical request (not used for
+                streaming, and only when the rate limiter has a free slot)
+            backend: Optional model-like generation backend used instead of
+                Gemini, e.g. backends.LocalBackend for offline load tests
+
+        The quota belongs to the API key, so there is one limiter per key:
+        the first ContentGenerator to set limits for a key fixes them, and
+        later generators for that key share that limiter whatever limits
+        they pass.
         """
-        prompt = (
+        self.model_name = model_name
+        if backend is not None:
+            self.model = backend
+        else:
+            # Models are pooled per (API key, model name); construction is cheap
+            # and tenants with different keys do not share global SDK state.
+            self.model = get_model(api_key, model_name)
+        self.cache = cache
+        self.max_regenerations = max_regenerations
+        self.length_stats = {
+            "checked": 0,
+            "trimmed": 0,  # over-long drafts fixed locally (regenerations saved)
+            "regenerations": 0,
+            "failures": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self.rate_limiter = None
+        if requests_per_minute or tokens_per_minute:
+            self.rate_limiter = get_rate_limiter(
+                api_key,
+                requests_per_minute or None,
+                tokens_per_minute or 1000000,
+                strict=False,
+            )
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.hedger = hedger
+
+    @staticmethod
+    def _estimate_tokens(prompt: str, output_chars: int) -> int:
+        # Roughly four characters per token for English text
+        return (len(prompt) + output_chars) // 4
+
+    def _can_hedge(self, estimate: int) -> Optional[Callable[[], bool]]:
+        """Hedges are extra model calls, so each needs its own limiter slot"""
+        if self.rate_limiter is None:
+            return None
+        return lambda: self.rate_limiter.try_acquire(estimate)
+
+    def _call_model(self, prompt: str, output_chars: int, **kwargs):
+        """Call the model through the rate limiter, queueing on 429s"""
+        estimate = self._estimate_tokens(prompt, output_chars)
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(estimate)
+            try:
+                if self.hedger is not None and not kwargs.get("stream"):
+                    response = self.hedger.call(
+                        lambda: self.model.generate_content(prompt, **kwargs),
+                        can_hedge=self._can_hedge(estimate),
+                    )
+                else:
+                    response = self.model.generate_content(prompt, **kwargs)
+            except ResourceExhausted as e:
+                if self.rate_limiter is None:
+                    raise RateLimitError(f"Gemini rate limit exceeded: {str(e)}")
+                self.rate_limiter.rate_limited()
+                if attempt == self.max_rate_limit_retries:
+                    raise RateLimitError(f"Gemini rate limit exceeded: {str(e)}")
+                continue
+            # Streamed responses only carry final usage once consumed, so the
+            # estimate stands for them
+            if self.rate_limiter is not None and not kwargs.get("stream"):
+                self.rate_limiter.record(response, estimate)
+            return response
+
+    async def _acall_model(self, prompt: str, output_chars: int, **kwargs):
+        """Async version of _call_model"""
+        estimate = self._estimate_tokens(prompt, output_chars)
+        for attempt in range(self.max_rate_limit_retries + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(estimate)
+            try:
+                if self.hedger is not None:
+                    response = await self.hedger.acall(
+                        lambda: self.model.generate_content_async(prompt, **kwargs),
+                        can_hedge=self._can_hedge(estimate),
+                    )
+                else:
+                    response = await self.model.generate_content_async(prompt, **kwargs)
+            except ResourceExhausted as e:
+                if self.rate_limiter is None:
+                    raise RateLimitError(f"Gemini rate limit exceeded: {str(e)}")
+                self.rate_limiter.rate_limited()
+                if attempt == self.max_rate_limit_retries:
+                    raise RateLimitError(f"Gemini rate limit exceeded: {str(e)}")
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(response, estimate)
+            return response
+
+    def _build_prompt(self, platform: str, request: ContentRequest) -> str:
+        """Clamp the request to the platform limit and build the Gemini prompt"""
+        if platform == "twitter":
+            # Ensure length is within Twitter limits
+            request.length = max(50, min(request.length, 280))
+            return (
+                f"Write a {request.style} tweet about {request.topic} "
+                f"with max {request.length} characters. "
+                "Include relevant hashtags if appropriate. "
+                "Make it sound natural for Twitter."
+            )
+        if platform == "facebook":
+            # For Facebook, a higher character limit is acceptable
+            request.length = min(request.length, 5000)  # Facebook posts can be longer
+            return (
+                f"Write a {request.style} social media post about {request.topic} "
+                f"with max {request.length} characters. "
+                "Include relevant hashtags if appropriate. "
+                "Make it sound natural for Facebook/general social media."
+            )
+        return (
             f"Write a {request.style} post about {request.topic} "
             f"with max {request.length} characters. "
             "Include relevant hashtags if appropriate. "
             "Make it sound natural for social media."
         )
 
-        try:
-            response = self.model.generate_content(prompt)
-            return response.text
-        except Exception as e:
-            raise ValueError(f"Content generation failed: {str(e)}")
+    def _cache_key(self, platform: str, request: ContentRequest) -> Optional[tuple]:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(
+            platform, request.topic, request.style, request.length, self.model_name
+        )
+
+    def _fit_length(self, platform: str, text: str) -> Optional[str]:
+        """Check generated text against the platform limit, trimming if cheap"""
+        limit = PLATFORM_LIMITS.get(platform)
+        if limit is None:
+            return text
+        fitted = fit_to_limit(text, limit, platform)
+        with self._stats_lock:
+            self.length_stats["checked"] += 1
+            if fitted is not None and weighted_length(text.strip(), platform) > limit:
+                self.length_stats["trimmed"] += 1
+        return fitted
+
+    def _regeneration_prompt(self, platform: str, prompt: str, text: str) -> str:
+        limit = PLATFORM_LIMITS[platform]
+        with self._stats_lock:
+            self.length_stats["regenerations"] += 1
+        return (
+            f"{prompt} Your previous draft was "
+            f"{weighted_length(text, platform)} characters long. "
+            f"Keep it strictly under {limit} characters."
+        )
+
+    def _length_failed(self, platform: str) -> None:
+        with self._stats_lock:
+            self.length_stats["failures"] += 1
+        raise ValueError(
+            f"{_FAILURE_MESSAGES[platform]}: content exceeds "
+            f"{PLATFORM_LIMITS[platform]} characters after "
+            f"{self.max_regenerations} regenerations"
+        )
+
+    def _generate(self, platform: str, request: ContentRequest) -> str:
+        """Run the platform prompt through the model, serving repeats from cache"""
+        prompt = self._build_prompt(platform, request)
+        key = self._cache_key(platform, request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        attempt_prompt = prompt
+        for attempt in range(self.max_regenerations + 1):
+            try:
+                response = self._call_model(attempt_prompt, request.length)
+                text = response.text
+            except RateLimitError:
+                raise
+            except Exception as e:
+                raise ValueError(f"{_FAILURE_MESSAGES[platform]}: {str(e)}")
+            fitted = self._fit_length(platform, text)
+            if fitted is not None:
+                break
+            if attempt == self.max_regenerations:
+                self._length_failed(platform)
+            attempt_prompt = self._regeneration_prompt(platform, prompt, text)
+
+        if key is not None:
+            self.cache.set(key, fitted)
+        return fitted
+
+    async def _agenerate(self, platform: str, request: ContentRequest) -> str:
+        """Async counterpart of _generate using the SDK's async generation path"""
+        prompt = self._build_prompt(platform, request)
+        key = self._cache_key(platform, request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        attempt_prompt = prompt
+        for attempt in range(self.max_regenerations + 1):
+            try:
+                response = await self._acall_model(attempt_prompt, request.length)
+                text = response.text
+            except RateLimitError:
+                raise
+            except Exception as e:
+                raise ValueError(f"{_FAILURE_MESSAGES[platform]}: {str(e)}")
+            fitted = self._fit_length(platform, text)
+            if fitted is not None:
+                break
+            if attempt == self.max_regenerations:
+                self._length_failed(platform)
+            attempt_prompt = self._regeneration_prompt(platform, prompt, text)
+
+        if key is not None:
+            self.cache.set(key, fitted)
+        return fitted
+
+    def generate_content(self, request: ContentRequest) -> str:
+        """
+        Generate content with validation
+        Args:
+            request: ContentRequest object with validated parameters
+        Returns:
+            Generated content
+        """
+        return self._generate("general", request)
 
     def generate_tweet(self, request: ContentRequest) -> str:
         """
@@ -67,43 +412,286 @@ class ContentGenerator:
         Returns:
             Generated tweet content
         """
-        # Ensure length is within Twitter limits
-        request.length = max(50, min(request.length, 280))
+        return self._generate("twitter", request)
+
+    def generate_post(self, request: ContentRequest) -> str:
+        """
+        Generate social media post content with validation
+        Args:
+            request: ContentRequest object with validated parameters
+        Returns:
+            Generated post content
+        """
+        return self._generate("facebook", request)
+
+    def _stream(self, platform: str, request: ContentRequest) -> Iterator[str]:
+        """
+        Yield text chunks as Gemini produces them, caching the full text.
+        Streamed chunks cannot be trimmed after the fact, so text over the
+        platform limit raises ValueError once streamed and is not cached.
+        """
+        prompt = self._build_prompt(platform, request)
+        key = self._cache_key(platform, request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        parts = []
+        try:
+            for chunk in self._call_model(prompt, request.length, stream=True):
+                text = chunk.text
+                if text:
+                    parts.append(text)
+                    yield text
+        except RateLimitError:
+            raise
+        except Exception as e:
+            raise ValueError(f"{_FAILURE_MESSAGES[platform]}: {str(e)}")
+
+        # The cache is shared with the non-streaming generators, so only
+        # text within the platform limit may be stored
+        text = "".join(parts).strip()
+        limit = PLATFORM_LIMITS.get(platform)
+        with self._stats_lock:
+            self.length_stats["checked"] += 1
+            over_limit = limit is not None and weighted_length(text, platform) > limit
+            if over_limit:
+                self.length_stats["failures"] += 1
+        if over_limit:
+            raise ValueError(
+                f"{_FAILURE_MESSAGES[platform]}: content exceeds {limit} characters"
+            )
+        if key is not None:
+            self.cache.set(key, text)
+
+    def _thread_prompt(
+        self, request: ContentRequest, parts: int, previous: List[str]
+    ) -> str:
+        limit = PLATFORM_LIMITS["twitter"]
         prompt = (
-            f"Write a {request.style} tweet about {request.topic} "
-            f"with max {request.length} characters. "
-            "Include relevant hashtags if appropriate. "
-            "Make it sound natural for Twitter."
+            f"Write a {request.style} Twitter thread of exactly {parts} tweets "
+            f"about {request.topic}. Each tweet must be at most {limit} "
+            f"characters. Put a line containing only {THREAD_SEPARATOR} between "
+            "consecutive tweets and do not number them. "
+            "Include relevant hashtags if appropriate."
         )
+        if previous:
+            posted = f"\n{THREAD_SEPARATOR}\n".join(previous)
+            prompt += (
+                f" The first {len(previous)} tweets are already posted:\n{posted}\n"
+                f"Write only the remaining {parts - len(previous)} tweets."
+            )
+        return prompt
+
+    def _thread_part(self, text: str, number: int) -> str:
+        fitted = self._fit_length("twitter", text)
+        if fitted is None:
+            with self._stats_lock:
+                self.length_stats["failures"] += 1
+            raise ValueError(
+                f"Thread part {number} exceeds "
+                f"{PLATFORM_LIMITS['twitter']} characters"
+            )
+        return fitted
+
+    def stream_thread(
+        self, request: ContentRequest, parts: int, previous: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Generate a whole Twitter thread in one streamed model call, yielding
+        each tweet (validated against the tweet limit) as soon as it is
+        complete so callers can post it while later tweets are generated
+        Args:
+            request: ContentRequest object with validated parameters
+            parts: Number of tweets in the thread
+            previous: Tweets of the thread that are already posted; only the
+                remaining ones are generated
+        Returns:
+            Iterator of tweet texts
+        """
+        previous = previous or []
+        if parts < 1 or len(previous) >= parts:
+            raise ValueError("parts must exceed the number of previous tweets")
+        key = None
+        if not previous:
+            key = self._cache_key(f"thread:{parts}", request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield from json.loads(cached)
+                return
 
+        prompt = self._thread_prompt(request, parts, previous)
+        remaining = parts - len(previous)
+        produced: List[str] = []
+        buffer = ""
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            chunks = self._call_model(
+                prompt, remaining * PLATFORM_LIMITS["twitter"], stream=True
+            )
+            for chunk in chunks:
+                buffer += chunk.text or ""
+                match = _THREAD_SEPARATOR_RE.search(buffer)
+                while match and len(produced) < remaining:
+                    start, end = match.span()
+                    text, buffer = buffer[:start], buffer[end:]
+                    if text.strip():
+                        number = len(previous) + len(produced) + 1
+                        produced.append(self._thread_part(text, number))
+                        yield produced[-1]
+                    match = _THREAD_SEPARATOR_RE.search(buffer)
+        except (RateLimitError, ValueError):
+            raise
         except Exception as e:
-            raise ValueError(f"Tweet content generation failed: {str(e)}")
+            raise ValueError(f"{_FAILURE_MESSAGES['twitter']}: {str(e)}")
 
-    def generate_post(self, request: ContentRequest) -> str:
+        if buffer.strip() and len(produced) < remaining:
+            number = len(previous) + len(produced) + 1
+            produced.append(self._thread_part(buffer, number))
+            yield produced[-1]
+        if len(produced) < remaining:
+            raise ValueError(
+                f"Thread generation failed: got {len(previous) + len(produced)} "
+                f"of {parts} tweets"
+            )
+        if key is not None:
+            self.cache.set(key, json.dumps(produced))
+
+    def generate_thread(self, request: ContentRequest, parts: int) -> List[str]:
         """
-        Generate social media post content with validation
+        Generate a Twitter thread of `parts` tweets in a single model call
+        Returns:
+            Tweet texts in thread order
+        """
+        return list(self.stream_thread(request, parts))
+
+    def stream_content(self, request: ContentRequest) -> Iterator[str]:
+        """
+        Streaming version of generate_content
         Args:
             request: ContentRequest object with validated parameters
         Returns:
-            Generated post content
+            Iterator of text chunks (assemble them with collect_stream)
+        """
+        return self._stream("general", request)
+
+    def stream_post(self, request: ContentRequest) -> Iterator[str]:
+        """
+        Streaming version of generate_post, for long Facebook posts
+        Args:
+            request: ContentRequest object with validated parameters
+        Returns:
+            Iterator of text chunks (assemble them with collect_stream)
+        """
+        return self._stream("facebook", request)
+
+    async def agenerate_content(self, request: ContentRequest) -> str:
+        """Async version of generate_content"""
+        return await self._agenerate("general", request)
+
+    async def agenerate_tweet(self, request: ContentRequest) -> str:
+        """Async version of generate_tweet"""
+        return await self._agenerate("twitter", request)
+
+    async def agenerate_post(self, request: ContentRequest) -> str:
+        """Async version of generate_post"""
+        return await self._agenerate("facebook", request)
+
+    def generate_batch(
+        self,
+        requests: List[ContentRequest],
+        platform: str = "general",
+        max_concurrency: int = 8,
+    ) -> List[BatchResult]:
+        """
+        Generate content for many requests concurrently
+        Args:
+            requests: ContentRequest objects to generate content for
+            platform: Target platform ("general", "twitter" or "facebook")
+            max_concurrency: Maximum number of in-flight Gemini calls
+        Returns:
+            BatchResult list in the same order as the requests
         """
-        # For Facebook, a higher character limit is acceptable
-        request.length = min(request.length, 5000)  # Facebook posts can be much longer
+        generators = {
+            "general": self.generate_content,
+            "twitter": self.generate_tweet,
+            "facebook": self.generate_post,
+        }
+        if platform not in generators:
+            raise ValueError(f"Unsupported platform: {platform}")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not requests:
+            return []
+
+        generate = generators[platform]
+
+        def run(index: int) -> BatchResult:
+            try:
+                return BatchResult(index=index, content=generate(requests[index]))
+            except Exception as e:
+                return BatchResult(index=index, error=str(e))
+
+        workers = min(max_concurrency, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, range(len(requests))))
+
+    def generate_variants(
+        self, topic: str, style: Optional[str] = "professional"
+    ) -> ContentVariants:
+        """
+        Generate tweet, Facebook and LinkedIn variants of a topic in one call
+        Args:
+            topic: Content topic (min 2 words)
+            style: Writing style (casual/professional/funny)
+        Returns:
+            ContentVariants with each variant trimmed to its platform limit
+        Raises:
+            ValueError: If a variant cannot be trimmed to fit its platform
+        """
+        request = ContentRequest(topic=topic, style=style)
+        key = self._cache_key("variants", request)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return ContentVariants.model_validate_json(cached)
+
+        limits = PLATFORM_LIMITS
         prompt = (
-            f"Write a {request.style} social media post about {request.topic} "
-            f"with max {request.length} characters. "
-            "Include relevant hashtags if appropriate. "
-            "Make it sound natural for Facebook/general social media."
+            f"Write {request.style} social media content about {request.topic}. "
+            "Respond with a JSON object with exactly these string fields: "
+            f'"tweet" (a tweet of max {limits["twitter"]} characters), '
+            f'"facebook" (a Facebook post of max {limits["facebook"]} characters) '
+            f'and "linkedin" (a LinkedIn share of max {limits["linkedin"]} '
+            "characters). Include relevant hashtags if appropriate and make each "
+            "variant sound natural for its platform."
         )
 
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            response = self._call_model(
+                prompt,
+                sum(limits.values()),
+                generation_config={"response_mime_type": "application/json"},
+            )
+            data = json.loads(response.text)
+            for field, platform in _VARIANT_PLATFORMS.items():
+                if isinstance(data.get(field), str):
+                    limit = PLATFORM_LIMITS[platform]
+                    fitted = fit_to_limit(data[field], limit, platform)
+                    if fitted is None:
+                        raise ValueError(f"{field} exceeds {limit} characters")
+                    data[field] = fitted
+            variants = ContentVariants.model_validate(data)
+        except RateLimitError:
+            raise
         except Exception as e:
-            raise ValueError(f"Social media post content generation failed: {str(e)}")
+            raise ValueError(f"Variant generation failed: {str(e)}")
+
+        if key is not None:
+            self.cache.set(key, variants.model_dump_json())
+        return variants
 
     # Alternative simple interface
     def simple_generate(self, topic: str, length: int = 500) -> str:
@@ -118,6 +706,11 @@ class ContentGenerator:
         request = ContentRequest(topic=topic, length=length)
         return self.generate_content(request)
 
+    async def asimple_generate(self, topic: str, length: int = 500) -> str:
+        """Async version of simple_generate"""
+        request = ContentRequest(topic=topic, length=length)
+        return await self.agenerate_content(request)
+
     # Add the method that tests expect for general content generation
     def generate_simple_content(self, topic: str) -> str:
         """
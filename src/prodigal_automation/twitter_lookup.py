@@ -0,0 +1,240 @@
+# src/prodigal_automation/twitter_lookup.py
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .cache import LRUTTLCache
+from .twitter_manager import get_async_client_for, get_client_for
+
+# Maximum number of ids accepted by the Twitter v2 tweets lookup endpoint
+MAX_TWEET_LOOKUP_IDS = 100
+# Maximum number of usernames accepted by the Twitter v2 users lookup endpoint
+MAX_USER_LOOKUP_USERNAMES = 100
+
+# Cached marker for usernames the API reported as not found
+_NOT_FOUND = object()
+_UNKNOWN = object()
+
+
+class _PendingBatch:
+    def __init__(self):
+        self.futures: Dict[str, Future] = {}
+
+
+class TweetBatchLoader:
+    """
+    Dataloader-style coalescer for tweet lookups. Concurrent `load` calls
+    for the same tenant within `window` seconds are merged into a single
+    `get_tweets(ids=[...])` call of up to 100 ids, and the results are fanned
+    back out to the callers. The first caller of a window dispatches the
+    batch itself, so no background threads are needed.
+    """
+
+    def __init__(
+        self,
+        client_for: Callable[[str], object] = get_client_for,
+        window: float = 0.005,
+        max_batch: int = MAX_TWEET_LOOKUP_IDS,
+        tweet_fields: Iterable[str] = ("created_at", "text"),
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            client_for: Returns the tweepy Client for a tenant
+            window: Seconds to wait for more lookups before dispatching
+            max_batch: Ids per get_tweets call (at most 100)
+            tweet_fields: Tweet fields requested for every lookup
+            sleep: Called by a batch's first caller to wait out `window`
+        """
+        if not 1 <= max_batch <= MAX_TWEET_LOOKUP_IDS:
+            raise ValueError(f"max_batch must be between 1 and {MAX_TWEET_LOOKUP_IDS}")
+        self.client_for = client_for
+        self.window = window
+        self.max_batch = max_batch
+        self.tweet_fields = list(tweet_fields)
+        self._sleep = sleep
+        self._open: Dict[str, _PendingBatch] = {}
+        self._lock = threading.Lock()
+        self.stats = {"lookups": 0, "api_calls": 0}
+
+    def _dispatch(self, tenant_id: str, batch: _PendingBatch) -> None:
+        ids = list(batch.futures)
+        try:
+            client = self.client_for(tenant_id)
+            resp = client.get_tweets(ids=ids, tweet_fields=self.tweet_fields)
+        except Exception as e:
+            for future in batch.futures.values():
+                future.set_exception(e)
+            return
+        finally:
+            with self._lock:
+                self.stats["api_calls"] += 1
+
+        found = {str(tweet.id): tweet for tweet in (resp.data or [])}
+        for tweet_id, future in batch.futures.items():
+            # Ids missing from data (deleted, protected, not found) resolve to None
+            future.set_result(found.get(tweet_id))
+
+    def load(self, tenant_id: str, tweet_id: str, timeout: Optional[float] = None):
+        """
+        Look up one tweet, coalesced with concurrent lookups for the tenant
+        Returns:
+            The tweepy Tweet, or None if it was not returned by the API
+        """
+        tweet_id = str(tweet_id)
+        with self._lock:
+            self.stats["lookups"] += 1
+            batch = self._open.get(tenant_id)
+            leader = batch is None
+            if leader:
+                batch = _PendingBatch()
+                self._open[tenant_id] = batch
+            future = batch.futures.get(tweet_id)
+            if future is None:
+                future = batch.futures[tweet_id] = Future()
+            full = len(batch.futures) >= self.max_batch
+            if full:
+                del self._open[tenant_id]
+
+        if full:
+            self._dispatch(tenant_id, batch)
+        elif leader:
+            self._sleep(self.window)
+            with self._lock:
+                still_open = self._open.get(tenant_id) is batch
+                if still_open:
+                    del self._open[tenant_id]
+            if still_open:
+                self._dispatch(tenant_id, batch)
+        return future.result(timeout)
+
+    def load_many(self, tenant_id: str, tweet_ids: Iterable[str]) -> List:
+        """
+        Look up many tweets with as few API calls as possible
+        Returns:
+            Tweets (or None for missing ids) in the order of `tweet_ids`
+        """
+        tweet_ids = [str(tweet_id) for tweet_id in tweet_ids]
+        unique = list(dict.fromkeys(tweet_ids))
+        found = {}
+        for start in range(0, len(unique), self.max_batch):
+            batch = _PendingBatch()
+            end = start + self.max_batch
+            for tweet_id in unique[start:end]:
+                batch.futures[tweet_id] = Future()
+            with self._lock:
+                self.stats["lookups"] += len(batch.futures)
+            self._dispatch(tenant_id, batch)
+            for tweet_id, future in batch.futures.items():
+                found[tweet_id] = future.result()
+        return [found[tweet_id] for tweet_id in tweet_ids]
+
+
+class UserIdCache:
+    """
+    TTL cache of username -> user id with negative caching of users that
+    were not found. Mappings are shared across tenants by default (user ids
+    are public); lookups still go through the requesting tenant's client.
+    """
+
+    def __init__(
+        self,
+        client_for: Callable[[str], object] = get_client_for,
+        maxsize: int = 10000,
+        ttl: float = 24 * 3600,
+        negative_ttl: float = 300,
+        per_tenant: bool = False,
+        async_client_for: Callable[[str], object] = get_async_client_for,
+    ):
+        """
+        Args:
+            client_for: Returns the tweepy Client for a tenant
+            maxsize: Maximum cached usernames
+            ttl: Seconds a resolved user id is kept
+            negative_ttl: Seconds a "not found" answer is kept
+            per_tenant: Keep a separate mapping per tenant
+            async_client_for: Returns the tweepy AsyncClient for a tenant
+        """
+        self.client_for = client_for
+        self.async_client_for = async_client_for
+        self.negative_ttl = negative_ttl
+        self.per_tenant = per_tenant
+        self._cache = LRUTTLCache(maxsize=maxsize, ttl=ttl)
+
+    def _key(self, tenant_id: str, username: str):
+        username = username.lstrip("@").lower()
+        return (tenant_id, username) if self.per_tenant else username
+
+    def _store(self, tenant_id: str, username: str, user_id: Optional[str]):
+        if user_id is None:
+            self._cache.set(
+                self._key(tenant_id, username), _NOT_FOUND, ttl=self.negative_ttl
+            )
+        else:
+            self._cache.set(self._key(tenant_id, username), str(user_id))
+
+    def resolve(self, tenant_id: str, username: str) -> Optional[str]:
+        """
+        Return the user id for a username, or None if the user does not exist
+        """
+        cached = self._cache.get(self._key(tenant_id, username), _UNKNOWN)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not _UNKNOWN:
+            return cached
+
+        client = self.client_for(tenant_id)
+        user = client.get_user(username=username.lstrip("@"))
+        user_id = str(user.data.id) if user.data else None
+        self._store(tenant_id, username, user_id)
+        return user_id
+
+    async def aresolve(self, tenant_id: str, username: str) -> Optional[str]:
+        """Async version of resolve using the tenant's AsyncClient"""
+        cached = self._cache.get(self._key(tenant_id, username), _UNKNOWN)
+        if cached is _NOT_FOUND:
+            return None
+        if cached is not _UNKNOWN:
+            return cached
+
+        client = self.async_client_for(tenant_id)
+        user = await client.get_user(username=username.lstrip("@"))
+        user_id = str(user.data.id) if user.data else None
+        self._store(tenant_id, username, user_id)
+        return user_id
+
+    def prefetch(
+        self, tenant_id: str, usernames: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve many usernames with bulk get_users calls (100 per call),
+        skipping those already cached
+        Returns:
+            Mapping of each username to its user id (None if not found)
+        """
+        usernames = list(dict.fromkeys(u.lstrip("@") for u in usernames))
+        resolved: Dict[str, Optional[str]] = {}
+        missing = []
+        for username in usernames:
+            cached = self._cache.get(self._key(tenant_id, username), _UNKNOWN)
+            if cached is _UNKNOWN:
+                missing.append(username)
+            else:
+                resolved[username] = None if cached is _NOT_FOUND else cached
+
+        client = self.client_for(tenant_id) if missing else None
+        for start in range(0, len(missing), MAX_USER_LOOKUP_USERNAMES):
+            end = start + MAX_USER_LOOKUP_USERNAMES
+            chunk = missing[start:end]
+            resp = client.get_users(usernames=chunk)
+            found = {u.username.lower(): str(u.id) for u in (resp.data or [])}
+            for username in chunk:
+                user_id = found.get(username.lower())
+                self._store(tenant_id, username, user_id)
+                resolved[username] = user_id
+        return resolved
+
+    def invalidate(self, tenant_id: str, username: str) -> None:
+        self._cache.pop(self._key(tenant_id, username))
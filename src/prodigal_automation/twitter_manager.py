@@ -1,21 +1,215 @@
 # src/prodigal_automation/twitter_manager.py
 
-from typing import Dict, Union
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Union
 
+from pydantic import BaseModel, Field
 from tweepy.errors import TweepyException
 
 from .auth import TwitterAuth
-from .client import TwitterClient
-from .tools import ContentGenerator
+from .cache import LRUTTLCache
+from .client import AsyncTwitterClient, TwitterClient
+from .dedup import NearDuplicateIndex
+from .rate_limit import TwitterRateLimited, TwitterRateLimitTracker
+from .tools import ContentGenerator, ContentRequest, fit_for_platform
+from .twitter_media import ChunkedMediaUploader
 
 
-class TwitterManager:
+def _close_async_client(key, entry) -> None:
+    """Close an evicted AsyncClient's HTTP session on the loop that owns it"""
+    _, loop = key
+    _, client = entry
+    if not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+
+
+class TwitterClientRegistry:
+    """
+    Thread-safe per-tenant registry of initialized tweepy Clients.
+    Clients are kept in an LRU cache with a TTL and a maximum size, and are
+    rebuilt whenever a tenant's registered credentials change. Async clients
+    are kept per tenant and event loop, since their HTTP session belongs to
+    one loop, and their sessions are closed when they are dropped.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        rate_limits: Optional[TwitterRateLimitTracker] = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of initialized clients kept in memory
+            ttl: Seconds an idle client is kept before being rebuilt
+            rate_limits: Tracker shared by the clients; calls to an exhausted
+                endpoint raise TwitterRateLimited instead of sleeping
+        """
+        self.rate_limits = rate_limits or TwitterRateLimitTracker()
+        self._credentials: Dict[str, TwitterAuth] = {}
+        self._clients = LRUTTLCache(maxsize=maxsize, ttl=ttl, sliding=True)
+        self._async_clients = LRUTTLCache(
+            maxsize=maxsize, ttl=ttl, sliding=True, on_evict=_close_async_client
+        )
+        self._lock = threading.Lock()
+
+    def _drop(self, tenant_id: str) -> None:
+        self._clients.pop(tenant_id)
+        for key in self._async_clients.keys():
+            if key[0] == tenant_id:
+                entry = self._async_clients.pop(key)
+                if entry is not None:
+                    _close_async_client(key, entry)
+
+    def register(self, tenant_id: str, auth: TwitterAuth) -> None:
+        """Register (or rotate) a tenant's credentials"""
+        with self._lock:
+            if self._credentials.get(tenant_id) != auth:
+                self._credentials[tenant_id] = auth
+                self._drop(tenant_id)
+
+    def unregister(self, tenant_id: str) -> None:
+        """Forget a tenant's credentials and client"""
+        with self._lock:
+            self._credentials.pop(tenant_id, None)
+            self._drop(tenant_id)
+
+    def invalidate(self, tenant_id: str) -> None:
+        """Drop a tenant's cached clients so the next lookup rebuilds them"""
+        self._drop(tenant_id)
+
+    def _get(self, tenant_id: str, key, clients: LRUTTLCache, client_class):
+        entry = clients.get(key)
+        if entry is not None:
+            auth, client = entry
+            if self._credentials.get(tenant_id) is auth:
+                return client
+
+        with self._lock:
+            auth = self._credentials.get(tenant_id)
+            if auth is None:
+                raise ValueError(
+                    f"Twitter credentials for tenant '{tenant_id}' not registered."
+                )
+            entry = clients.get(key)
+            if entry is not None and entry[0] is auth:
+                return entry[1]
+            client = client_class(
+                auth, tenant_id=tenant_id, rate_limits=self.rate_limits
+            ).initialize()
+            clients.set(key, (auth, client))
+            return client
+
+    def get(self, tenant_id: str):
+        """
+        Return the tenant's initialized tweepy Client
+        Raises:
+            ValueError: If no credentials are registered for the tenant
+        """
+        return self._get(tenant_id, tenant_id, self._clients, TwitterClient)
+
+    def get_async(self, tenant_id: str):
+        """
+        Return the tenant's initialized tweepy AsyncClient for the running
+        event loop (call it from the coroutine that uses the client)
+        Raises:
+            ValueError: If no credentials are registered for the tenant
+            RuntimeError: If no event loop is running
+        """
+        key = (tenant_id, asyncio.get_running_loop())
+        return self._get(tenant_id, key, self._async_clients, AsyncTwitterClient)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+# Process-wide registry used by the Twitter tools
+_TWITTER_CLIENTS = TwitterClientRegistry()
+
+
+def register_twitter_credentials(
+    tenant_id: str,
+    bearer_token: Optional[str] = None,
+    api_key: Optional[str] = None,
+    api_key_secret: Optional[str] = None,
+    access_token: Optional[str] = None,
+    access_token_secret: Optional[str] = None,
+) -> None:
+    """
+    Register a tenant's Twitter credentials. Re-registering with different
+    credentials invalidates the tenant's cached client.
+    """
+    auth = TwitterAuth(
+        bearer_token=bearer_token,
+        api_key=api_key,
+        api_key_secret=api_key_secret,
+        access_token=access_token,
+        access_token_secret=access_token_secret,
+    )
+    _TWITTER_CLIENTS.register(tenant_id, auth)
+
+
+def get_client_for(tenant_id: str):
+    """Return the initialized tweepy Client for a registered tenant"""
+    return _TWITTER_CLIENTS.get(tenant_id)
+
+
+def get_async_client_for(tenant_id: str):
+    """Return the initialized tweepy AsyncClient for a registered tenant"""
+    return _TWITTER_CLIENTS.get_async(tenant_id)
+
+
+class ThreadProgress(BaseModel):
+    """State of a thread being posted, used to resume after a failure"""
+
+    topic: str = Field(..., description="Thread topic")
+    parts: int = Field(..., ge=1, description="Number of tweets in the thread")
+    texts: List[str] = Field(default_factory=list, description="Posted tweet texts")
+    tweet_ids: List[str] = Field(default_factory=list, description="Posted tweet ids")
+
+
+def _tweet_id(response) -> Optional[str]:
+    data = getattr(response, "data", None)
+    if isinstance(data, dict) and "id" in data:
+        return str(data["id"])
+    tweet_id = getattr(response, "id", None)
+    return str(tweet_id) if tweet_id is not None else None
+
+
+class _DuplicateChecks:
+    """Near-duplicate bookkeeping shared by the sync and async managers"""
+
+    duplicate_index: Optional[NearDuplicateIndex]
+    tenant_id: str
+
+    def _check_duplicate(self, content: str) -> None:
+        """Raise ValueError if content nearly matches a recent tweet"""
+        if self.duplicate_index is None:
+            return
+        match = self.duplicate_index.find_similar(self.tenant_id, content)
+        if match is not None:
+            raise ValueError(
+                f"Content is a near-duplicate of recent tweet {match[0]} "
+                f"(similarity {match[1]:.2f})"
+            )
+
+    def _record_posted(self, content: str, tweet_id) -> None:
+        if self.duplicate_index is not None:
+            self.duplicate_index.add(self.tenant_id, content, str(tweet_id))
+
+
+class TwitterManager(_DuplicateChecks):
     """Manages Twitter operations with proper error handling"""
 
     def __init__(
         self,
         twitter_client_or_auth,
         content_generator_or_api_key=None,
+        duplicate_index: Optional[NearDuplicateIndex] = None,
+        tenant_id: str = "default",
+        media_uploader: Optional[ChunkedMediaUploader] = None,
     ):
         """
         Initialize TwitterManager with flexible constructor to support both
@@ -25,7 +219,16 @@ class TwitterManager:
                 or TwitterAuth instance
             content_generator_or_api_key: Either a ContentGenerator instance
                 (for tests) or API key string
+            duplicate_index: Optional NearDuplicateIndex used to reject
+                near-duplicates of recent tweets before posting
+            tenant_id: Tenant the tweets are recorded under in the index
+            media_uploader: Optional ChunkedMediaUploader for tweets with
+                media; built from OAuth credentials when a TwitterAuth is given
         """
+        self.duplicate_index = duplicate_index
+        self.tenant_id = tenant_id
+        self.media_uploader = media_uploader
+
         if content_generator_or_api_key is None:
             # This is the old constructor signature -
             # twitter_client_or_auth is TwitterAuth,
@@ -35,32 +238,85 @@ class TwitterManager:
 
         if isinstance(twitter_client_or_auth, TwitterAuth):
             # Production usage: TwitterAuth + gemini_api_key
-            self.client = TwitterClient(twitter_client_or_auth).initialize()
+            twitter_client = TwitterClient(twitter_client_or_auth)
+            self.client = twitter_client.initialize()
+            if (
+                media_uploader is None
+                and twitter_client_or_auth.has_oauth_credentials()
+            ):
+                self.media_uploader = ChunkedMediaUploader(
+                    twitter_client.initialize_api()
+                )
             self.content_generator = ContentGenerator(content_generator_or_api_key)
         else:
             # Test usage: mock twitter_client + mock content_generator
             self.client = twitter_client_or_auth
             self.content_generator = content_generator_or_api_key
 
-    def create_tweet(self, topic: str) -> Union[Dict, str]:
+    def upload_media(self, paths: Sequence[str]) -> List[str]:
+        """
+        Upload local media files concurrently with chunked uploads
+        Returns:
+            Media ids in the order of `paths`
+        """
+        if self.media_uploader is None:
+            raise ValueError("No media uploader configured")
+        with ThreadPoolExecutor(max_workers=max(len(paths), 1)) as executor:
+            return list(executor.map(self.media_uploader.upload, paths))
+
+    def create_tweet(
+        self,
+        topic: str,
+        content: Optional[str] = None,
+        media_paths: Optional[Sequence[str]] = None,
+    ) -> Union[Dict, str]:
         """
         Create and post a tweet with validation
         Args:
             topic: Tweet topic (min 2 words)
+            content: Optional pre-generated text (e.g. from
+                ContentGenerator.generate_variants); skips generation
+            media_paths: Optional local images/videos to attach (up to 4);
+                they are uploaded while the text is being generated
         Returns:
             Dictionary with success status and response data (production)
-            or tweet_id string (test compatibility)
+            or tweet_id string (test compatibility); a rate-limited request
+            also carries `retry_after` in seconds
         """
+        media_upload = None
+        executor = None
         try:
+            if media_paths:
+                if self.media_uploader is None:
+                    raise ValueError("No media uploader configured")
+                executor = ThreadPoolExecutor(max_workers=1)
+                media_upload = executor.submit(self.upload_media, list(media_paths))
+
             # Generate content using the method that tests expect
-            content = self.content_generator.generate_simple_content(topic)
+            if content is None:
+                content = fit_for_platform(
+                    self.content_generator.generate_simple_content(topic),
+                    "twitter",
+                    regenerate=lambda: self.content_generator.generate_tweet(
+                        ContentRequest(topic=topic)
+                    ),
+                )
+            else:
+                content = fit_for_platform(content, "twitter")
+            self._check_duplicate(content)
 
             # Post to Twitter
-            response = self.client.create_tweet(text=content)
+            if media_upload is not None:
+                response = self.client.create_tweet(
+                    text=content, media_ids=media_upload.result()
+                )
+            else:
+                response = self.client.create_tweet(text=content)
 
             # Check if this is a test scenario
             # (mock response has .id attribute)
             if hasattr(response, "id"):
+                self._record_posted(content, response.id)
                 return response.id  # Return tweet ID for test compatibility
 
             # Production scenario - check if the tweet was successfully created
@@ -71,6 +327,7 @@ class TwitterManager:
                 and response.data
                 and "id" in response.data
             ):
+                self._record_posted(content, response.data["id"])
                 return {
                     "success": True,
                     "tweet_id": response.data["id"],
@@ -87,6 +344,12 @@ class TwitterManager:
                     ),
                 }
 
+        except TwitterRateLimited as rl:
+            return {
+                "success": False,
+                "error": str(rl),
+                "retry_after": rl.retry_after,
+            }
         except ValueError as ve:
             # For tests, re-raise the exception
             if hasattr(self.client, "_mock_name"):  # This is a mock object
@@ -108,3 +371,169 @@ class TwitterManager:
                     f"{type(e).__name__} - {str(e)}"
                 ),
             }
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def create_thread(
+        self,
+        topic: str,
+        parts: int = 3,
+        resume: Optional[ThreadProgress] = None,
+    ) -> Dict:
+        """
+        Generate a thread in one model call and post it as a reply chain.
+        Each tweet is posted as soon as it has been generated, while the
+        model is still producing the rest.
+        Args:
+            topic: Thread topic (min 2 words)
+            parts: Number of tweets in the thread
+            resume: Progress returned by a failed call; tweets already
+                posted are kept and only the rest are generated and posted
+        Returns:
+            Dictionary with success status, the tweet ids and the progress
+            (pass it back as `resume` to continue after a failure)
+        """
+        progress = resume or ThreadProgress(topic=topic, parts=parts)
+        try:
+            if len(progress.tweet_ids) < progress.parts:
+                tweets = self.content_generator.stream_thread(
+                    ContentRequest(topic=progress.topic),
+                    progress.parts,
+                    previous=progress.texts,
+                )
+                for text in tweets:
+                    if not progress.tweet_ids:
+                        self._check_duplicate(text)
+                        response = self.client.create_tweet(text=text)
+                    else:
+                        response = self.client.create_tweet(
+                            text=text, in_reply_to_tweet_id=progress.tweet_ids[-1]
+                        )
+                    tweet_id = _tweet_id(response)
+                    if tweet_id is None:
+                        raise TweepyException(
+                            f"Tweet creation returned unexpected response: {response}"
+                        )
+                    progress.texts.append(text)
+                    progress.tweet_ids.append(tweet_id)
+                    if len(progress.tweet_ids) == 1:
+                        self._record_posted(text, tweet_id)
+        except TwitterRateLimited as rl:
+            return {
+                "success": False,
+                "error": str(rl),
+                "retry_after": rl.retry_after,
+                "tweet_ids": list(progress.tweet_ids),
+                "progress": progress,
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"{type(e).__name__} - {str(e)}",
+                "tweet_ids": list(progress.tweet_ids),
+                "progress": progress,
+            }
+        return {
+            "success": True,
+            "tweet_ids": list(progress.tweet_ids),
+            "progress": progress,
+        }
+
+
+class AsyncTwitterManager(_DuplicateChecks):
+    """
+    Async counterpart of TwitterManager built on tweepy's AsyncClient.
+    It only offers async methods; use TwitterManager for threads and media.
+    """
+
+    def __init__(
+        self,
+        twitter_client_or_auth,
+        content_generator_or_api_key=None,
+        duplicate_index: Optional[NearDuplicateIndex] = None,
+        tenant_id: str = "default",
+    ):
+        """
+        Args:
+            twitter_client_or_auth: Either a tweepy AsyncClient (or compatible
+                object) or a TwitterAuth instance
+            content_generator_or_api_key: Either a ContentGenerator instance
+                or a Gemini API key string
+            duplicate_index: Optional NearDuplicateIndex used to reject
+                near-duplicates of recent tweets before posting
+            tenant_id: Tenant the tweets are recorded under in the index
+        """
+        if content_generator_or_api_key is None:
+            raise ValueError(
+                "Missing required parameter:" "content_generator_or_api_key"
+            )
+        self.duplicate_index = duplicate_index
+        self.tenant_id = tenant_id
+
+        if isinstance(twitter_client_or_auth, TwitterAuth):
+            self.client = AsyncTwitterClient(
+                twitter_client_or_auth, tenant_id=tenant_id
+            ).initialize()
+        else:
+            self.client = twitter_client_or_auth
+        if isinstance(content_generator_or_api_key, str):
+            self.content_generator = ContentGenerator(content_generator_or_api_key)
+        else:
+            self.content_generator = content_generator_or_api_key
+
+    async def close(self) -> None:
+        """Close the AsyncClient's HTTP session"""
+        await self.client.close()
+
+    async def create_tweet(self, topic: str, content: Optional[str] = None) -> Dict:
+        """
+        Generate (unless `content` is given) and post a tweet
+        Args:
+            topic: Tweet topic (min 2 words)
+            content: Optional pre-generated text; skips generation
+        Returns:
+            Dictionary with success status and the tweet id or error, plus
+            `retry_after` in seconds when rate limited
+        """
+        try:
+            if content is None:
+                content = await self.content_generator.agenerate_tweet(
+                    ContentRequest(topic=topic)
+                )
+            else:
+                content = fit_for_platform(content, "twitter")
+            self._check_duplicate(content)
+            response = await self.client.create_tweet(text=content)
+        except TwitterRateLimited as rl:
+            return {
+                "success": False,
+                "error": str(rl),
+                "retry_after": rl.retry_after,
+            }
+        except ValueError as ve:
+            return {"success": False, "error": f"Validation error: {str(ve)}"}
+        except TweepyException as te:
+            return {"success": False, "error": f"Twitter API error: {str(te)}"}
+        except Exception as e:
+            return {
+                "success": False,
+                "error": (
+                    "An unexpected error occurred during tweet creation: "
+                    f"{type(e).__name__} - {str(e)}"
+                ),
+            }
+
+        if response and response.data and "id" in response.data:
+            self._record_posted(content, response.data["id"])
+            return {
+                "success": True,
+                "tweet_id": response.data["id"],
+                "content": content,
+            }
+        return {
+            "success": False,
+            "error": (
+                "Tweet creation failed or returned " f"unexpected response: {response}"
+            ),
+        }
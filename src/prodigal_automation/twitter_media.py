@@ -0,0 +1,184 @@
+# src/prodigal_automation/twitter_media.py
+
+import json
+import mimetypes
+import mmap
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from pydantic import BaseModel, Field
+from tweepy.errors import TweepyException
+
+# Twitter accepts APPEND segments of at most 5 MB and at most 1000 of them
+MAX_CHUNK_SIZE = 5 * 1024 * 1024
+MAX_SEGMENTS = 1000
+
+
+class MediaUploadState(BaseModel):
+    """Progress of a chunked media upload, persisted so it can be resumed"""
+
+    path: str = Field(..., description="Absolute path of the uploaded file")
+    size: int = Field(..., description="File size in bytes")
+    mtime: float = Field(..., description="File modification time")
+    media_id: str = Field(..., description="media_id returned by INIT")
+    chunk_size: int = Field(..., description="Bytes per APPEND segment")
+    next_segment: int = Field(0, description="First segment not yet appended")
+    expires_at: Optional[float] = Field(None, description="Session expiry (UNIX)")
+
+
+def media_category(media_type: str) -> str:
+    """Twitter media_category for a MIME type"""
+    if media_type == "image/gif":
+        return "tweet_gif"
+    if media_type.startswith("video/"):
+        return "tweet_video"
+    return "tweet_image"
+
+
+class ChunkedMediaUploader:
+    """
+    Uploads local images and videos with the INIT/APPEND/FINALIZE chunked
+    media endpoints. Files are memory-mapped and sent one fixed-size segment
+    at a time, so memory use is bounded by the chunk size. Upload progress
+    is saved after every segment and an interrupted upload of an unchanged
+    file continues from the first missing segment.
+    """
+
+    def __init__(
+        self,
+        api,
+        chunk_size: int = 4 * 1024 * 1024,
+        state_path: Optional[str] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        wait_for_processing: bool = True,
+    ):
+        """
+        Args:
+            api: tweepy.API (v1.1, OAuth 1.0a) used for the media endpoints
+            chunk_size: Bytes per APPEND segment (at most 5 MB)
+            state_path: Optional JSON file upload progress is persisted to,
+                so uploads can be resumed after a crash
+            max_retries: Retries per failed segment before giving up
+            retry_delay: Seconds before the first retry (doubled per retry)
+            wait_for_processing: Poll until async media processing finishes
+        """
+        if not 1 <= chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}")
+        self.api = api
+        self.chunk_size = chunk_size
+        self.state_path = state_path
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.wait_for_processing = wait_for_processing
+        self._states: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if state_path and os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as f:
+                self._states = json.load(f)
+
+    def _save(self, state: Optional[MediaUploadState], path: str) -> None:
+        with self._lock:
+            if state is None:
+                self._states.pop(path, None)
+            else:
+                self._states[path] = state.model_dump()
+            if self.state_path:
+                tmp_path = f"{self.state_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._states, f)
+                os.replace(tmp_path, self.state_path)
+
+    def _resumable(self, path: str, stat: os.stat_result) -> Optional[MediaUploadState]:
+        with self._lock:
+            saved = self._states.get(path)
+        if saved is None:
+            return None
+        state = MediaUploadState.model_validate(saved)
+        if state.size != stat.st_size or state.mtime != stat.st_mtime:
+            return None
+        if state.expires_at is not None and state.expires_at <= time.time():
+            return None
+        return state
+
+    def _append(self, state: MediaUploadState, name: str, data: bytes) -> None:
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.api.chunked_upload_append(
+                    state.media_id, (name, data), state.next_segment
+                )
+                return
+            except TweepyException:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+    def _wait_for_processing(self, media):
+        info = getattr(media, "processing_info", None)
+        while info and info.get("state") in ("pending", "in_progress"):
+            time.sleep(info.get("check_after_secs", 1))
+            media = self.api.get_media_upload_status(media.media_id)
+            info = getattr(media, "processing_info", None)
+        if info and info.get("state") == "failed":
+            raise TweepyException(f"Media processing failed: {info.get('error')}")
+        return media
+
+    def upload(self, path: str, media_type: Optional[str] = None) -> str:
+        """
+        Upload a local file, resuming a previous interrupted upload if any
+        Args:
+            path: Image or video file
+            media_type: MIME type (guessed from the file name if omitted)
+        Returns:
+            The media id to attach to a tweet
+        """
+        path = os.path.abspath(path)
+        media_type = media_type or mimetypes.guess_type(path)[0]
+        if media_type is None:
+            raise ValueError(f"Cannot determine the media type of {path}")
+        stat = os.stat(path)
+        if stat.st_size == 0:
+            raise ValueError(f"{path} is empty")
+
+        # Grow the segment size if needed to stay within 1000 segments
+        min_chunk_size = -(-stat.st_size // MAX_SEGMENTS)
+        chunk_size = max(self.chunk_size, min_chunk_size)
+        if chunk_size > MAX_CHUNK_SIZE:
+            raise ValueError(f"{path} is too large for a chunked upload")
+
+        state = self._resumable(path, stat)
+        if state is None:
+            init = self.api.chunked_upload_init(
+                stat.st_size, media_type, media_category=media_category(media_type)
+            )
+            expires_after = getattr(init, "expires_after_secs", None)
+            state = MediaUploadState(
+                path=path,
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                media_id=str(init.media_id),
+                chunk_size=chunk_size,
+                expires_at=time.time() + expires_after if expires_after else None,
+            )
+            self._save(state, path)
+
+        name = os.path.basename(path)
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            while state.next_segment * state.chunk_size < state.size:
+                start = state.next_segment * state.chunk_size
+                end = start + state.chunk_size
+                self._append(state, name, mapped[start:end])
+                state.next_segment += 1
+                self._save(state, path)
+
+        media = self.api.chunked_upload_finalize(state.media_id)
+        self._save(None, path)
+        if self.wait_for_processing:
+            media = self._wait_for_processing(media)
+        return str(media.media_id)
@@ -0,0 +1,143 @@
+# src/prodigal_automation/twitter_timeline.py
+
+import json
+import os
+import threading
+from typing import Dict, Generator, Iterable, Iterator, List, Optional
+
+
+class TimelineCheckpointStore:
+    """
+    Per-tenant, per-user `since_id` checkpoints so repeated timeline polls
+    only fetch tweets newer than the last completed poll. Optionally
+    persisted to a JSON file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: Optional JSON file the checkpoints are loaded from and saved to
+        """
+        self.path = path
+        self._checkpoints: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._checkpoints = json.load(f)
+
+    @staticmethod
+    def _key(tenant_id: str, user_id: str) -> str:
+        return f"{tenant_id}:{user_id}"
+
+    def get(self, tenant_id: str, user_id: str) -> Optional[str]:
+        with self._lock:
+            return self._checkpoints.get(self._key(tenant_id, user_id))
+
+    def set(self, tenant_id: str, user_id: str, since_id: str) -> None:
+        """Advance the checkpoint (it never moves backwards)"""
+        key = self._key(tenant_id, user_id)
+        with self._lock:
+            current = self._checkpoints.get(key)
+            if current is not None and int(current) >= int(since_id):
+                return
+            self._checkpoints[key] = str(since_id)
+            if self.path:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._checkpoints, f)
+                os.replace(tmp_path, self.path)
+
+
+def _timeline_pages(
+    client,
+    user_id: str,
+    since_id: Optional[str] = None,
+    page_size: int = 100,
+    tweet_fields: Iterable[str] = ("created_at", "text"),
+    max_pages: Optional[int] = None,
+) -> Generator[List, None, bool]:
+    """Yield timeline pages; returns True if the timeline was exhausted"""
+    params = {
+        "id": user_id,
+        "max_results": page_size,
+        "tweet_fields": list(tweet_fields),
+    }
+    if since_id:
+        params["since_id"] = since_id
+
+    pages = 0
+    while max_pages is None or pages < max_pages:
+        resp = client.get_users_tweets(**params)
+        pages += 1
+        yield resp.data or []
+        next_token = (resp.meta or {}).get("next_token")
+        if not next_token:
+            return True
+        params["pagination_token"] = next_token
+    return False
+
+
+def iter_user_timeline(
+    client,
+    user_id: str,
+    since_id: Optional[str] = None,
+    page_size: int = 100,
+    tweet_fields: Iterable[str] = ("created_at", "text"),
+    max_pages: Optional[int] = None,
+) -> Iterator:
+    """
+    Lazily walk a user's timeline, newest first, one page at a time. Pages
+    are only requested as the consumer advances, so stopping early saves the
+    remaining API calls.
+    Args:
+        client: tweepy Client
+        user_id: Twitter user id
+        since_id: Only return tweets newer than this id
+        page_size: Tweets per page (5-100)
+        tweet_fields: Tweet fields to request
+        max_pages: Optional cap on the number of pages fetched
+    Returns:
+        Iterator of tweepy Tweet objects
+    """
+    for page in _timeline_pages(
+        client, user_id, since_id, page_size, tweet_fields, max_pages
+    ):
+        yield from page
+
+
+def iter_new_tweets(
+    client,
+    tenant_id: str,
+    user_id: str,
+    checkpoints: TimelineCheckpointStore,
+    **kwargs,
+) -> Iterator:
+    """
+    Yield tweets posted since the tenant's last completed poll of `user_id`.
+    The checkpoint advances to the newest tweet only once the consumer has
+    exhausted the iterator and every page of new tweets was fetched, so an
+    interrupted poll (or one cut short by `max_pages`) is simply repeated.
+    Args:
+        client: tweepy Client
+        tenant_id: Tenant doing the polling
+        user_id: Twitter user id
+        checkpoints: Store holding the since_id checkpoints
+        **kwargs: Passed through to iter_user_timeline
+    Returns:
+        Iterator of tweepy Tweet objects, newest first
+    """
+    newest_id = None
+    since_id = checkpoints.get(tenant_id, user_id)
+    pages = _timeline_pages(client, user_id, since_id=since_id, **kwargs)
+    while True:
+        try:
+            page = next(pages)
+        except StopIteration as stop:
+            complete = stop.value
+            break
+        for tweet in page:
+            if newest_id is None:
+                newest_id = tweet.id
+            yield tweet
+    if complete and newest_id is not None:
+        checkpoints.set(tenant_id, user_id, str(newest_id))
@@ -0,0 +1,88 @@
+# src/prodigal_automation/validation.py
+
+import re
+from typing import Optional
+
+# Twitter wraps every link with t.co, so each URL counts as 23 characters
+TWITTER_URL_LENGTH = 23
+
+_URL_RE = re.compile(r"https?://\S+", re.IGNORECASE)
+_SENTENCE_END_RE = re.compile(r"[.!?…](?=\s|$)")
+_TRAILING_HASHTAG_RE = re.compile(r"\s*#\w+\s*$")
+
+# Code point ranges Twitter counts as a single character; everything else
+# (e.g. CJK, emoji) counts as two.
+_TWITTER_LIGHT_RANGES = (
+    (0, 4351),
+    (8192, 8205),
+    (8208, 8223),
+    (8242, 8247),
+)
+
+
+def _twitter_char_weight(char: str) -> int:
+    code_point = ord(char)
+    for low, high in _TWITTER_LIGHT_RANGES:
+        if low <= code_point <= high:
+            return 1
+    return 2
+
+
+def weighted_length(text: str, platform: str = "general") -> int:
+    """
+    Length of `text` as counted by the platform
+    Args:
+        text: Content to measure
+        platform: "twitter" applies URL and wide-character weighting;
+            any other platform counts plain characters
+    Returns:
+        The platform-weighted length
+    """
+    if platform != "twitter":
+        return len(text)
+
+    length = 0
+    position = 0
+    for match in _URL_RE.finditer(text):
+        start, end = match.span()
+        length += sum(_twitter_char_weight(c) for c in text[position:start])
+        length += TWITTER_URL_LENGTH
+        position = end
+    length += sum(_twitter_char_weight(c) for c in text[position:])
+    return length
+
+
+def fit_to_limit(text: str, limit: int, platform: str = "general") -> Optional[str]:
+    """
+    Make `text` fit `limit` by trimming at cheap boundaries
+    Trailing hashtags are dropped first, then the text is cut after the last
+    complete sentence that fits. URLs are never split.
+    Args:
+        text: Generated content
+        limit: Maximum platform-weighted length
+        platform: Platform used for weighting (see weighted_length)
+    Returns:
+        The fitted text, or None if it cannot be trimmed without losing
+        most of the content (the caller should regenerate instead)
+    """
+    text = text.strip()
+    if weighted_length(text, platform) <= limit:
+        return text
+
+    # 1) Drop trailing hashtags one at a time
+    candidate = text
+    while _TRAILING_HASHTAG_RE.search(candidate):
+        candidate = _TRAILING_HASHTAG_RE.sub("", candidate).rstrip()
+        if candidate and weighted_length(candidate, platform) <= limit:
+            return candidate
+
+    # 2) Cut after the last sentence that fits, keeping at least half the budget
+    best = None
+    for match in _SENTENCE_END_RE.finditer(candidate):
+        prefix = candidate[: match.end()].rstrip()
+        if weighted_length(prefix, platform) > limit:
+            break
+        best = prefix
+    if best and weighted_length(best, platform) >= limit // 2:
+        return best
+    return None
@@ -0,0 +1,41 @@
+# tests/test_backends.py
+
+from unittest.mock import MagicMock
+
+from prodigal_automation.backends import LocalBackend
+from prodigal_automation.tools import ContentGenerator, ContentRequest, collect_stream
+from prodigal_automation.twitter_manager import TwitterManager
+
+
+def test_local_backend_is_deterministic_and_within_limits():
+    gen = ContentGenerator(None, backend=LocalBackend())
+    first = gen.generate_tweet(ContentRequest(topic="edge computing trends"))
+    second = gen.generate_tweet(ContentRequest(topic="edge computing trends"))
+
+    assert first == second
+    assert len(first) <= 280
+    assert first.endswith("#EdgeComputingTrends")
+    assert collect_stream(gen.stream_post(ContentRequest(topic="edge computing")))
+    assert gen.generate_variants("edge computing trends").tweet
+
+
+def test_local_backend_failure_distribution_in_batch():
+    backend = LocalBackend(failure_rate=0.5, seed=7)
+    gen = ContentGenerator(None, backend=backend)
+    requests = [ContentRequest(topic=f"topic number {i}") for i in range(40)]
+
+    results = gen.generate_batch(requests, platform="twitter", max_concurrency=8)
+    failures = [r for r in results if not r.success]
+
+    assert backend.calls == 40
+    assert 5 < len(failures) < 35
+    assert all("Simulated failure" in r.error for r in failures)
+
+
+def test_twitter_manager_runs_offline():
+    client = MagicMock()
+    client.create_tweet.return_value = MagicMock(id="1")
+    manager = TwitterManager(client, ContentGenerator(None, backend=LocalBackend()))
+
+    assert manager.create_tweet("offline load test") == "1"
+    assert "#OfflineLoadTest" in client.create_tweet.call_args.kwargs["text"]
@@ -0,0 +1,69 @@
+# tests/test_cache.py
+
+import time
+
+from prodigal_automation.cache import GenerationCache, LRUTTLCache
+from prodigal_automation.tools import ContentGenerator, ContentRequest
+
+
+def test_lru_ttl_cache_evicts_and_expires():
+    cache = LRUTTLCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "a" becomes most recently used
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_lru_ttl_cache_reports_evictions():
+    evicted = []
+    cache = LRUTTLCache(
+        maxsize=1, ttl=0.05, on_evict=lambda key, value: evicted.append(key)
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    time.sleep(0.06)
+    assert cache.get("b") is None
+    cache.set("c", 3)
+    assert cache.pop("c") == 3
+    assert evicted == ["a", "b"]
+
+
+def test_generation_cache_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.db")
+    key = GenerationCache.make_key("twitter", "  AI   News ", "Casual", 100, "m")
+    assert key == ("twitter", "ai news", "casual", 100, "m")
+
+    first = GenerationCache(path=path)
+    first.set(key, "cached text")
+    first.close()
+
+    second = GenerationCache(path=path)
+    assert second.get(key) == "cached text"
+    assert second.get(key) == "cached text"
+    assert second.stats()["disk_hits"] == 1
+    assert second.stats()["memory_hits"] == 1
+
+
+def test_content_generator_uses_cache():
+    calls = []
+
+    class DummyResponse:
+        text = "generated"
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            calls.append(prompt)
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key", cache=GenerationCache())
+    gen.model = DummyModel()
+
+    assert gen.generate_tweet(ContentRequest(topic="test topic")) == "generated"
+    assert gen.generate_tweet(ContentRequest(topic="Test  topic")) == "generated"
+    assert len(calls) == 1
@@ -0,0 +1,55 @@
+# tests/test_dedup.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from prodigal_automation.dedup import NearDuplicateIndex
+from prodigal_automation.twitter_manager import TwitterManager
+
+POSTED = (
+    "Excited to share our new AI-powered analytics dashboard! It helps small "
+    "teams understand their customers faster. Try it today #AI #analytics"
+)
+
+
+def test_detects_near_duplicates_per_tenant():
+    index = NearDuplicateIndex()
+    index.add("tenant-a", POSTED, "1")
+
+    match = index.find_similar("tenant-a", POSTED.replace("today", "now"))
+    assert match is not None and match[0] == "1"
+    assert not index.is_duplicate("tenant-b", POSTED)
+    assert not index.is_duplicate("tenant-a", "Something about cooking pasta")
+
+
+def test_bounded_per_tenant_and_persistable(tmp_path):
+    index = NearDuplicateIndex(max_entries=2)
+    index.add("tenant-a", POSTED, "1")
+    index.add("tenant-a", "Completely different launch news for the spring", "2")
+    index.add("tenant-a", "Another unrelated update on our hiring plans", "3")
+    assert not index.is_duplicate("tenant-a", POSTED)
+
+    path = str(tmp_path / "index.json")
+    index.save(path)
+    loaded = NearDuplicateIndex.load(path)
+    assert (
+        loaded.find_similar("tenant-a", "Another unrelated update on our hiring plans")[
+            0
+        ]
+        == "3"
+    )
+
+
+def test_twitter_manager_rejects_duplicates():
+    client = MagicMock()
+    client.create_tweet.return_value = MagicMock(id="42")
+    generator = MagicMock()
+    generator.generate_simple_content.return_value = POSTED
+
+    manager = TwitterManager(client, generator, duplicate_index=NearDuplicateIndex())
+    assert manager.create_tweet("test topic") == "42"
+
+    with pytest.raises(ValueError, match="near-duplicate of recent tweet 42"):
+        manager.create_tweet("test topic")
+    assert client.create_tweet.call_count == 1
@@ -1,3 +1,4 @@
+import json
 import os
 import sys
 from unittest.mock import Mock
@@ -6,7 +7,12 @@ import facebook
 import pytest
 
 from prodigal_automation.auth import FacebookAuth
-from prodigal_automation.client import FacebookClient
+from prodigal_automation.client import (
+    FacebookClient,
+    batch_delete,
+    batch_insights,
+    batch_put,
+)
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -175,3 +181,59 @@ def test_delete_object_failure(facebook_client):
     assert not result["success"]
     assert "error" in result
     assert "Delete failed" in result["error"]
+
+
+def test_batch_chunks_and_demultiplexes_results(facebook_client):
+    """Test batch packs 50 operations per call and maps results back."""
+    client, mock_graph_api = facebook_client
+    mock_graph_api.version = "v19.0"
+
+    def batch_response(path, post_args):
+        response = []
+        for operation in json.loads(post_args["batch"]):
+            if operation["method"] == "DELETE":
+                body = {"error": {"message": "Unsupported delete request"}}
+                response.append({"code": 400, "body": json.dumps(body)})
+            else:
+                response.append({"code": 200, "body": json.dumps({"id": "1"})})
+        return response
+
+    mock_graph_api.request.side_effect = batch_response
+    operations = [batch_put("PAGE", "feed", message=f"Post {i}") for i in range(60)]
+    operations += [batch_delete("42"), batch_insights("42", ["post_clicks"])]
+
+    results = client.batch(operations)
+
+    assert mock_graph_api.request.call_count == 2
+    assert len(results) == 62
+    assert results[0] == {"id": "1"}
+    assert results[60] == {"error": "Unsupported delete request", "code": 400}
+    first_batch = json.loads(
+        mock_graph_api.request.call_args_list[0][1]["post_args"]["batch"]
+    )
+    assert len(first_batch) == 50
+    assert first_batch[0]["body"] == "message=Post+0"
+    assert operations[61]["relative_url"] == "42/insights?metric=post_clicks"
+
+
+def test_get_posts_insights_uses_multi_id_reads(facebook_client):
+    """Test bulk post insights are read 50 ids at a time and mapped by id."""
+    client, mock_graph_api = facebook_client
+
+    def get_objects(ids, fields, access_token):
+        assert fields == "insights.metric(post_clicks)"
+        return {
+            post_id: {"id": post_id, "insights": {"data": [{"value": post_id}]}}
+            for post_id in ids
+            if post_id != "7"
+        }
+
+    mock_graph_api.get_objects.side_effect = get_objects
+    post_ids = [str(i) for i in range(120)]
+
+    results = client.get_posts_insights(post_ids, ["post_clicks"])
+
+    assert mock_graph_api.get_objects.call_count == 3
+    assert results["0"] == {"data": [{"value": "0"}]}
+    assert "error" in results["7"]
+    assert len(results) == 120
@@ -1,10 +1,12 @@
 import os
 import sys
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from prodigal_automation.auth import FacebookAuth
+from prodigal_automation.client import FacebookClient
+from prodigal_automation.dedup import NearDuplicateIndex
 from prodigal_automation.facebook_manager import FacebookManager
 
 # Add the src directory to the Python path
@@ -69,3 +71,79 @@ def facebook_manager_test(mocker):
     )
     mock_test_generator = mocker.MagicMock()
     return FacebookManager(mock_test_client, mock_test_generator)
+
+
+def test_create_post_regenerates_over_long_draft(mock_auth_prod):
+    """Test an untrimmable draft over the post limit is regenerated."""
+    client = MagicMock(spec=FacebookClient)
+    client.auth = mock_auth_prod
+    client.put_object.return_value = {"id": "post-1"}
+    generator = MagicMock()
+    generator.generate_simple_content.return_value = "x" * 6000
+    generator.generate_post.return_value = "A shorter post."
+    manager = FacebookManager(client, generator)
+
+    assert manager.create_post("product launch recap") == "post-1"
+    assert client.put_object.call_args.kwargs["message"] == "A shorter post."
+
+
+def test_publish_and_delete_posts_use_batch(mock_auth_prod):
+    """Test bulk publishing and cleanup go through FacebookClient.batch."""
+    client = MagicMock(spec=FacebookClient)
+    client.auth = mock_auth_prod
+    manager = FacebookManager(client, MagicMock())
+    client.batch.return_value = [{"id": "1"}, {"error": "Rate limited"}]
+
+    published = manager.publish_posts(["First post", "Second post"])
+    assert published == [
+        {"success": True, "post_id": "1"},
+        {"success": False, "error": "Rate limited"},
+    ]
+    operations = client.batch.call_args[0][0]
+    assert [op["relative_url"] for op in operations] == [
+        "TEST_PAGE_ID/feed",
+        "TEST_PAGE_ID/feed",
+    ]
+
+    client.batch.return_value = [{"success": True}, {"error": "Not found"}]
+    assert manager.delete_posts(["1", "2"]) == {
+        "1": {"success": True},
+        "2": {"success": False, "error": "Not found"},
+    }
+
+
+def test_publish_posts_rejects_near_duplicates(mock_auth_prod):
+    """Test bulk publishing skips near-duplicates of recent posts."""
+    posted = (
+        "Excited to share our new AI-powered analytics dashboard! It helps "
+        "small teams understand their customers faster. Try it today #AI"
+    )
+    index = NearDuplicateIndex()
+    index.add("default", posted, "1")
+    client = MagicMock(spec=FacebookClient)
+    client.auth = mock_auth_prod
+    client.batch.return_value = [{"id": "2"}]
+    manager = FacebookManager(client, MagicMock(), duplicate_index=index)
+
+    published = manager.publish_posts(
+        [posted.replace("today", "now"), "Spring hiring update for our team"]
+    )
+    assert published[0]["success"] is False
+    assert "near-duplicate of recent post 1" in published[0]["error"]
+    assert published[1] == {"success": True, "post_id": "2"}
+    assert len(client.batch.call_args[0][0]) == 1
+
+
+def test_publish_posts_rejects_duplicates_within_one_call(mock_auth_prod):
+    """Test bulk publishing sends only the first of repeated messages."""
+    message = "Spring hiring update: we are looking for two backend engineers"
+    client = MagicMock(spec=FacebookClient)
+    client.auth = mock_auth_prod
+    client.batch.return_value = [{"id": "1"}]
+    manager = FacebookManager(client, MagicMock(), duplicate_index=NearDuplicateIndex())
+
+    published = manager.publish_posts([message, message])
+    assert published[0] == {"success": True, "post_id": "1"}
+    assert published[1]["success"] is False
+    assert "near-duplicate of message 0 in this batch" in published[1]["error"]
+    assert len(client.batch.call_args[0][0]) == 1
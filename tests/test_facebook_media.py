@@ -0,0 +1,97 @@
+# tests/test_facebook_media.py
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from prodigal_automation import client as client_module
+from prodigal_automation import facebook_media
+from prodigal_automation.auth import FacebookAuth
+from prodigal_automation.client import FacebookClient
+from prodigal_automation.facebook_manager import FacebookManager
+from prodigal_automation.facebook_media import ResumableVideoUploader
+
+CHUNK = 4
+# Other test modules replace sys.modules["facebook"] with a Mock; use the real
+# SDK module the client was imported with
+facebook = client_module.facebook
+
+
+@pytest.fixture(autouse=True)
+def real_facebook_sdk(monkeypatch):
+    monkeypatch.setattr(facebook_media, "facebook", facebook)
+
+
+def make_client(fail_at_offset=None):
+    """FacebookClient whose Graph session simulates the resumable protocol"""
+    client = MagicMock(spec=FacebookClient)
+    client.auth = FacebookAuth(access_token="TOKEN", page_id="PAGE")
+    client.client = MagicMock(version="v19.0", timeout=None)
+    sent = []
+
+    def post(url, data, files, timeout):
+        assert url == "https://graph-video.facebook.com/v19.0/PAGE/videos"
+        response = MagicMock()
+        phase = data["upload_phase"]
+        if phase == "start":
+            body = {"video_id": "V", "upload_session_id": "S"}
+            body.update(start_offset="0", end_offset=str(min(CHUNK, data["file_size"])))
+        elif phase == "transfer":
+            start = data["start_offset"]
+            sent.append((start, files["video_file_chunk"][1]))
+            if start == fail_at_offset:
+                body = {"error": {"message": "Transient error"}}
+            else:
+                end = start + len(files["video_file_chunk"][1])
+                body = {
+                    "start_offset": str(end),
+                    "end_offset": str(min(end + CHUNK, 10)),
+                }
+        else:
+            body = {"success": True}
+        response.json.return_value = body
+        return response
+
+    client.client.session.post.side_effect = post
+    return client, sent
+
+
+def test_upload_resumes_after_failed_chunk(tmp_path):
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"0123456789")
+    state_path = str(tmp_path / "sessions.json")
+
+    client, sent = make_client(fail_at_offset=4)
+    uploader = ResumableVideoUploader(
+        client, state_path=state_path, max_retries=1, retry_delay=0
+    )
+    with pytest.raises(facebook.GraphAPIError):
+        uploader.upload("PAGE", str(video))
+    # The failed chunk was retried on its own, not the whole file
+    assert sent == [(0, b"0123"), (4, b"4567"), (4, b"4567")]
+
+    client, sent = make_client()
+    resumed = ResumableVideoUploader(client, state_path=state_path)
+    assert resumed.upload("PAGE", str(video), description="Clip") == "V"
+    assert sent == [(4, b"4567"), (8, b"89")]
+    phases = [
+        c.kwargs["data"]["upload_phase"]
+        for c in client.client.session.post.call_args_list
+    ]
+    assert phases == ["transfer", "transfer", "finish"]
+
+
+def test_post_video_uploads_local_file(tmp_path):
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"0123456789")
+    client, _ = make_client()
+    manager = FacebookManager(client, MagicMock())
+
+    result = manager.post_video("Launch video", video_path=str(video), published=False)
+
+    assert result["success"] is True
+    assert result["post_id"] == "V"
+    finish = client.client.session.post.call_args.kwargs["data"]
+    assert finish["description"] == "Launch video"
+    assert finish["published"] == "false"
+    assert manager.post_video("Launch video")["success"] is False
@@ -0,0 +1,133 @@
+# tests/test_hedging.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from prodigal_automation.hedging import LatencyTracker, RequestHedger
+from prodigal_automation.rate_limit import GeminiRateLimiter
+from prodigal_automation.tools import ContentGenerator, ContentRequest
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100)
+    for value in range(1, 101):
+        tracker.record(value / 100)
+    assert tracker.percentile(50) == 0.5
+    assert tracker.percentile(99) == 0.99
+
+
+def test_fast_calls_are_not_hedged():
+    hedger = RequestHedger(initial_delay=1.0)
+    assert hedger.call(lambda: "done") == "done"
+    assert hedger.stats["hedged"] == 0
+
+
+def test_slow_primary_is_hedged_and_hedge_wins():
+    calls = []
+    lock = threading.Lock()
+
+    class DummyResponse:
+        text = "A hedged tweet."
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            with lock:
+                calls.append(prompt)
+                first = len(calls) == 1
+            time.sleep(0.3 if first else 0.0)
+            return DummyResponse()
+
+    hedger = RequestHedger(initial_delay=0.05)
+    gen = ContentGenerator(api_key="fake_api_key", hedger=hedger)
+    gen.model = DummyModel()
+
+    started = time.monotonic()
+    assert gen.generate_tweet(ContentRequest(topic="test topic")) == "A hedged tweet."
+    assert time.monotonic() - started < 0.25
+    assert len(calls) == 2
+    assert hedger.stats["hedged"] == 1
+    assert hedger.stats["hedge_wins"] == 1
+
+
+def _slow_first_model(calls, lock):
+    class DummyResponse:
+        text = "A hedged tweet."
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            with lock:
+                calls.append(prompt)
+                first = len(calls) == 1
+            time.sleep(0.3 if first else 0.0)
+            return DummyResponse()
+
+    return DummyModel()
+
+
+def test_hedges_reserve_rate_limiter_slots():
+    calls = []
+    gen = ContentGenerator(
+        api_key="fake_api_key", hedger=RequestHedger(initial_delay=0.05)
+    )
+    gen.model = _slow_first_model(calls, threading.Lock())
+    gen.rate_limiter = GeminiRateLimiter(requests_per_minute=60)
+
+    gen.generate_tweet(ContentRequest(topic="test topic"))
+    assert len(calls) == 2
+    assert gen.rate_limiter.stats["calls"] == 2
+
+
+def test_no_hedge_without_rate_limiter_capacity():
+    calls = []
+    hedger = RequestHedger(initial_delay=0.05)
+    gen = ContentGenerator(api_key="fake_api_key", hedger=hedger)
+    gen.model = _slow_first_model(calls, threading.Lock())
+    gen.rate_limiter = GeminiRateLimiter(requests_per_minute=1)
+
+    gen.generate_tweet(ContentRequest(topic="test topic"))
+    assert len(calls) == 1
+    assert gen.rate_limiter.stats["calls"] == 1
+    assert hedger.stats["skipped"] == 1
+
+
+def test_queue_wait_does_not_trigger_hedges():
+    hedger = RequestHedger(initial_delay=0.15, max_workers=2)
+
+    def work():
+        time.sleep(0.1)
+        return "done"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: hedger.call(work), range(4)))
+    assert results == ["done"] * 4
+    assert hedger.stats["hedged"] == 0
+    assert hedger.latencies.percentile(100) < 0.15
+
+
+def test_async_hedge_cancels_loser():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "slow"
+
+    async def fast():
+        return "fast"
+
+    attempts = iter([slow, fast])
+    hedger = RequestHedger(initial_delay=0.01)
+
+    async def run():
+        result = await hedger.acall(lambda: next(attempts)())
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "fast"
+    assert cancelled == [True]
+    assert hedger.stats["hedge_wins"] == 1
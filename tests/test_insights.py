@@ -0,0 +1,163 @@
+# tests/test_insights.py
+
+import datetime
+import math
+from unittest.mock import MagicMock
+
+import pytest
+
+from prodigal_automation.auth import FacebookAuth
+from prodigal_automation.client import FacebookClient
+from prodigal_automation.facebook_manager import FacebookManager
+from prodigal_automation.insights import InsightsSeries, InsightsStore, insights_windows
+
+DAY = 86400
+SINCE = 1704067200  # 2024-01-01T00:00:00Z
+
+
+def insights_url(since, until):
+    return f"https://graph.facebook.com/v19.0/PAGE/insights?since={since}&until={until}"
+
+
+def end_time(timestamp):
+    moment = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S+0000")
+
+
+def test_insights_windows_cover_range():
+    windows = insights_windows(SINCE, SINCE + 200 * DAY)
+    assert windows[0] == (SINCE, SINCE + 90 * DAY)
+    assert windows[-1] == (SINCE + 180 * DAY, SINCE + 200 * DAY)
+    with pytest.raises(ValueError):
+        insights_windows(SINCE, SINCE)
+
+
+def test_series_is_sorted_deduplicated_and_numeric():
+    series = InsightsSeries()
+    series.add(
+        [
+            {
+                "name": "page_fans",
+                "values": [
+                    {"value": 5, "end_time": end_time(SINCE + 2 * DAY)},
+                    {"value": 3, "end_time": end_time(SINCE + DAY)},
+                    {"value": {"US": 1}, "end_time": end_time(SINCE + 3 * DAY)},
+                ],
+            }
+        ]
+    )
+    series.add(
+        [
+            {
+                "name": "page_fans",
+                "values": [{"value": 5, "end_time": end_time(SINCE + 2 * DAY)}],
+            }
+        ]
+    )
+
+    assert list(series.timestamps("page_fans")) == [
+        SINCE + DAY,
+        SINCE + 2 * DAY,
+        SINCE + 3 * DAY,
+    ]
+    values = series.values("page_fans")
+    assert values[:2].tolist() == [3.0, 5.0]
+    assert math.isnan(values[2])
+
+
+def test_range_fetch_splits_windows_and_follows_paging():
+    client = FacebookClient(FacebookAuth(access_token="TOKEN", page_id="PAGE"))
+    client.client = MagicMock()
+
+    def get_connections(page_id, connection, **params):
+        since, until = params["since"], params["until"]
+        half = since + (until - since) // 2
+        return {
+            "data": [
+                {
+                    "name": "page_views",
+                    "values": [{"value": 1, "end_time": end_time(since)}],
+                }
+            ],
+            "paging": {"next": insights_url(half, until)},
+        }
+
+    def request(path, args):
+        until = int(args["until"])
+        return {
+            "data": [
+                {
+                    "name": "page_views",
+                    "values": [{"value": 2, "end_time": end_time(int(args["since"]))}],
+                }
+            ],
+            # The API keeps paging forward past the requested range
+            "paging": {"next": insights_url(until, until + DAY)},
+        }
+
+    client.client.get_connections.side_effect = get_connections
+    client.client.request.side_effect = request
+
+    series = client.get_page_insights_range(
+        "PAGE", ["page_views"], SINCE, SINCE + 180 * DAY
+    )
+
+    assert client.client.get_connections.call_count == 2
+    assert client.client.request.call_count == 2
+    assert client.client.request.call_args[0][0] == "v19.0/PAGE/insights"
+    assert series.values("page_views").tolist() == [1.0, 2.0, 1.0, 2.0]
+    assert series.errors == []
+
+
+def daily_entries(metric, since, until):
+    return [
+        {
+            "name": metric,
+            "values": [
+                {"value": day, "end_time": end_time(since + (day + 1) * DAY)}
+                for day in range((until - since) // DAY)
+            ],
+        }
+    ]
+
+
+def test_store_only_reports_missing_and_mutable_ranges():
+    store = InsightsStore(mutable_days=3)
+    now = SINCE + 30 * DAY
+    entries = daily_entries("page_views", SINCE, now)
+    store.save("PAGE", ["page_views"], "day", entries, SINCE, now, now=now)
+
+    # History is covered; the last three days stay refetchable
+    assert store.missing_ranges("PAGE", ["page_views"], "day", SINCE, now) == [
+        (now - 3 * DAY, now)
+    ]
+    # Another metric has never been fetched
+    assert store.missing_ranges("PAGE", ["page_fans"], "day", SINCE, now) == [
+        (SINCE, now)
+    ]
+    loaded = store.load("PAGE", ["page_views"], "day", SINCE, SINCE + 2 * DAY)
+    assert loaded[0]["values"] == [
+        {"value": 0, "end_time": end_time(SINCE + DAY)},
+        {"value": 1, "end_time": end_time(SINCE + 2 * DAY)},
+    ]
+
+
+def test_get_page_metrics_serves_history_from_store():
+    client = MagicMock(spec=FacebookClient)
+    client.auth = FacebookAuth(access_token="TOKEN", page_id="PAGE")
+    client.get_page_insights_entries.side_effect = (
+        lambda page, metrics, since, until, period: (
+            daily_entries("page_views", since, until),
+            [],
+        )
+    )
+    manager = FacebookManager(client, MagicMock(), insights_store=InsightsStore())
+    since, until = SINCE, SINCE + 60 * DAY
+
+    first = manager.get_page_metrics(["page_views"], since=since, until=until)
+    second = manager.get_page_metrics(["page_views"], since=since, until=until)
+
+    assert first == second
+    assert len(first["data"][0]["values"]) == 60
+    # The second call found everything on disk (the range is long past)
+    assert client.get_page_insights_entries.call_count == 1
@@ -0,0 +1,33 @@
+# tests/test_model_pool.py
+
+import pytest
+
+from prodigal_automation.model_pool import clear_model_pool, evict_api_key, get_model
+from prodigal_automation.tools import ContentGenerator
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    clear_model_pool()
+    yield
+    clear_model_pool()
+
+
+def test_models_are_shared_per_key_and_name():
+    first = ContentGenerator(api_key="key-one")
+    second = ContentGenerator(api_key="key-one")
+    assert first.model is second.model
+
+    other_model = get_model("key-one", "gemini-1.5-pro")
+    assert other_model is not first.model
+    assert other_model._client is first.model._client
+
+
+def test_keys_do_not_share_clients():
+    first = get_model("key-one")
+    second = get_model("key-two")
+    assert first._client is not second._client
+
+    evict_api_key("key-one")
+    assert get_model("key-one") is not first
+    assert get_model("key-two") is second
@@ -0,0 +1,85 @@
+# tests/test_pregeneration.py
+
+import time
+from unittest.mock import MagicMock
+
+from prodigal_automation.backends import LocalBackend
+from prodigal_automation.client import FacebookClient
+from prodigal_automation.facebook_manager import FacebookManager
+from prodigal_automation.pregeneration import PreGenerationQueue
+from prodigal_automation.tools import ContentGenerator
+
+
+def test_only_due_items_are_generated_earliest_first():
+    backend = LocalBackend()
+    queue = PreGenerationQueue(ContentGenerator(None, backend=backend), lead_time=60)
+    now = time.time()
+    queue.schedule("later scheduled topic", int(now + 3600))
+    queue.schedule("soon scheduled topic", int(now + 30))
+
+    assert queue.run_pending(now) == 1
+    assert queue.pending() == 1
+    assert queue.take("Soon  Scheduled topic", int(now + 30))
+    assert queue.take("later scheduled topic", int(now + 3600)) is None
+
+
+def test_failed_items_are_retried_then_released():
+    backend = LocalBackend(failure_rate=1.0)
+    queue = PreGenerationQueue(
+        ContentGenerator(None, backend=backend),
+        lead_time=60,
+        max_attempts=2,
+        retry_delay=30,
+    )
+    now = time.time()
+    queue.schedule("doomed scheduled topic", int(now))
+
+    # The retry backs off instead of running again immediately
+    assert queue.run_pending(now) == 1
+    assert queue.run_pending(now + 10) == 0
+    assert queue.run_pending(now + 30) == 1
+    assert queue.ready()[0].error
+    assert queue.take("doomed scheduled topic", int(now)) is None
+
+
+def test_same_topic_at_different_times_gets_separate_content():
+    queue = PreGenerationQueue(ContentGenerator(None, backend=LocalBackend()))
+    now = int(time.time())
+    queue.schedule("weekly product update", now + 60)
+    queue.schedule("weekly product update", now + 120)
+
+    assert queue.run_pending(now) == 2
+    assert queue.take("weekly product update", now + 60)
+    assert queue.take("weekly product update", now + 60) is None
+    assert queue.take("weekly product update", now + 120)
+
+
+def test_untaken_content_expires_after_publish_time():
+    queue = PreGenerationQueue(
+        ContentGenerator(None, backend=LocalBackend()), lead_time=60, expire_after=600
+    )
+    now = time.time()
+    queue.schedule("forgotten scheduled topic", int(now))
+
+    queue.run_pending(now)
+    assert len(queue.ready()) == 1
+    queue.run_pending(now + 601)
+    assert queue.ready() == []
+
+
+def test_create_post_uses_pregenerated_content():
+    client = MagicMock(spec=FacebookClient)
+    client.auth = MagicMock(page_id="PAGE")
+    client.put_object.return_value = {"id": "post-1"}
+    generator = ContentGenerator(None, backend=LocalBackend())
+    generator.generate_simple_content = MagicMock()
+
+    queue = PreGenerationQueue(generator, lead_time=3600)
+    manager = FacebookManager(client, generator, pregeneration_queue=queue)
+    publish_time = int(time.time()) + 1800
+    manager.schedule_post("product launch recap", publish_time)
+    queue.run_pending()
+
+    assert manager.create_post("product launch recap", publish_time) == "post-1"
+    generator.generate_simple_content.assert_not_called()
+    assert "#ProductLaunchRecap" in client.put_object.call_args.kwargs["message"]
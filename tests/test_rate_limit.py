@@ -0,0 +1,216 @@
+# tests/test_rate_limit.py
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from google.api_core.exceptions import ResourceExhausted
+
+from prodigal_automation.client import RateLimitedClient
+from prodigal_automation.rate_limit import (
+    GeminiRateLimiter,
+    RateLimitError,
+    TokenBucket,
+    TwitterRateLimited,
+    TwitterRateLimitTracker,
+    get_rate_limiter,
+    twitter_endpoint,
+)
+from prodigal_automation.tools import ContentGenerator, ContentRequest
+
+
+def test_token_bucket_queues_instead_of_failing():
+    bucket = TokenBucket(rate_per_minute=60, capacity=2)
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+    # Third caller is queued roughly one refill interval behind
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    assert bucket.reserve(1) == pytest.approx(2.0, abs=0.05)
+
+
+def test_limiter_records_token_usage():
+    limiter = GeminiRateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+    limiter.acquire(100)
+    usage = SimpleNamespace(prompt_token_count=30, candidates_token_count=50)
+    limiter.record(SimpleNamespace(usage_metadata=usage), estimated_tokens=100)
+
+    assert limiter.stats["calls"] == 1
+    assert limiter.stats["prompt_tokens"] == 30
+    assert limiter.stats["output_tokens"] == 50
+    assert limiter.tokens.available == pytest.approx(920, abs=1)
+
+
+def test_limiter_is_shared_per_key():
+    first = ContentGenerator(api_key="shared-key", requests_per_minute=600)
+    second = ContentGenerator(api_key="shared-key", requests_per_minute=600)
+    assert first.rate_limiter is second.rate_limiter
+    assert get_rate_limiter("other-key", 600) is not first.rate_limiter
+
+
+def test_conflicting_limits_for_one_key_are_rejected():
+    get_rate_limiter("conflict-key", 600)
+    with pytest.raises(ValueError, match="already uses 600 requests"):
+        get_rate_limiter("conflict-key", 60)
+
+
+def test_generators_share_the_first_limits_for_a_key():
+    first = ContentGenerator(api_key="first-limits-key", requests_per_minute=600)
+    second = ContentGenerator(api_key="first-limits-key", requests_per_minute=60)
+    assert second.rate_limiter is first.rate_limiter
+    assert first.rate_limiter.requests.rate == 10
+
+
+def test_token_limit_alone_does_not_limit_requests():
+    gen = ContentGenerator(api_key="tokens-only-key", tokens_per_minute=600000)
+    assert gen.rate_limiter.requests is None
+    for _ in range(100):
+        assert gen.rate_limiter.try_acquire(100)
+    assert gen.rate_limiter.acquire(100) == 0.0
+
+
+def test_repeated_429_raises_rate_limit_error():
+    class DummyModel:
+        calls = 0
+
+        def generate_content(self, prompt):
+            DummyModel.calls += 1
+            raise ResourceExhausted("quota")
+
+    gen = ContentGenerator(
+        api_key="limited-key", requests_per_minute=6000, max_rate_limit_retries=1
+    )
+    gen.model = DummyModel()
+
+    with pytest.raises(RateLimitError, match="rate limit exceeded"):
+        gen.generate_tweet(ContentRequest(topic="test topic"))
+    assert DummyModel.calls == 2
+    assert gen.rate_limiter.stats["rate_limited"] == 2
+
+
+def test_twitter_endpoints_are_templated():
+    assert twitter_endpoint("get", "/2/users/123/tweets") == "GET /2/users/:id/tweets"
+    assert (
+        twitter_endpoint("GET", "/2/users/by/username/jack")
+        == "GET /2/users/by/username/:username"
+    )
+
+
+def test_twitter_tracker_defers_per_tenant_and_endpoint():
+    tracker = TwitterRateLimitTracker()
+    headers = {"x-rate-limit-remaining": "1", "x-rate-limit-reset": "1900"}
+    tracker.update("a", "GET /2/tweets", headers, now=1000)
+
+    assert tracker.reserve("a", "GET /2/tweets", now=1000) == 0.0
+    assert tracker.reserve("a", "GET /2/tweets", now=1000) == 900
+    # Other endpoints and tenants are unaffected
+    assert tracker.reserve("a", "GET /2/users", now=1000) == 0.0
+    assert tracker.reserve("b", "GET /2/tweets", now=1000) == 0.0
+    # The window reopens after the reset
+    assert tracker.reserve("a", "GET /2/tweets", now=1901) == 0.0
+
+
+def test_twitter_tracker_spreads_calls_over_window():
+    tracker = TwitterRateLimitTracker(spread=True)
+    headers = {"x-rate-limit-remaining": "10", "x-rate-limit-reset": "1100"}
+    tracker.update("a", "GET /2/tweets", headers, now=1000)
+
+    assert tracker.reserve("a", "GET /2/tweets", now=1000) == 0.0
+    assert tracker.reserve("a", "GET /2/tweets", now=1000) == pytest.approx(100 / 9)
+
+
+def make_response(status_code, headers):
+    response = MagicMock(status_code=status_code, headers=headers, reason="")
+    response.json.return_value = {}
+    response.__enter__.return_value = response
+    return response
+
+
+def test_rate_limited_client_raises_instead_of_sleeping():
+    tracker = TwitterRateLimitTracker()
+    client = RateLimitedClient(bearer_token="x", tenant_id="a", rate_limits=tracker)
+    client.session = MagicMock()
+    client.session.request.return_value = make_response(
+        429, {"x-rate-limit-reset": "9999999999"}
+    )
+
+    with pytest.raises(TwitterRateLimited) as exc_info:
+        client.request("GET", "/2/users/1/tweets")
+    assert exc_info.value.retry_after > 0
+
+    # Deferred without another network call
+    with pytest.raises(TwitterRateLimited):
+        client.request("GET", "/2/users/2/tweets")
+    assert client.session.request.call_count == 1
+
+    client.session.request.return_value = make_response(200, {})
+    client.request("GET", "/2/tweets")
+    assert client.session.request.call_count == 2
+
+
+class FakeAsyncResponse:
+    def __init__(self, status, headers):
+        self.status = status
+        self.reason = ""
+        self.headers = headers
+
+    async def read(self):
+        return b"{}"
+
+    async def json(self):
+        return {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeClientSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.closed = False
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_async_rate_limited_client_reuses_and_closes_session(monkeypatch):
+    aiohttp = pytest.importorskip("aiohttp")
+    pytest.importorskip("async_lru")
+    from prodigal_automation.client import _async_client_class
+
+    session = FakeClientSession(
+        [
+            FakeAsyncResponse(200, {}),
+            FakeAsyncResponse(429, {"x-rate-limit-reset": "9999999999"}),
+        ]
+    )
+    sessions = []
+    monkeypatch.setattr(
+        aiohttp, "ClientSession", lambda: sessions.append(session) or session
+    )
+    client = _async_client_class()(
+        bearer_token="x", tenant_id="a", rate_limits=TwitterRateLimitTracker()
+    )
+
+    async def run():
+        await client.request("GET", "/2/tweets")
+        with pytest.raises(TwitterRateLimited):
+            await client.request("GET", "/2/users/1/tweets")
+        # Deferred without another network call
+        with pytest.raises(TwitterRateLimited):
+            await client.request("GET", "/2/users/2/tweets")
+        await client.close()
+
+    asyncio.run(run())
+    assert len(sessions) == 1
+    assert session.calls == 2
+    assert session.closed
+    assert client.session is None
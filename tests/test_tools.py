@@ -1,8 +1,12 @@
 # tests/test_tools.py
 
+import asyncio
+import json
+
 import pytest
 
-from prodigal_automation.tools import ContentGenerator, ContentRequest
+from prodigal_automation.cache import GenerationCache
+from prodigal_automation.tools import ContentGenerator, ContentRequest, collect_stream
 
 
 def test_content_request_validation():
@@ -31,3 +35,194 @@ def test_generate_tweet(monkeypatch):
     tweet = gen.generate_tweet(request)
     assert isinstance(tweet, str)
     assert tweet == "This is a generated tweet."
+
+
+def test_generate_batch_preserves_order_and_errors():
+    class DummyResponse:
+        def __init__(self, text):
+            self.text = text
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            if "broken topic" in prompt:
+                raise RuntimeError("quota exceeded")
+            return DummyResponse(prompt.split(" about ")[1].split(" with ")[0])
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    requests = [
+        ContentRequest(topic="first topic"),
+        ContentRequest(topic="broken topic"),
+        ContentRequest(topic="third topic"),
+    ]
+    results = gen.generate_batch(requests, platform="twitter", max_concurrency=2)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].content == "first topic"
+    assert not results[1].success
+    assert "quota exceeded" in results[1].error
+    assert results[2].content == "third topic"
+
+
+def test_agenerate_post_uses_async_model():
+    class DummyResponse:
+        text = "An async post."
+
+    class DummyModel:
+        async def generate_content_async(self, prompt):
+            assert "social media post about test topic" in prompt
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    post = asyncio.run(gen.agenerate_post(ContentRequest(topic="test topic")))
+    assert post == "An async post."
+
+
+def test_stream_post_yields_chunks():
+    class DummyChunk:
+        def __init__(self, text):
+            self.text = text
+
+    class DummyModel:
+        def generate_content(self, prompt, stream=False):
+            assert stream
+            return iter([DummyChunk("Hello "), DummyChunk(""), DummyChunk("world")])
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    seen = []
+    post = collect_stream(
+        gen.stream_post(ContentRequest(topic="test topic")), on_chunk=seen.append
+    )
+    assert seen == ["Hello ", "world"]
+    assert post == "Hello world"
+
+
+def test_stream_post_does_not_cache_over_long_text():
+    class DummyChunk:
+        text = "x" * 6000
+
+    class DummyModel:
+        def generate_content(self, prompt, stream=False):
+            return iter([DummyChunk()])
+
+    gen = ContentGenerator(api_key="fake_api_key", cache=GenerationCache())
+    gen.model = DummyModel()
+    request = ContentRequest(topic="test topic")
+
+    with pytest.raises(ValueError, match="exceeds 5000 characters"):
+        collect_stream(gen.stream_post(request))
+    assert gen.cache.get(gen._cache_key("facebook", request)) is None
+
+
+def test_stream_post_rejects_trimmable_over_long_text():
+    class DummyChunk:
+        text = "A complete sentence about the topic. " * 160
+
+    class DummyModel:
+        def generate_content(self, prompt, stream=False):
+            return iter([DummyChunk()])
+
+    gen = ContentGenerator(api_key="fake_api_key", cache=GenerationCache())
+    gen.model = DummyModel()
+    request = ContentRequest(topic="test topic")
+
+    with pytest.raises(ValueError, match="exceeds 5000 characters"):
+        collect_stream(gen.stream_post(request))
+    assert gen.cache.get(gen._cache_key("facebook", request)) is None
+
+
+def test_generate_variants_single_call():
+    calls = []
+
+    class DummyResponse:
+        text = (
+            '{"tweet": "Short tweet #AI", "facebook": "A longer Facebook post.", '
+            '"linkedin": "A LinkedIn share."}'
+        )
+
+    class DummyModel:
+        def generate_content(self, prompt, generation_config=None):
+            calls.append(generation_config)
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    variants = gen.generate_variants("test topic")
+    assert variants.tweet == "Short tweet #AI"
+    assert variants.linkedin == "A LinkedIn share."
+    assert calls == [{"response_mime_type": "application/json"}]
+
+
+def test_generate_variants_rejects_overlong_tweet():
+    class DummyResponse:
+        text = '{"tweet": "%s", "facebook": "post", "linkedin": "share"}' % ("x" * 281)
+
+    class DummyModel:
+        def generate_content(self, prompt, generation_config=None):
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    with pytest.raises(ValueError, match="Variant generation failed"):
+        gen.generate_variants("test topic")
+
+
+def test_generate_variants_trims_over_long_tweet():
+    tweet = "A" * 200 + ". " + "B" * 198 + "."
+
+    class DummyResponse:
+        text = json.dumps({"tweet": tweet, "facebook": "post", "linkedin": "share"})
+
+    class DummyModel:
+        def generate_content(self, prompt, generation_config=None):
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    variants = gen.generate_variants("test topic")
+    assert variants.tweet == "A" * 200 + "."
+    assert variants.facebook == "post"
+
+
+def test_stream_thread_yields_parts_as_they_complete():
+    class DummyChunk:
+        def __init__(self, text):
+            self.text = text
+
+    pulled = []
+
+    class DummyModel:
+        def generate_content(self, prompt, stream=False):
+            assert "thread of exactly 3 tweets" in prompt
+            for text in ["First tweet.\n--", "-\nSecond", " tweet.\n---\n", "Third."]:
+                pulled.append(text)
+                yield DummyChunk(text)
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    thread = gen.stream_thread(ContentRequest(topic="test topic"), 3)
+    assert next(thread) == "First tweet."
+    # The first tweet is available before the rest has been generated
+    assert len(pulled) == 2
+    assert list(thread) == ["Second tweet.", "Third."]
+
+
+def test_stream_thread_rejects_short_thread():
+    class DummyModel:
+        def generate_content(self, prompt, stream=False):
+            return iter([type("Chunk", (), {"text": "Only one tweet."})()])
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    with pytest.raises(ValueError, match="got 1 of 2 tweets"):
+        gen.generate_thread(ContentRequest(topic="test topic"), 2)
@@ -0,0 +1,113 @@
+# tests/test_twitter_client_registry.py
+
+import asyncio
+import time
+
+import pytest
+
+from prodigal_automation.auth import TwitterAuth
+from prodigal_automation.twitter_manager import TwitterClientRegistry
+
+
+@pytest.fixture
+def mock_twitter_client_class(mocker):
+    """Mocks TwitterClient so each initialize() returns a fresh object."""
+    mock_class = mocker.patch("prodigal_automation.twitter_manager.TwitterClient")
+    mock_class.return_value.initialize.side_effect = lambda: object()
+    return mock_class
+
+
+def test_clients_are_reused_per_tenant(mock_twitter_client_class):
+    registry = TwitterClientRegistry()
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-a"))
+
+    assert registry.get("tenant-a") is registry.get("tenant-a")
+    assert mock_twitter_client_class.call_count == 1
+    with pytest.raises(ValueError, match="not registered"):
+        registry.get("tenant-b")
+
+
+def test_credential_rotation_rebuilds_client(mock_twitter_client_class):
+    registry = TwitterClientRegistry()
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-a"))
+    first = registry.get("tenant-a")
+
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-a"))
+    assert registry.get("tenant-a") is first
+
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-rotated"))
+    assert registry.get("tenant-a") is not first
+
+
+def test_registry_is_bounded(mock_twitter_client_class):
+    registry = TwitterClientRegistry(maxsize=2)
+    for tenant in ("a", "b", "c"):
+        registry.register(tenant, TwitterAuth(bearer_token=f"bearer-token-{tenant}"))
+        registry.get(tenant)
+
+    assert len(registry) == 2
+    registry.get("a")  # evicted client is rebuilt from stored credentials
+    assert mock_twitter_client_class.call_count == 4
+
+
+def test_busy_clients_are_not_expired(mock_twitter_client_class):
+    registry = TwitterClientRegistry(ttl=0.1)
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-a"))
+    first = registry.get("tenant-a")
+    for _ in range(3):
+        time.sleep(0.05)
+        assert registry.get("tenant-a") is first
+
+    time.sleep(0.15)
+    assert registry.get("tenant-a") is not first
+
+
+@pytest.fixture
+def mock_async_client_class(mocker):
+    """Mocks AsyncTwitterClient with clients whose close() is recorded."""
+    closed = []
+
+    class FakeAsyncClient:
+        async def close(self):
+            closed.append(self)
+
+    mock_class = mocker.patch("prodigal_automation.twitter_manager.AsyncTwitterClient")
+    mock_class.return_value.initialize.side_effect = FakeAsyncClient
+    mock_class.closed = closed
+    return mock_class
+
+
+def test_async_clients_are_kept_per_event_loop(mock_async_client_class):
+    registry = TwitterClientRegistry()
+    registry.register("tenant-a", TwitterAuth(bearer_token="bearer-token-a"))
+
+    async def get_twice():
+        return registry.get_async("tenant-a"), registry.get_async("tenant-a")
+
+    first, again = asyncio.run(get_twice())
+    second, _ = asyncio.run(get_twice())
+    assert first is again
+    assert second is not first
+
+
+def test_evicted_async_clients_are_closed(mock_async_client_class):
+    registry = TwitterClientRegistry(maxsize=1)
+    for tenant in ("a", "b"):
+        registry.register(tenant, TwitterAuth(bearer_token=f"bearer-token-{tenant}"))
+
+    async def run():
+        first = registry.get_async("a")
+        registry.get_async("b")  # evicts tenant a's client
+        rotated = registry.get_async("b")
+        registry.register("b", TwitterAuth(bearer_token="bearer-token-rotated"))
+        await asyncio.sleep(0)
+        return first, rotated
+
+    first, rotated = asyncio.run(run())
+    assert mock_async_client_class.closed == [first, rotated]
+
+
+def test_twitter_tools_register():
+    from prodigal_automation.tool_modules import manager, twitter  # noqa: F401
+
+    assert "twitter.get_tweet" in manager._TOOL_REGISTRY
@@ -0,0 +1,95 @@
+# tests/test_twitter_lookup.py
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from prodigal_automation.twitter_lookup import TweetBatchLoader, UserIdCache
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.get_tweets.side_effect = lambda ids, tweet_fields: SimpleNamespace(
+        data=[SimpleNamespace(id=int(i), text=f"tweet {i}") for i in ids if i != "404"]
+    )
+    return client
+
+
+def test_concurrent_loads_are_coalesced(mock_client):
+    ids = [str(i) for i in range(1, 21)] + ["404"]
+
+    def wait_for_every_lookup(window):
+        # Hold the window open until all callers have joined the batch
+        deadline = time.monotonic() + 10
+        while loader.stats["lookups"] < len(ids) and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    loader = TweetBatchLoader(
+        client_for=lambda tenant: mock_client, sleep=wait_for_every_lookup
+    )
+
+    with ThreadPoolExecutor(max_workers=len(ids)) as executor:
+        tweets = list(executor.map(lambda i: loader.load("tenant-a", i), ids))
+
+    assert [t.text for t in tweets[:-1]] == [f"tweet {i}" for i in range(1, 21)]
+    assert tweets[-1] is None
+    assert mock_client.get_tweets.call_count == 1
+    assert loader.stats == {"lookups": 21, "api_calls": 1}
+
+
+def test_load_many_chunks_to_api_limit(mock_client):
+    loader = TweetBatchLoader(client_for=lambda tenant: mock_client)
+    ids = [str(i) for i in range(250)] + ["5"]
+
+    tweets = loader.load_many("tenant-a", ids)
+
+    assert len(tweets) == 251
+    assert tweets[-1].text == "tweet 5"
+    assert [len(c.kwargs["ids"]) for c in mock_client.get_tweets.call_args_list] == [
+        100,
+        100,
+        50,
+    ]
+
+
+def test_errors_fan_out_to_every_caller():
+    client = MagicMock()
+    client.get_tweets.side_effect = RuntimeError("rate limited")
+    loader = TweetBatchLoader(client_for=lambda tenant: client, window=0)
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        loader.load("tenant-a", "1")
+
+
+def test_user_ids_are_cached_including_not_found():
+    client = MagicMock()
+    client.get_user.side_effect = lambda username: SimpleNamespace(
+        data=SimpleNamespace(id=12) if username.lower() == "jack" else None
+    )
+    cache = UserIdCache(client_for=lambda tenant: client)
+
+    assert cache.resolve("tenant-a", "@Jack") == "12"
+    assert cache.resolve("tenant-b", "jack") == "12"
+    assert cache.resolve("tenant-a", "ghost") is None
+    assert cache.resolve("tenant-a", "ghost") is None
+    assert client.get_user.call_count == 2
+
+
+def test_prefetch_uses_bulk_lookup():
+    client = MagicMock()
+    client.get_users.return_value = SimpleNamespace(
+        data=[SimpleNamespace(id=1, username="Alice")]
+    )
+    cache = UserIdCache(client_for=lambda tenant: client)
+
+    assert cache.prefetch("tenant-a", ["alice", "@nobody"]) == {
+        "alice": "1",
+        "nobody": None,
+    }
+    client.get_users.assert_called_once_with(usernames=["alice", "nobody"])
+    assert cache.resolve("tenant-a", "alice") == "1"
+    client.get_user.assert_not_called()
@@ -1,8 +1,15 @@
-from unittest.mock import MagicMock
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from tweepy.errors import TweepyException
 
-from src.prodigal_automation.twitter_manager import TwitterManager
+from src.prodigal_automation.backends import LocalBackend
+from src.prodigal_automation.rate_limit import TwitterRateLimited
+from src.prodigal_automation.tools import ContentGenerator
+from src.prodigal_automation.twitter_manager import AsyncTwitterManager, TwitterManager
 
 
 class TestTwitterManager:
@@ -67,3 +74,147 @@ class TestTwitterManager:
         # Test that the exception is properly handled or raised
         with pytest.raises(Exception, match="Twitter API Error"):
             twitter_manager.create_tweet("Test Topic")
+
+    def test_create_tweet_trims_over_long_draft(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet.return_value = MagicMock(id=1)
+        mock_content_generator = MagicMock()
+        draft = "A" * 200 + ". " + "B" * 198 + "."
+        mock_content_generator.generate_simple_content.return_value = draft
+
+        twitter_manager = TwitterManager(mock_twitter_client, mock_content_generator)
+        twitter_manager.create_tweet("Test Topic")
+
+        mock_twitter_client.create_tweet.assert_called_once_with(text="A" * 200 + ".")
+        mock_content_generator.generate_tweet.assert_not_called()
+
+    def test_create_tweet_regenerates_untrimmable_draft(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet.return_value = MagicMock(id=1)
+        mock_content_generator = MagicMock()
+        mock_content_generator.generate_simple_content.return_value = "x" * 400
+        mock_content_generator.generate_tweet.return_value = "A short tweet."
+
+        twitter_manager = TwitterManager(mock_twitter_client, mock_content_generator)
+        twitter_manager.create_tweet("Test Topic")
+
+        request = mock_content_generator.generate_tweet.call_args[0][0]
+        assert request.topic == "Test Topic"
+        mock_twitter_client.create_tweet.assert_called_once_with(text="A short tweet.")
+
+    def test_create_tweet_rejects_over_long_given_content(self):
+        mock_twitter_client = MagicMock()
+        twitter_manager = TwitterManager(mock_twitter_client, MagicMock())
+
+        with pytest.raises(ValueError, match="exceeds 280 characters"):
+            twitter_manager.create_tweet("Test Topic", content="x" * 400)
+        mock_twitter_client.create_tweet.assert_not_called()
+
+    def test_create_tweet_reports_rate_limit_retry_after(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet.side_effect = TwitterRateLimited(
+            "default", "POST /2/tweets", 120
+        )
+        twitter_manager = TwitterManager(mock_twitter_client, MagicMock())
+
+        result = twitter_manager.create_tweet("Test Topic", content="hi")
+        assert result["success"] is False
+        assert result["retry_after"] == 120
+        assert "Validation error" not in result["error"]
+
+    def test_create_thread_posts_reply_chain_and_resumes(self):
+        client = MagicMock()
+        client.create_tweet.side_effect = [
+            MagicMock(data={"id": "1"}),
+            TweepyException("boom"),
+            MagicMock(data={"id": "2"}),
+            MagicMock(data={"id": "3"}),
+        ]
+        gen = ContentGenerator(None, backend=LocalBackend())
+        manager = TwitterManager(client, gen)
+
+        failed = manager.create_thread("offline thread test", parts=3)
+        assert failed["success"] is False
+        assert failed["tweet_ids"] == ["1"]
+
+        result = manager.create_thread("offline thread test", resume=failed["progress"])
+        assert result["success"] is True
+        assert result["tweet_ids"] == ["1", "2", "3"]
+        replies = [
+            c.kwargs.get("in_reply_to_tweet_id")
+            for c in client.create_tweet.call_args_list
+        ]
+        assert replies == [None, "1", "1", "2"]
+        assert gen.model.calls == 2
+
+
+class TestAsyncTwitterManager:
+    def test_create_tweet_success(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet = AsyncMock(
+            return_value=SimpleNamespace(data={"id": "42"})
+        )
+        mock_content_generator = MagicMock()
+        mock_content_generator.agenerate_tweet = AsyncMock(
+            return_value="Mock tweet content"
+        )
+
+        manager = AsyncTwitterManager(mock_twitter_client, mock_content_generator)
+        result = asyncio.run(manager.create_tweet("Test Topic"))
+
+        assert result == {
+            "success": True,
+            "tweet_id": "42",
+            "content": "Mock tweet content",
+        }
+        mock_twitter_client.create_tweet.assert_awaited_once_with(
+            text="Mock tweet content"
+        )
+
+    def test_concurrent_tweets_do_not_block_each_other(self):
+        async def slow_create_tweet(text):
+            await asyncio.sleep(0.05)
+            return SimpleNamespace(data={"id": text})
+
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet = slow_create_tweet
+        manager = AsyncTwitterManager(mock_twitter_client, MagicMock())
+
+        async def run():
+            return await asyncio.gather(
+                *(manager.create_tweet("Test Topic", content=str(i)) for i in range(20))
+            )
+
+        started = time.monotonic()
+        results = asyncio.run(run())
+        elapsed = time.monotonic() - started
+        assert [r["tweet_id"] for r in results] == [str(i) for i in range(20)]
+        assert elapsed < 0.5
+
+    def test_api_error_is_reported(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet = AsyncMock(side_effect=Exception("boom"))
+        manager = AsyncTwitterManager(mock_twitter_client, MagicMock())
+
+        result = asyncio.run(manager.create_tweet("Test Topic", content="hi"))
+        assert result["success"] is False
+        assert "boom" in result["error"]
+
+    def test_rate_limit_retry_after_is_reported(self):
+        mock_twitter_client = MagicMock()
+        mock_twitter_client.create_tweet = AsyncMock(
+            side_effect=TwitterRateLimited("default", "POST /2/tweets", 30)
+        )
+        manager = AsyncTwitterManager(mock_twitter_client, MagicMock())
+
+        result = asyncio.run(manager.create_tweet("Test Topic", content="hi"))
+        assert result["success"] is False
+        assert result["retry_after"] == 30
+        assert "rate limit" in result["error"]
+
+    def test_only_async_methods_are_offered(self):
+        manager = AsyncTwitterManager(MagicMock(), MagicMock())
+
+        assert not isinstance(manager, TwitterManager)
+        assert not hasattr(manager, "create_thread")
+        assert not hasattr(manager, "upload_media")
@@ -0,0 +1,76 @@
+# tests/test_twitter_media.py
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from tweepy.errors import TweepyException
+
+from prodigal_automation.twitter_manager import TwitterManager
+from prodigal_automation.twitter_media import ChunkedMediaUploader
+
+
+def make_api():
+    api = MagicMock()
+    api.chunked_upload_init.return_value = SimpleNamespace(
+        media_id=77, expires_after_secs=3600
+    )
+    api.chunked_upload_finalize.return_value = SimpleNamespace(media_id=77)
+    return api
+
+
+def test_upload_sends_fixed_size_segments(tmp_path):
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"0123456789")
+    api = make_api()
+
+    uploader = ChunkedMediaUploader(api, chunk_size=4)
+    assert uploader.upload(str(video)) == "77"
+
+    api.chunked_upload_init.assert_called_once_with(
+        10, "video/mp4", media_category="tweet_video"
+    )
+    segments = [c.args for c in api.chunked_upload_append.call_args_list]
+    assert segments == [
+        ("77", ("clip.mp4", b"0123"), 0),
+        ("77", ("clip.mp4", b"4567"), 1),
+        ("77", ("clip.mp4", b"89"), 2),
+    ]
+
+
+def test_interrupted_upload_resumes_from_missing_segment(tmp_path):
+    image = tmp_path / "photo.png"
+    image.write_bytes(b"abcdefghij")
+    state_path = str(tmp_path / "uploads.json")
+    api = make_api()
+    api.chunked_upload_append.side_effect = [None, TweepyException("reset")]
+
+    uploader = ChunkedMediaUploader(
+        api, chunk_size=4, state_path=state_path, max_retries=0
+    )
+    with pytest.raises(TweepyException):
+        uploader.upload(str(image))
+
+    api.chunked_upload_append.side_effect = None
+    # A new uploader (e.g. after a crash) picks the session up from disk
+    resumed = ChunkedMediaUploader(api, chunk_size=4, state_path=state_path)
+    assert resumed.upload(str(image)) == "77"
+
+    assert api.chunked_upload_init.call_count == 1
+    indexes = [c.args[2] for c in api.chunked_upload_append.call_args_list]
+    assert indexes == [0, 1, 1, 2]
+
+
+def test_create_tweet_attaches_uploaded_media(tmp_path):
+    image = tmp_path / "photo.jpg"
+    image.write_bytes(b"jpeg")
+    client = MagicMock()
+    client.create_tweet.return_value = MagicMock(id="1")
+    generator = MagicMock()
+    generator.generate_simple_content.return_value = "With a photo"
+
+    manager = TwitterManager(
+        client, generator, media_uploader=ChunkedMediaUploader(make_api())
+    )
+    assert manager.create_tweet("Photo topic", media_paths=[str(image)]) == "1"
+    client.create_tweet.assert_called_once_with(text="With a photo", media_ids=["77"])
@@ -0,0 +1,68 @@
+# tests/test_twitter_timeline.py
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from prodigal_automation.twitter_timeline import (
+    TimelineCheckpointStore,
+    iter_new_tweets,
+    iter_user_timeline,
+)
+
+
+def make_client(pages):
+    """Client whose get_users_tweets serves `pages` (lists of ids) in order."""
+    client = MagicMock()
+
+    def get_users_tweets(**params):
+        index = int(params.get("pagination_token", 0))
+        since_id = int(params.get("since_id", 0))
+        ids = [i for i in pages[index] if i > since_id]
+        meta = {"next_token": str(index + 1)} if index + 1 < len(pages) else {}
+        return SimpleNamespace(data=[SimpleNamespace(id=i) for i in ids], meta=meta)
+
+    client.get_users_tweets.side_effect = get_users_tweets
+    return client
+
+
+def test_pages_are_fetched_lazily():
+    client = make_client([[9, 8], [7, 6], [5, 4]])
+    timeline = iter_user_timeline(client, "42", page_size=2)
+
+    assert [next(timeline).id for _ in range(3)] == [9, 8, 7]
+    assert client.get_users_tweets.call_count == 2
+
+
+def test_checkpoint_advances_after_complete_poll(tmp_path):
+    path = str(tmp_path / "checkpoints.json")
+    checkpoints = TimelineCheckpointStore(path)
+    client = make_client([[9, 8], [7]])
+
+    assert [t.id for t in iter_new_tweets(client, "t", "42", checkpoints)] == [9, 8, 7]
+    assert TimelineCheckpointStore(path).get("t", "42") == "9"
+
+    client = make_client([[11, 10, 9, 8]])
+    assert [t.id for t in iter_new_tweets(client, "t", "42", checkpoints)] == [11, 10]
+    assert client.get_users_tweets.call_args.kwargs["since_id"] == "9"
+
+
+def test_interrupted_poll_does_not_advance_checkpoint():
+    checkpoints = TimelineCheckpointStore()
+    new_tweets = iter_new_tweets(make_client([[9, 8]]), "t", "42", checkpoints)
+    next(new_tweets)
+    new_tweets.close()
+
+    assert checkpoints.get("t", "42") is None
+
+
+def test_poll_cut_short_by_max_pages_does_not_advance_checkpoint():
+    checkpoints = TimelineCheckpointStore()
+    client = make_client([[10, 9], [8, 7]])
+
+    new_tweets = iter_new_tweets(client, "t", "42", checkpoints, max_pages=1)
+    assert [t.id for t in new_tweets] == [10, 9]
+    assert checkpoints.get("t", "42") is None
+
+    new_tweets = iter_new_tweets(client, "t", "42", checkpoints)
+    assert [t.id for t in new_tweets] == [10, 9, 8, 7]
+    assert checkpoints.get("t", "42") == "10"
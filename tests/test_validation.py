@@ -0,0 +1,65 @@
+# tests/test_validation.py
+
+import pytest
+
+from prodigal_automation.tools import ContentGenerator, ContentRequest
+from prodigal_automation.validation import fit_to_limit, weighted_length
+
+
+def test_weighted_length_counts_urls_and_wide_characters():
+    url = "https://example.com/" + "a" * 100
+    assert weighted_length(f"Read {url}", "twitter") == 5 + 23
+    assert weighted_length("日本", "twitter") == 4
+    assert weighted_length("日本", "facebook") == 2
+
+
+def test_fit_to_limit_drops_hashtags_then_sentences():
+    text = "A" * 40 + ". " + "B" * 40 + ". #one #two"
+    assert fit_to_limit(text, 85) == "A" * 40 + ". " + "B" * 40 + "."
+    assert fit_to_limit(text, 89) == "A" * 40 + ". " + "B" * 40 + ". #one"
+    assert fit_to_limit(text, 60) == "A" * 40 + "."
+    assert fit_to_limit("x" * 100, 60) is None
+
+
+def test_generate_tweet_regenerates_when_trimming_is_impossible():
+    drafts = iter(["x" * 400, "A short tweet. #AI"])
+    prompts = []
+
+    class DummyResponse:
+        def __init__(self, text):
+            self.text = text
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            prompts.append(prompt)
+            return DummyResponse(next(drafts))
+
+    gen = ContentGenerator(api_key="fake_api_key")
+    gen.model = DummyModel()
+
+    assert gen.generate_tweet(ContentRequest(topic="test topic")) == (
+        "A short tweet. #AI"
+    )
+    assert "previous draft was 400 characters" in prompts[1]
+    assert gen.length_stats["regenerations"] == 1
+
+
+def test_generate_tweet_fails_after_regeneration_budget():
+    class DummyResponse:
+        text = "x" * 400
+
+    class DummyModel:
+        def generate_content(self, prompt):
+            return DummyResponse()
+
+    gen = ContentGenerator(api_key="fake_api_key", max_regenerations=1)
+    gen.model = DummyModel()
+
+    with pytest.raises(ValueError, match="exceeds 280 characters"):
+        gen.generate_tweet(ContentRequest(topic="test topic"))
+    assert gen.length_stats == {
+        "checked": 2,
+        "trimmed": 0,
+        "regenerations": 1,
+        "failures": 1,
+    }